@@ -0,0 +1,40 @@
+"""Conditional GET support: ETags derived from per-user change watermarks."""
+
+import hashlib
+from collections.abc import Hashable
+
+from fastapi import Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.watermark_repository import WatermarkRepository
+
+
+def make_etag(version: int, *parts: Hashable) -> str:
+    """Weak ETag for a user's data version plus whatever else shapes the body."""
+    digest = hashlib.blake2s(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'W/"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match evaluation with weak comparison (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+async def user_etag(
+    session: AsyncSession, request: Request, user_id: str, *parts: Hashable
+) -> tuple[str, Response | None]:
+    """
+    The ETag for a user-scoped GET and, when the client already has it, a
+    ready 304 response. One primary-key read; the endpoint's own queries
+    run only when the 304 is None. The query string is part of the tag.
+    """
+    version, last_entry_at = await WatermarkRepository(session).get(user_id)
+    etag = make_etag(version, str(user_id), last_entry_at, request.url.path, str(request.url.query), *parts)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return etag, Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return etag, None
@@ -1,25 +1,26 @@
 """FastAPI dependencies - auth, RBAC via access links."""
 
+import math
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import decode_token
-from app.db.session import get_db
+from app.core.rate_limit import auth_email_limiter, auth_ip_limiter
+from app.core.token_cache import decode_token_cached
 from app.repositories.access_link_repository import AccessLinkRepository
 
 security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user_id(
+    request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
-    session: Annotated[AsyncSession, Depends(get_db)],
 ) -> str:
     """
     Validate JWT and return user_id.
-    Single User entity - no role in token.
+    Single User entity - no role in token. Needs no DB session.
+    Also stored on request.state for logging and read routing.
     """
     if not credentials:
         raise HTTPException(
@@ -27,7 +28,7 @@ async def get_current_user_id(
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    payload = decode_token(credentials.credentials)
+    payload = decode_token_cached(credentials.credentials)
     if not payload or payload.get("type") != "access":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -40,9 +41,36 @@ async def get_current_user_id(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
         )
+    request.state.user_id = user_id
     return user_id
 
 
+def admit_auth_attempt(request: Request, email: str) -> None:
+    """
+    Admission control for bcrypt-heavy auth routes.
+    Rate limits by client IP, then by email. Raises 429 with Retry-After.
+    """
+    ip = request.client.host if request.client else "unknown"
+    retry_after = auth_ip_limiter.acquire(ip)
+    if not retry_after:
+        retry_after = auth_email_limiter.acquire(email.lower())
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many authentication attempts",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+def check_cursor_params(cursor: str | None, offset: int) -> None:
+    """Cursor and offset paging are alternatives; reject requests using both."""
+    if cursor and offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either cursor or offset, not both",
+        )
+
+
 # Type aliases for route injection
 CurrentUser = Annotated[str, Depends(get_current_user_id)]
 # For /specialist/clients - any user can call; returns empty list if no links
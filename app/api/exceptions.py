@@ -5,6 +5,10 @@ import logging
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+from app.db.query_stats import QueryBudgetExceeded
+from app.services.ingestion_queue import IngestionUnavailable
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,64 @@ async def validation_exception_handler(
     )
 
 
+async def query_budget_exception_handler(
+    request: Request, exc: QueryBudgetExceeded
+) -> JSONResponse:
+    """Requests over their SQL budget fail fast instead of holding a connection."""
+    logger.warning("Query budget exceeded on %s %s: %s", request.method, request.url.path, exc)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Request exceeded its database budget"},
+    )
+
+
+async def ingestion_unavailable_exception_handler(
+    request: Request, exc: IngestionUnavailable
+) -> JSONResponse:
+    """Ingestion queue backpressure: clients retry shortly."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
+# not_null_violation, foreign_key_violation, check_violation
+_INVALID_DATA_SQLSTATES = {"23502", "23503", "23514"}
+
+
+async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONResponse:
+    """
+    Constraint violations are client errors, not 500s. With deferred flush
+    they usually surface at the commit in get_db's teardown, after the
+    service returned, so they are mapped here: invalid references or
+    values are 400, anything else (unique violations) 409.
+    """
+    logger.warning("Integrity error on %s %s: %s", request.method, request.url.path, exc.orig)
+    if getattr(exc.orig, "sqlstate", None) in _INVALID_DATA_SQLSTATES:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": "Request references missing or invalid data"},
+        )
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": "Request conflicts with an existing record"},
+    )
+
+
+async def dbapi_exception_handler(request: Request, exc: DBAPIError) -> JSONResponse:
+    """Map statement_timeout cancellations to 503; anything else is a 500."""
+    if getattr(exc.orig, "sqlstate", None) == "57014":  # query_canceled
+        logger.warning(
+            "Statement timeout on %s %s: %s", request.method, request.url.path, exc.statement
+        )
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Database query timed out"},
+        )
+    return await generic_exception_handler(request, exc)
+
+
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle unexpected exceptions."""
     logger.exception("Unhandled exception: %s", exc)
@@ -0,0 +1,130 @@
+"""Idempotency-Key handling for create endpoints."""
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Annotated
+
+from fastapi import Header, HTTPException, Response, status
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.idempotency import (
+    IdempotencyClaim,
+    IdempotencyKeyInUse,
+    StoredResponse,
+    idempotency_cache,
+)
+from app.domain.series import as_utc
+from app.repositories.idempotency_repository import IdempotencyRepository
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+IdempotencyKeyHeader = Annotated[
+    str | None, Header(alias=IDEMPOTENCY_KEY_HEADER, min_length=1, max_length=255)
+]
+
+_PENDING = "idempotency_pending"
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_committed(session: Session) -> None:
+    """Completed responses enter the in-process cache only once durable."""
+    for cache_key, stored in session.info.pop(_PENDING, ()):
+        idempotency_cache.put(cache_key, stored)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+
+
+def _in_progress() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="A request with this Idempotency-Key is still in progress",
+    )
+
+
+def _replay(stored: StoredResponse, fingerprint: str) -> Response:
+    if stored.fingerprint != fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key was already used for a different request",
+        )
+    return Response(
+        content=stored.body,
+        status_code=stored.status_code,
+        media_type="application/json",
+        headers={REPLAYED_HEADER: "true"},
+    )
+
+
+async def run_idempotent(
+    session: AsyncSession,
+    user_id: str,
+    key: str | None,
+    fingerprint: str,
+    operation: Callable[[], Awaitable[BaseModel]],
+    status_code: int = status.HTTP_200_OK,
+    claimed: Callable[[IdempotencyClaim], Awaitable[tuple[StoredResponse, bool]]] | None = None,
+) -> BaseModel | Response:
+    """
+    Run a create operation at most once per (user, Idempotency-Key).
+
+    Repeats are answered from the in-process LRU, or from idempotency_keys
+    when another worker handled the first request, without running the
+    operation. The key is reserved and completed in the request's own
+    transaction, so a failed operation releases it and a retry runs again;
+    a concurrent duplicate waits on the reservation and then replays.
+    Without a key the operation just runs.
+
+    claimed replaces operation for writes committed outside the request
+    transaction (queued ingestion): it receives the claim and must reserve
+    and complete the key in the transaction that performs the write,
+    returning (response, replayed). The request session is not used.
+    """
+    if key is None:
+        return await operation()
+
+    cache_key = idempotency_cache.key(user_id, key)
+    stored = idempotency_cache.get(cache_key)
+    if stored is not None:
+        return _replay(stored, fingerprint)
+
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS)
+    if claimed is not None:
+        try:
+            stored, replayed = await claimed(IdempotencyClaim(user_id, key, fingerprint, expires_at))
+        except IdempotencyKeyInUse:
+            raise _in_progress() from None
+        # Committed by the writer already, so safe to cache right away
+        idempotency_cache.put(cache_key, stored)
+        if replayed:
+            return _replay(stored, fingerprint)
+        return Response(content=stored.body, status_code=stored.status_code, media_type="application/json")
+
+    repo = IdempotencyRepository(session)
+    if not await repo.reserve(user_id, key, fingerprint, expires_at):
+        row = await repo.get(user_id, key)
+        if row is None or row.status_code is None:
+            raise _in_progress()
+        stored = StoredResponse(
+            fingerprint=row.fingerprint,
+            status_code=row.status_code,
+            body=row.response_body,
+            expires_at=as_utc(row.expires_at).timestamp(),
+        )
+        idempotency_cache.put(cache_key, stored)
+        return _replay(stored, fingerprint)
+
+    result = await operation()
+    body = result.model_dump_json().encode()
+    await repo.complete(user_id, key, status_code, body)
+    session.info.setdefault(_PENDING, []).append(
+        (cache_key, StoredResponse(fingerprint, status_code, body, expires_at.timestamp()))
+    )
+    return Response(content=body, status_code=status_code, media_type="application/json")
@@ -1,33 +1,54 @@
 """Authentication routes - single User entity."""
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 
-from app.api.deps import CurrentUser
-from app.core.security import create_access_token, create_refresh_token
-from app.db.session import DbSession
-from app.domain.schemas import LoginRequest, RegisterRequest, Token, UserResponse
+from app.api.deps import CurrentUser, admit_auth_attempt
+from app.core.hashing import HashingPoolSaturated
+from app.core.token_cache import decode_token_cached
+from app.db.session import DbSession, ReadOnlyDbSession
+from app.domain.schemas import (
+    LoginRequest,
+    RefreshRequest,
+    RegisterRequest,
+    Token,
+    UserResponse,
+)
 from app.repositories.user_repository import UserRepository
+from app.services.token_service import RefreshTokenReused, TokenService
 from app.services.user_service import UserService
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _hashing_unavailable() -> HTTPException:
+    """429 returned when the in-flight hashing cap is reached."""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Authentication temporarily overloaded, retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=Token)
-async def register(data: RegisterRequest, session: DbSession):
+async def register(data: RegisterRequest, request: Request, session: DbSession):
     """Register a new user (standalone, no specialist required)."""
+    admit_auth_attempt(request, data.email)
     service = UserService(session)
     try:
         user = await service.register(data)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    access = create_access_token(user.id)
-    refresh = create_refresh_token(user.id)
-    return Token(access_token=access, refresh_token=refresh)
+    except HashingPoolSaturated:
+        raise _hashing_unavailable()
+    # The commit in get_db then pins this user's reads to the primary
+    request.state.user_id = user.id
+    return TokenService(session).issue(user.id)
 
 
 @router.post("/login", response_model=Token)
-async def login(data: LoginRequest, session: DbSession):
+async def login(data: LoginRequest, request: Request, session: DbSession):
     """Login for any user."""
+    admit_auth_attempt(request, data.email)
     service = UserService(session)
     try:
         user = await service.authenticate(data.email, data.password)
@@ -36,13 +57,32 @@ async def login(data: LoginRequest, session: DbSession):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e),
         )
-    access = create_access_token(user.id)
-    refresh = create_refresh_token(user.id)
-    return Token(access_token=access, refresh_token=refresh)
+    except HashingPoolSaturated:
+        raise _hashing_unavailable()
+    # The commit in get_db then pins this user's reads to the primary
+    request.state.user_id = user.id
+    return TokenService(session).issue(user.id)
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh(data: RefreshRequest, request: Request, session: DbSession):
+    """Exchange a refresh token for a new token pair (rotating the refresh token)."""
+    service = TokenService(session)
+    try:
+        token = await service.refresh(data.refresh_token)
+    except RefreshTokenReused as e:
+        # Persist the family revocation before the error rolls the session back
+        await session.commit()
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    # Warms the token cache for the first authenticated request as well
+    request.state.user_id = decode_token_cached(token.access_token)["sub"]
+    return token
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(current: CurrentUser, session: DbSession):
+async def get_me(current: CurrentUser, session: ReadOnlyDbSession):
     """Get current user profile."""
     repo = UserRepository(session)
     user = await repo.get_by_id(current)
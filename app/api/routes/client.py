@@ -1,21 +1,39 @@
 """Client routes - entries, summary, tasks. Usable without any links."""
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from app.api.deps import CurrentUser
-from app.db.session import DbSession
+from app.api.conditional import user_etag
+from app.api.deps import CurrentUser, check_cursor_params
+from app.api.idempotency import IdempotencyKeyHeader, run_idempotent
+from app.api.serialization import json_rows_response
+from app.core.config import settings
+from app.core.idempotency import IdempotencyClaim, StoredResponse, request_fingerprint
+from app.core.pagination import NEXT_CURSOR_HEADER, InvalidCursor
+from app.db.session import DbSession, ReadOnlyDbSession, note_write
 from app.domain.schemas import (
+    ChronoEntryBatchCreate,
+    ChronoEntryBatchResponse,
     ChronoEntryCreate,
     ChronoEntryResponse,
+    ChronoEntryRow,
+    ChronoEntryWithEvidenceResponse,
+    ChronoEntryWithEvidenceRow,
+    SeriesMethod,
     SummaryResponse,
     TaskReminderCreate,
     TaskReminderResponse,
+    TaskReminderRow,
+    TimelineInclude,
+    TimelineSeriesResponse,
 )
+from app.domain.series import as_utc
 from app.repositories.task_repository import TaskRepository
 from app.services.analytics_service import AnalyticsService
 from app.services.entry_service import EntryService
+from app.services.export_service import MEDIA_TYPES, ExportFormat, stream_user_export
 
 router = APIRouter(prefix="/entries", tags=["client"])
 summary_router = APIRouter(prefix="/summary", tags=["client"])
@@ -25,46 +43,158 @@ tasks_router = APIRouter(prefix="/tasks", tags=["client"])
 @router.post("/submit", response_model=ChronoEntryResponse)
 async def submit_entry(
     data: ChronoEntryCreate,
+    request: Request,
     current: CurrentUser,
     session: DbSession,
+    idempotency_key: IdempotencyKeyHeader = None,
 ):
-    """Submit a chrono entry."""
+    """Submit a chrono entry. Retries with the same Idempotency-Key replay the first response."""
     service = EntryService(session)
-    try:
-        return await service.submit_entry(current, data)
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+    async def submit() -> ChronoEntryResponse:
+        try:
+            return await service.submit_entry(current, data)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-@router.get("/timeline", response_model=list[ChronoEntryResponse])
-async def get_timeline(
+    async def submit_queued(claim: IdempotencyClaim) -> tuple[StoredResponse, bool]:
+        try:
+            return await service.submit_entry_claimed(current, data, claim)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    queued = settings.INGESTION_MODE == "queued"
+    response = await run_idempotent(
+        session,
+        current,
+        idempotency_key,
+        request_fingerprint("entries.submit", data),
+        submit,
+        claimed=submit_queued if queued else None,
+    )
+    if queued:
+        # Committed by the ingestion queue, not by this request's session
+        note_write(request)
+    return response
+
+
+@router.post("/submit-batch", response_model=ChronoEntryBatchResponse)
+async def submit_entries_batch(
+    data: ChronoEntryBatchCreate,
     current: CurrentUser,
     session: DbSession,
+    idempotency_key: IdempotencyKeyHeader = None,
+):
+    """Submit many chrono entries at once; per-item results in request order."""
+    service = EntryService(session)
+    return await run_idempotent(
+        session,
+        current,
+        idempotency_key,
+        request_fingerprint("entries.submit_batch", data),
+        lambda: service.submit_batch(current, data.entries),
+    )
+
+
+@router.get("/timeline", response_model=list[ChronoEntryResponse | ChronoEntryWithEvidenceResponse])
+async def get_timeline(
+    current: CurrentUser,
+    session: ReadOnlyDbSession,
+    request: Request,
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
     from_date: datetime | None = None,
     to_date: datetime | None = None,
+    cursor: str | None = Query(None, description=f"Value of the previous page's {NEXT_CURSOR_HEADER} header"),
+    include: TimelineInclude | None = Query(None, description="evidence: embed each entry's evidence"),
 ):
-    """Get timeline of chrono entries."""
+    """Get timeline of chrono entries. Next page cursor in the X-Next-Cursor header."""
+    check_cursor_params(cursor, offset)
     service = EntryService(session)
-    return await service.get_timeline(
+    etag, not_modified = await user_etag(session, request, current)
+    if not_modified:
+        return not_modified
+    try:
+        entries, next_cursor = await service.get_timeline_page(
+            user_id=current,
+            limit=limit,
+            offset=offset,
+            from_date=from_date,
+            to_date=to_date,
+            cursor=cursor,
+            include_evidence=include == "evidence",
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    headers = {"ETag": etag}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    row_type = ChronoEntryWithEvidenceRow if include == "evidence" else ChronoEntryRow
+    return json_rows_response(row_type, entries, headers)
+
+
+@router.get("/timeline/series", response_model=TimelineSeriesResponse)
+async def get_timeline_series(
+    current: CurrentUser,
+    session: ReadOnlyDbSession,
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+    points: int = Query(200, ge=3, le=2000),
+    method: SeriesMethod = Query("buckets"),
+    metric_id: list[str] | None = Query(None, description="Limit to these metrics (repeatable)"),
+):
+    """Numeric metric series downsampled for charting. Defaults to the last 90 days."""
+    to_date = as_utc(to_date) if to_date else datetime.now(timezone.utc)
+    from_date = as_utc(from_date) if from_date else to_date - timedelta(days=90)
+    if from_date >= to_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="from_date must be before to_date",
+        )
+    service = AnalyticsService(session)
+    return await service.get_series(
         user_id=current,
-        limit=limit,
-        offset=offset,
         from_date=from_date,
         to_date=to_date,
+        points=points,
+        method=method,
+        metric_ids=metric_id,
+    )
+
+
+@router.get("/export")
+async def export_timeline(
+    current: CurrentUser,
+    format: ExportFormat = Query("ndjson"),
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+):
+    """Stream the whole timeline (oldest first) as NDJSON or CSV."""
+    return StreamingResponse(
+        stream_user_export(current, current, format, from_date, to_date),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="timeline.{format}"'},
     )
 
 
 @summary_router.get("", response_model=SummaryResponse)
 async def get_summary(
     current: CurrentUser,
-    session: DbSession,
+    session: ReadOnlyDbSession,
+    request: Request,
+    response: Response,
     period_days: int = Query(7, ge=1, le=365),
 ):
-    """Get wellness summary (stub)."""
+    """Get wellness summary (per-metric aggregates)."""
+    period_start = AnalyticsService.summary_start(period_days)
+    etag, not_modified = await user_etag(session, request, current, period_start)
+    if not_modified:
+        return not_modified
+    response.headers["ETag"] = etag
     service = AnalyticsService(session)
-    return await service.get_summary(user_id=current, period_days=period_days)
+    return await service.get_summary(
+        user_id=current, period_days=period_days, period_start=period_start
+    )
 
 
 @tasks_router.post("", response_model=TaskReminderResponse)
@@ -72,29 +202,36 @@ async def create_task(
     data: TaskReminderCreate,
     current: CurrentUser,
     session: DbSession,
+    idempotency_key: IdempotencyKeyHeader = None,
 ):
-    """Create a task reminder."""
+    """Create a task reminder. Retries with the same Idempotency-Key replay the first response."""
     repo = TaskRepository(session)
-    task = await repo.create(
-        user_id=current,
-        description=data.description,
-        due_date=data.due_date,
-        auto_generated=data.auto_generated,
+
+    async def create() -> TaskReminderResponse:
+        task = await repo.create(
+            user_id=current,
+            description=data.description,
+            due_date=data.due_date,
+            auto_generated=data.auto_generated,
+        )
+        return TaskReminderResponse.model_validate(task)
+
+    return await run_idempotent(
+        session, current, idempotency_key, request_fingerprint("tasks.create", data), create
     )
-    return TaskReminderResponse.model_validate(task)
 
 
 @tasks_router.get("", response_model=list[TaskReminderResponse])
 async def get_tasks(
     current: CurrentUser,
-    session: DbSession,
+    session: ReadOnlyDbSession,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
     status: str | None = None,
 ):
     """Get user's task reminders."""
     repo = TaskRepository(session)
-    tasks = await repo.get_by_user(
+    tasks = await repo.get_rows_by_user(
         user_id=current, limit=limit, offset=offset, status=status
     )
-    return [TaskReminderResponse.model_validate(t) for t in tasks]
+    return json_rows_response(TaskReminderRow, tasks)
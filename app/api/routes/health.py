@@ -1,11 +1,21 @@
 """Health check route."""
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from traceback import format_exc
 
-from app.db.session import get_db
+from app.core.hashing import get_password_hasher
+from app.core.idempotency import idempotency_cache
+from app.core.rate_limit import auth_email_limiter, auth_ip_limiter
+from app.core.token_cache import token_cache
+from app.db.pool import get_pool_stats
+from app.db.session import engine, get_db, replica_engines
+from app.services.ingestion_queue import ingestion_queue
+from app.services.metric_catalog import metric_catalog
+from app.services.token_service import refresh_metrics
+from app.warmup import readiness
 from fastapi import Depends
 
 from app.llm.base import LLMRequest, ChatMessage, OutModel
@@ -28,6 +38,33 @@ async def health_check(session=Depends(get_db)):
         "database": db_status,
     }
 
+
+@router.get("/ready")
+async def ready():
+    """Readiness probe - 503 until start-up warm-up has finished."""
+    if not readiness.ready:
+        return JSONResponse(status_code=503, content={"status": "warming_up", **readiness.snapshot()})
+    return {"status": "ready", **readiness.snapshot()}
+
+
+@router.get("/metrics")
+async def metrics():
+    """In-process runtime metrics (pools, caches) for scraping."""
+    return {
+        "db_pool": get_pool_stats(engine),
+        "db_replica_pools": [get_pool_stats(e) for e in replica_engines],
+        "password_hasher": get_password_hasher().stats(),
+        "token_cache": token_cache.stats(),
+        "refresh_tokens": refresh_metrics.snapshot(),
+        "metric_catalog": metric_catalog.stats(),
+        "idempotency_cache": idempotency_cache.stats(),
+        "ingestion": ingestion_queue.stats(),
+        "auth_rate_limit": {
+            "ip": auth_ip_limiter.stats(),
+            "email": auth_email_limiter.stats(),
+        },
+    }
+
 @router.post("/integrations_test")
 async def integrations_test(user_message: str):
     try:
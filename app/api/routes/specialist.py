@@ -2,16 +2,30 @@
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from app.api.deps import CurrentSpecialist, CurrentUser
-from app.db.session import DbSession
-from app.domain.schemas import ChronoEntryResponse, SummaryResponse, UserResponse
+from app.api.conditional import user_etag
+from app.api.deps import CurrentSpecialist, CurrentUser, check_cursor_params
+from app.api.serialization import json_rows_response
+from app.core.pagination import NEXT_CURSOR_HEADER, InvalidCursor
+from app.db.session import ReadOnlyDbSession
+from app.domain.schemas import (
+    ChronoEntryResponse,
+    ChronoEntryRow,
+    ChronoEntryWithEvidenceResponse,
+    ChronoEntryWithEvidenceRow,
+    SummaryResponse,
+    TimelineInclude,
+    UserResponse,
+    UserRow,
+)
 from app.repositories.access_link_repository import AccessLinkRepository
-from app.repositories.entry_repository import EntryRepository
 from app.repositories.specialist_repository import SpecialistRepository
 from app.repositories.user_repository import UserRepository
 from app.services.analytics_service import AnalyticsService
+from app.services.entry_service import EntryService
+from app.services.export_service import MEDIA_TYPES, ExportFormat, stream_user_export
 
 router = APIRouter(prefix="/specialist", tags=["specialist"])
 
@@ -19,48 +33,88 @@ router = APIRouter(prefix="/specialist", tags=["specialist"])
 @router.get("/clients", response_model=list[UserResponse])
 async def get_clients(
     current: CurrentSpecialist,
-    session: DbSession,
+    session: ReadOnlyDbSession,
 ):
     """Get all clients linked to the current user (from user_access_links). Returns [] if none."""
     specialist_id = current
     repo = SpecialistRepository(session)
-    clients = await repo.get_specialist_clients(specialist_id)
-    return [UserResponse.model_validate(c) for c in clients]
+    clients = await repo.get_specialist_client_rows(specialist_id)
+    return json_rows_response(UserRow, clients)
 
 
-@router.get("/{client_id}/timeline", response_model=list[ChronoEntryResponse])
+@router.get("/{client_id}/timeline", response_model=list[ChronoEntryResponse | ChronoEntryWithEvidenceResponse])
 async def get_client_timeline(
     client_id: str,
     current: CurrentUser,
-    session: DbSession,
+    session: ReadOnlyDbSession,
+    request: Request,
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
     from_date: datetime | None = None,
     to_date: datetime | None = None,
+    cursor: str | None = Query(None, description=f"Value of the previous page's {NEXT_CURSOR_HEADER} header"),
+    include: TimelineInclude | None = Query(None, description="evidence: embed each entry's evidence"),
 ):
     """Get timeline for a client. Requires active access link."""
+    check_cursor_params(cursor, offset)
     access_repo = AccessLinkRepository(session)
     if not await access_repo.has_specialist_access(current, client_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Client not found or access denied",
         )
-    entry_repo = EntryRepository(session)
-    entries = await entry_repo.get_timeline(
-        user_id=client_id,
-        limit=limit,
-        offset=offset,
-        from_date=from_date,
-        to_date=to_date,
+    etag, not_modified = await user_etag(session, request, client_id)
+    if not_modified:
+        return not_modified
+    try:
+        entries, next_cursor = await EntryService(session).get_timeline_page(
+            user_id=client_id,
+            limit=limit,
+            offset=offset,
+            from_date=from_date,
+            to_date=to_date,
+            cursor=cursor,
+            include_evidence=include == "evidence",
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    headers = {"ETag": etag}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    row_type = ChronoEntryWithEvidenceRow if include == "evidence" else ChronoEntryRow
+    return json_rows_response(row_type, entries, headers)
+
+
+@router.get("/{client_id}/export")
+async def export_client_timeline(
+    client_id: str,
+    current: CurrentUser,
+    session: ReadOnlyDbSession,
+    format: ExportFormat = Query("ndjson"),
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+):
+    """Stream a client's whole timeline as NDJSON or CSV. Requires active access link."""
+    access_repo = AccessLinkRepository(session)
+    if not await access_repo.has_specialist_access(current, client_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found or access denied",
+        )
+    return StreamingResponse(
+        stream_user_export(current, client_id, format, from_date, to_date),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="timeline-{client_id}.{format}"'},
     )
-    return [ChronoEntryResponse.model_validate(e) for e in entries]
 
 
 @router.get("/{client_id}/summary", response_model=SummaryResponse)
 async def get_client_summary(
     client_id: str,
     current: CurrentUser,
-    session: DbSession,
+    session: ReadOnlyDbSession,
+    request: Request,
+    response: Response,
     period_days: int = Query(7, ge=1, le=365),
 ):
     """Get wellness summary for a client. Requires active access link."""
@@ -70,5 +124,12 @@ async def get_client_summary(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Client not found or access denied",
         )
+    period_start = AnalyticsService.summary_start(period_days)
+    etag, not_modified = await user_etag(session, request, client_id, period_start)
+    if not_modified:
+        return not_modified
+    response.headers["ETag"] = etag
     service = AnalyticsService(session)
-    return await service.get_summary(user_id=client_id, period_days=period_days)
+    return await service.get_summary(
+        user_id=client_id, period_days=period_days, period_start=period_start
+    )
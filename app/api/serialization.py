@@ -0,0 +1,33 @@
+"""JSON fast path for list endpoints: column rows serialized by pydantic-core."""
+
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache
+def list_adapter(row_type: type) -> TypeAdapter:
+    """Cached TypeAdapter for list[row_type]; building one compiles a serializer."""
+    return TypeAdapter(list[row_type])
+
+
+def json_rows_response(
+    row_type: type,
+    rows: Sequence[Mapping[str, Any]],
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """
+    Serialize rows in one pydantic-core pass and return the bytes directly.
+
+    Returning a Response makes FastAPI skip response_model validation and
+    serialization; response_model stays on the route for the OpenAPI schema.
+    Rows are trusted database output and are not validated.
+    """
+    return Response(
+        content=list_adapter(row_type).dump_json(rows),
+        media_type="application/json",
+        headers=headers,
+    )
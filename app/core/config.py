@@ -30,6 +30,12 @@ class Settings(BaseSettings):
         default="INFO",
         validation_alias=AliasChoices("LOG_LEVEL", "log_level"),
     )
+    # Warn when one statement shape runs more than this many times per request (0 = off)
+    SQL_REPEAT_WARN_THRESHOLD: int = Field(
+        default=10,
+        ge=0,
+        validation_alias=AliasChoices("SQL_REPEAT_WARN_THRESHOLD", "sql_repeat_warn_threshold"),
+    )
 
     API_V1_PREFIX: str = Field(
         default="/api/v1",
@@ -48,6 +54,11 @@ class Settings(BaseSettings):
         default="HS256",
         validation_alias=AliasChoices("JWT_ALGORITHM", "jwt_algorithm"),
     )
+    # auto = lean HS256 codec when JWT_ALGORITHM is HS256, python-jose otherwise
+    JWT_CODEC: Literal["auto", "jose", "hs256"] = Field(
+        default="auto",
+        validation_alias=AliasChoices("JWT_CODEC", "jwt_codec"),
+    )
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(
         default=30,
         ge=1,
@@ -58,6 +69,101 @@ class Settings(BaseSettings):
         ge=1,
         validation_alias=AliasChoices("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "jwt_refresh_token_expire_days"),
     )
+    # Where consumed refresh tokens / revoked families are tracked.
+    # "memory" is per-process; use "database" with more than one worker.
+    REFRESH_TOKEN_STORE: Literal["memory", "database"] = Field(
+        default="database",
+        validation_alias=AliasChoices("REFRESH_TOKEN_STORE", "refresh_token_store"),
+    )
+    # Verified-token LRU size; 0 disables the cache
+    TOKEN_CACHE_MAX_SIZE: int = Field(
+        default=10_000,
+        ge=0,
+        validation_alias=AliasChoices("TOKEN_CACHE_MAX_SIZE", "token_cache_max_size"),
+    )
+
+    # =========================
+    # Password hashing
+    # =========================
+    # Hashing processes per app worker; 0 = CPU cores / WEB_CONCURRENCY
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        validation_alias=AliasChoices("PASSWORD_HASH_WORKERS", "password_hash_workers"),
+    )
+    # App worker processes on this host (uvicorn --workers reads the same variable)
+    WEB_CONCURRENCY: int = Field(
+        default=1,
+        ge=1,
+        validation_alias=AliasChoices("WEB_CONCURRENCY", "web_concurrency"),
+    )
+    # bcrypt cost used until (or instead of) startup calibration
+    BCRYPT_ROUNDS: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        validation_alias=AliasChoices("BCRYPT_ROUNDS", "bcrypt_rounds"),
+    )
+    # Startup calibration: highest cost in [MIN, MAX] hashing within TARGET_MS
+    BCRYPT_CALIBRATE_ON_STARTUP: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("BCRYPT_CALIBRATE_ON_STARTUP", "bcrypt_calibrate_on_startup"),
+    )
+    # Workers with the same id share one stored calibration; change it (e.g. to
+    # the release tag) to recalibrate after moving to different hardware
+    BCRYPT_CALIBRATION_ID: str = Field(
+        default="default",
+        min_length=1,
+        validation_alias=AliasChoices("BCRYPT_CALIBRATION_ID", "bcrypt_calibration_id"),
+    )
+    BCRYPT_TARGET_MS: float = Field(
+        default=250.0,
+        gt=0,
+        validation_alias=AliasChoices("BCRYPT_TARGET_MS", "bcrypt_target_ms"),
+    )
+    BCRYPT_MIN_ROUNDS: int = Field(
+        default=10,
+        ge=4,
+        le=31,
+        validation_alias=AliasChoices("BCRYPT_MIN_ROUNDS", "bcrypt_min_rounds"),
+    )
+    BCRYPT_MAX_ROUNDS: int = Field(
+        default=14,
+        ge=4,
+        le=31,
+        validation_alias=AliasChoices("BCRYPT_MAX_ROUNDS", "bcrypt_max_rounds"),
+    )
+    # In-flight cap on hashing work per app worker; 0 = 2 x hashing workers
+    PASSWORD_HASH_MAX_PENDING: int = Field(
+        default=0,
+        ge=0,
+        validation_alias=AliasChoices("PASSWORD_HASH_MAX_PENDING", "password_hash_max_pending"),
+    )
+
+    # =========================
+    # Auth admission control
+    # =========================
+    # Token buckets for /auth/login and /auth/register; 0 per minute disables
+    AUTH_RATE_LIMIT_IP_PER_MINUTE: int = Field(
+        default=30,
+        ge=0,
+        validation_alias=AliasChoices("AUTH_RATE_LIMIT_IP_PER_MINUTE", "auth_rate_limit_ip_per_minute"),
+    )
+    AUTH_RATE_LIMIT_IP_BURST: int = Field(
+        default=10,
+        ge=1,
+        validation_alias=AliasChoices("AUTH_RATE_LIMIT_IP_BURST", "auth_rate_limit_ip_burst"),
+    )
+    AUTH_RATE_LIMIT_EMAIL_PER_MINUTE: int = Field(
+        default=10,
+        ge=0,
+        validation_alias=AliasChoices("AUTH_RATE_LIMIT_EMAIL_PER_MINUTE", "auth_rate_limit_email_per_minute"),
+    )
+    AUTH_RATE_LIMIT_EMAIL_BURST: int = Field(
+        default=5,
+        ge=1,
+        validation_alias=AliasChoices("AUTH_RATE_LIMIT_EMAIL_BURST", "auth_rate_limit_email_burst"),
+    )
 
     # =========================
     # Database
@@ -70,6 +176,205 @@ class Settings(BaseSettings):
         default=False,
         validation_alias=AliasChoices("DATABASE_ECHO", "database_echo"),
     )
+    # Per-worker pool: at most POOL_SIZE + MAX_OVERFLOW connections.
+    # Size workers so that workers x (POOL_SIZE + MAX_OVERFLOW) < max_connections.
+    DATABASE_POOL_SIZE: int = Field(
+        default=10,
+        ge=1,
+        validation_alias=AliasChoices("DATABASE_POOL_SIZE", "database_pool_size"),
+    )
+    DATABASE_MAX_OVERFLOW: int = Field(
+        default=10,
+        ge=0,
+        validation_alias=AliasChoices("DATABASE_MAX_OVERFLOW", "database_max_overflow"),
+    )
+    DATABASE_POOL_TIMEOUT: float = Field(
+        default=30.0,
+        gt=0,
+        validation_alias=AliasChoices("DATABASE_POOL_TIMEOUT", "database_pool_timeout"),
+    )
+    DATABASE_POOL_PRE_PING: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("DATABASE_POOL_PRE_PING", "database_pool_pre_ping"),
+    )
+    # Seconds; -1 disables recycling
+    DATABASE_POOL_RECYCLE: int = Field(
+        default=1800,
+        ge=-1,
+        validation_alias=AliasChoices("DATABASE_POOL_RECYCLE", "database_pool_recycle"),
+    )
+    # asyncpg prepared statement cache per connection
+    DATABASE_STATEMENT_CACHE_SIZE: int = Field(
+        default=100,
+        ge=0,
+        validation_alias=AliasChoices("DATABASE_STATEMENT_CACHE_SIZE", "database_statement_cache_size"),
+    )
+    # Read replicas for ReadOnlyDbSession (JSON list of URLs in env)
+    DATABASE_REPLICA_URLS: List[str] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices("DATABASE_REPLICA_URLS", "database_replica_urls"),
+    )
+    # After a write, the user's reads stay on the primary this long
+    DATABASE_REPLICA_STICKY_SECONDS: float = Field(
+        default=5.0,
+        ge=0,
+        validation_alias=AliasChoices("DATABASE_REPLICA_STICKY_SECONDS", "database_replica_sticky_seconds"),
+    )
+    # PgBouncer (transaction pooling) mode: no server-side prepared statements
+    DATABASE_PGBOUNCER: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("DATABASE_PGBOUNCER", "database_pgbouncer"),
+    )
+    # Per-route-class statement_timeout (SET LOCAL, PostgreSQL only; 0 = server default)
+    DATABASE_STATEMENT_TIMEOUT_READ_MS: int = Field(
+        default=5_000,
+        ge=0,
+        validation_alias=AliasChoices("DATABASE_STATEMENT_TIMEOUT_READ_MS", "database_statement_timeout_read_ms"),
+    )
+    DATABASE_STATEMENT_TIMEOUT_WRITE_MS: int = Field(
+        default=10_000,
+        ge=0,
+        validation_alias=AliasChoices("DATABASE_STATEMENT_TIMEOUT_WRITE_MS", "database_statement_timeout_write_ms"),
+    )
+    DATABASE_STATEMENT_TIMEOUT_EXPORT_MS: int = Field(
+        default=120_000,
+        ge=0,
+        validation_alias=AliasChoices("DATABASE_STATEMENT_TIMEOUT_EXPORT_MS", "database_statement_timeout_export_ms"),
+    )
+    # Per-request query budget; over-budget statements fail with 503 (0 = unlimited)
+    DATABASE_REQUEST_MAX_STATEMENTS: int = Field(
+        default=200,
+        ge=0,
+        validation_alias=AliasChoices("DATABASE_REQUEST_MAX_STATEMENTS", "database_request_max_statements"),
+    )
+    DATABASE_REQUEST_MAX_DB_TIME_MS: int = Field(
+        default=15_000,
+        ge=0,
+        validation_alias=AliasChoices("DATABASE_REQUEST_MAX_DB_TIME_MS", "database_request_max_db_time_ms"),
+    )
+    # Repositories queue writes and flush once per transaction (batched inserts);
+    # constraint errors then surface at commit and are mapped to 400/409
+    DATABASE_DEFERRED_FLUSH: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("DATABASE_DEFERRED_FLUSH", "database_deferred_flush"),
+    )
+
+    # chrono_entries monthly partitions: created this many months ahead; older
+    # than the retention window are detached (0 = keep attached forever)
+    PARTITION_MONTHS_AHEAD: int = Field(
+        default=3,
+        ge=0,
+        validation_alias=AliasChoices("PARTITION_MONTHS_AHEAD", "partition_months_ahead"),
+    )
+    PARTITION_RETENTION_MONTHS: int = Field(
+        default=0,
+        ge=0,
+        validation_alias=AliasChoices("PARTITION_RETENTION_MONTHS", "partition_retention_months"),
+    )
+
+    # =========================
+    # Entries
+    # =========================
+    ENTRY_BATCH_MAX_SIZE: int = Field(
+        default=500,
+        ge=1,
+        validation_alias=AliasChoices("ENTRY_BATCH_MAX_SIZE", "entry_batch_max_size"),
+    )
+    # Maximum evidence snippets per entry
+    ENTRY_EVIDENCE_MAX_ITEMS: int = Field(
+        default=50,
+        ge=1,
+        validation_alias=AliasChoices("ENTRY_EVIDENCE_MAX_ITEMS", "entry_evidence_max_items"),
+    )
+    # Metric definitions are served from memory and reloaded this often (0 = never)
+    METRIC_CATALOG_TTL_SECONDS: float = Field(
+        default=300.0,
+        ge=0,
+        validation_alias=AliasChoices("METRIC_CATALOG_TTL_SECONDS", "metric_catalog_ttl_seconds"),
+    )
+    # Unknown metric ids are answered from memory for this long (0 = always ask the DB)
+    METRIC_CATALOG_NEGATIVE_TTL_SECONDS: float = Field(
+        default=5.0,
+        ge=0,
+        validation_alias=AliasChoices("METRIC_CATALOG_NEGATIVE_TTL_SECONDS", "metric_catalog_negative_ttl_seconds"),
+    )
+
+    # =========================
+    # Ingestion
+    # =========================
+    # "queued": /entries/submit hands entries to an in-process write-behind
+    # queue flushed in batches; the request returns once its batch committed
+    INGESTION_MODE: Literal["direct", "queued"] = Field(
+        default="direct",
+        validation_alias=AliasChoices("INGESTION_MODE", "ingestion_mode"),
+    )
+    INGESTION_QUEUE_MAX_SIZE: int = Field(
+        default=10_000,
+        ge=1,
+        validation_alias=AliasChoices("INGESTION_QUEUE_MAX_SIZE", "ingestion_queue_max_size"),
+    )
+    INGESTION_BATCH_MAX_ROWS: int = Field(
+        default=500,
+        ge=1,
+        validation_alias=AliasChoices("INGESTION_BATCH_MAX_ROWS", "ingestion_batch_max_rows"),
+    )
+    INGESTION_FLUSH_INTERVAL_MS: float = Field(
+        default=5.0,
+        ge=0,
+        validation_alias=AliasChoices("INGESTION_FLUSH_INTERVAL_MS", "ingestion_flush_interval_ms"),
+    )
+    # How long a submit waits for queue space before failing with 503
+    INGESTION_ENQUEUE_TIMEOUT_MS: float = Field(
+        default=100.0,
+        ge=0,
+        validation_alias=AliasChoices("INGESTION_ENQUEUE_TIMEOUT_MS", "ingestion_enqueue_timeout_ms"),
+    )
+
+    # =========================
+    # Idempotency keys
+    # =========================
+    # How long a completed Idempotency-Key response is replayed
+    IDEMPOTENCY_TTL_SECONDS: int = Field(
+        default=86_400,
+        ge=1,
+        validation_alias=AliasChoices("IDEMPOTENCY_TTL_SECONDS", "idempotency_ttl_seconds"),
+    )
+    # In-process LRU of completed responses in front of the table; 0 disables it
+    IDEMPOTENCY_CACHE_MAX_SIZE: int = Field(
+        default=10_000,
+        ge=0,
+        validation_alias=AliasChoices("IDEMPOTENCY_CACHE_MAX_SIZE", "idempotency_cache_max_size"),
+    )
+
+    # =========================
+    # Startup warm-up
+    # =========================
+    WARMUP_ENABLED: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("WARMUP_ENABLED", "warmup_enabled"),
+    )
+    # Pool connections opened before serving (capped at DATABASE_POOL_SIZE)
+    WARMUP_DB_CONNECTIONS: int = Field(
+        default=5,
+        ge=0,
+        validation_alias=AliasChoices("WARMUP_DB_CONNECTIONS", "warmup_db_connections"),
+    )
+    WARMUP_TIMEOUT_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        validation_alias=AliasChoices("WARMUP_TIMEOUT_SECONDS", "warmup_timeout_seconds"),
+    )
+    # Report ready even if a warm-up step failed or the phase timed out
+    WARMUP_FAIL_OPEN: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("WARMUP_FAIL_OPEN", "warmup_fail_open"),
+    )
+    # Failed warm-up steps are retried in the background, backing off up to this
+    WARMUP_RETRY_MAX_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        validation_alias=AliasChoices("WARMUP_RETRY_MAX_SECONDS", "warmup_retry_max_seconds"),
+    )
 
     # =========================
     # Clinic / Invites
@@ -103,16 +408,16 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("SECURITY_VECTOR_STORE_IDS", "security_vector_store_ids"),
     )
 
-    @field_validator("SECURITY_VECTOR_STORE_IDS", mode="before")
+    @field_validator("SECURITY_VECTOR_STORE_IDS", "DATABASE_REPLICA_URLS", mode="before")
     @classmethod
-    def parse_vector_store_ids(cls, value):
+    def parse_comma_separated(cls, value, info):
         if value is None or value == "":
             return []
         if isinstance(value, list):
             return value
         if isinstance(value, str):
             return [item.strip() for item in value.split(",") if item.strip()]
-        raise ValueError("Invalid SECURITY_VECTOR_STORE_IDS format")
+        raise ValueError(f"Invalid {info.field_name} format")
 
     @field_validator("OPENAI_API_KEY")
     @classmethod
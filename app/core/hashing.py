@@ -0,0 +1,194 @@
+"""Async password hashing on a bounded process pool."""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+from app.core.config import settings
+from app.core.security import (
+    get_bcrypt_rounds,
+    get_password_hash,
+    verify_password,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HashingPoolSaturated(RuntimeError):
+    """Raised when the hashing queue is full and new work is rejected."""
+
+
+class PasswordHasher:
+    """
+    Runs passlib work in worker processes so bcrypt never blocks the event loop.
+
+    At most ``max_pending`` jobs (running + queued) are accepted at once;
+    beyond that callers get HashingPoolSaturated instead of an ever-growing
+    queue that delays every login behind it.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the pool on first use (spawn: safe with threads in the parent)."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        """Drop a broken pool so the next job starts fresh workers."""
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a picklable function in the pool. Raises HashingPoolSaturated when full."""
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            logger.warning(
+                "Password hashing pool saturated: %d pending (max %d)",
+                self._pending,
+                self.max_pending,
+            )
+            raise HashingPoolSaturated("Password hashing capacity exhausted")
+        self._pending += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+        loop = asyncio.get_running_loop()
+        try:
+            executor = self._get_executor()
+            try:
+                result = await loop.run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                # A worker died (OOM kill, crash): rebuild once, hashing is safe to repeat
+                logger.warning("Password hashing pool broken; restarting workers")
+                self._discard_executor(executor)
+                result = await loop.run_in_executor(self._get_executor(), fn, *args)
+        except BaseException:
+            self._failed += 1
+            raise
+        finally:
+            self._pending -= 1
+        self._completed += 1
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Pool usage snapshot for metrics."""
+        return {
+            "workers": self.workers,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "saturation": round(self._pending / self.max_pending, 3),
+            "peak_pending": self._peak_pending,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self) -> None:
+        """Stop worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_hasher: PasswordHasher | None = None
+
+
+def default_hash_workers(cpu_count: int, app_workers: int) -> int:
+    """Hashing processes per app worker so that all app workers together use about one per core."""
+    return max(1, cpu_count // max(1, app_workers))
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return the process-wide hasher, configured from settings."""
+    global _hasher
+    if _hasher is None:
+        workers = settings.PASSWORD_HASH_WORKERS or default_hash_workers(
+            os.cpu_count() or 1, settings.WEB_CONCURRENCY
+        )
+        _hasher = PasswordHasher(
+            workers=workers,
+            max_pending=settings.PASSWORD_HASH_MAX_PENDING or 2 * workers,
+        )
+    return _hasher
+
+
+def shutdown_password_hasher() -> None:
+    """Shut down the process-wide hasher (app shutdown)."""
+    global _hasher
+    if _hasher is not None:
+        _hasher.shutdown()
+        _hasher = None
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    # Cost is passed explicitly: workers do not see the parent's calibration
+    return await get_password_hasher().run(
+        get_password_hash, password, get_bcrypt_rounds()
+    )
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    """Verify a password without blocking the event loop."""
+    return await get_password_hasher().run(verify_password, plain, hashed)
+
+
+def _measure_hash_ms(rounds: int) -> float:
+    """Wall time of one bcrypt hash at the given cost."""
+    start = time.perf_counter()
+    get_password_hash("calibration-probe", rounds)
+    return (time.perf_counter() - start) * 1000
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int,
+    max_rounds: int,
+    measure: Callable[[int], float] = _measure_hash_ms,
+) -> int:
+    """
+    Highest bcrypt cost in [min_rounds, max_rounds] whose hash time is within
+    target_ms. Each extra round doubles the time, so the cost is estimated
+    from one probe at min_rounds and then confirmed (stepping down if over).
+    """
+    base_ms = min(measure(min_rounds) for _ in range(2))
+    rounds = min_rounds
+    while rounds < max_rounds and base_ms * 2 ** (rounds + 1 - min_rounds) <= target_ms:
+        rounds += 1
+    while rounds > min_rounds and measure(rounds) > target_ms:
+        rounds -= 1
+    return rounds
+
+
+async def measure_password_cost() -> int:
+    """
+    Calibrate bcrypt cost on a pool worker (the hardware that will do the
+    hashing). Only measures; app.services.password_calibration shares the
+    result across workers and applies it.
+    """
+    return await get_password_hasher().run(
+        calibrate_bcrypt_rounds,
+        settings.BCRYPT_TARGET_MS,
+        settings.BCRYPT_MIN_ROUNDS,
+        settings.BCRYPT_MAX_ROUNDS,
+    )
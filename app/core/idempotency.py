@@ -0,0 +1,97 @@
+"""In-process cache of completed Idempotency-Key responses."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+
+def request_fingerprint(scope: str, payload: BaseModel) -> str:
+    """Digest of the operation and its validated body; a reused key must match it."""
+    return hashlib.sha256(f"{scope}\n{payload.model_dump_json()}".encode()).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    """A completed response, replayed for repeats of the same key."""
+
+    fingerprint: str
+    status_code: int
+    body: bytes
+    expires_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyClaim:
+    """A key to reserve and complete in the transaction that performs the write."""
+
+    user_id: str
+    key: str
+    fingerprint: str
+    expires_at: datetime
+
+
+class IdempotencyKeyInUse(RuntimeError):
+    """The key is reserved by a request that has not completed yet."""
+
+
+class IdempotencyCache:
+    """
+    LRU of completed responses keyed by (user, Idempotency-Key). Entries
+    are put only after the transaction that produced them committed, and
+    expire with their table row, so a hit is always a durable response.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, StoredResponse] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(user_id: str, idempotency_key: str) -> str:
+        return f"{user_id}:{idempotency_key}"
+
+    def get(self, key: str) -> StoredResponse | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.time():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: StoredResponse) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+idempotency_cache = IdempotencyCache(max_size=settings.IDEMPOTENCY_CACHE_MAX_SIZE)
@@ -2,10 +2,13 @@
 
 import logging
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from app.core.config import get_settings, settings
 
+if TYPE_CHECKING:
+    from app.db.query_stats import QueryStats
+
 
 def setup_logging() -> None:
     """Configure application logging."""
@@ -32,8 +35,9 @@ def log_request(
     status_code: int,
     duration_ms: float,
     user_id: str | None = None,
+    db: "QueryStats | None" = None,
 ) -> None:
-    """Log API request for middleware."""
+    """Log API request for middleware, with its SQL activity when collected."""
     extra: dict[str, Any] = {
         "method": method,
         "path": path,
@@ -42,7 +46,17 @@ def log_request(
     }
     if user_id:
         extra["user_id"] = user_id
-    logging.getLogger("api.requests").info(
-        f"{method} {path} -> {status_code} ({duration_ms:.2f}ms)",
-        extra=extra,
-    )
+    message = f"{method} {path} -> {status_code} ({duration_ms:.2f}ms)"
+    if db is not None:
+        extra["db_statements"] = db.statements
+        extra["db_time_ms"] = round(db.db_time_ms, 2)
+        extra["db_rows"] = db.rows
+        message += f" [sql: {db.statements} stmts, {db.db_time_ms:.2f}ms, {db.rows} rows]"
+    logging.getLogger("api.requests").info(message, extra=extra)
+
+    if db is not None:
+        for shape, count in db.repeated(settings.SQL_REPEAT_WARN_THRESHOLD):
+            logging.getLogger("api.queries").warning(
+                f"Possible N+1 in {method} {path}: statement ran {count} times: {shape[:500]}",
+                extra={"method": method, "path": path, "count": count, "statement": shape},
+            )
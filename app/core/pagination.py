@@ -0,0 +1,48 @@
+"""Opaque keyset cursors for (created_at, id) ordered listings."""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import UUID
+
+# List endpoints keep their JSON array body and return the next page's cursor here
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursor(ValueError):
+    """Cursor string was not produced by this API."""
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    """Position after the last row of a page, newest-first by (created_at, id)."""
+
+    created_at: datetime
+    id: str
+
+    def encode(self) -> str:
+        created_at = self.created_at
+        if created_at.tzinfo is None:
+            # Naive values are UTC, as stored
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        raw = f"{created_at.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> "KeysetCursor":
+        """
+        Parse a cursor from encode(). Anything else, including a row id that
+        is not a UUID or a timestamp without a UTC offset, is InvalidCursor
+        (a 400), never a database error.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            created_at, row_id = raw.split("|", 1)
+            UUID(row_id)
+            moment = datetime.fromisoformat(created_at)
+            if moment.tzinfo is None:
+                raise ValueError("cursor timestamp has no UTC offset")
+            return cls(created_at=moment, id=row_id)
+        except (ValueError, binascii.Error, UnicodeDecodeError) as e:
+            raise InvalidCursor("Invalid cursor") from e
@@ -0,0 +1,80 @@
+"""Sharded token-bucket rate limiting for expensive endpoints."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from app.core.config import settings
+
+
+class ShardedTokenBucketLimiter:
+    """
+    Per-key token buckets (``rate`` tokens/second, up to ``burst``).
+
+    Keys are spread over independent LRU shards, each capped at
+    ``max_keys_per_shard``, so a flood of distinct keys (e.g. random emails)
+    only evicts idle buckets instead of growing memory without bound.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        shards: int = 16,
+        max_keys_per_shard: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys_per_shard = max_keys_per_shard
+        self._clock = clock
+        self._shards: list[OrderedDict[str, tuple[float, float]]] = [
+            OrderedDict() for _ in range(shards)
+        ]
+        self.allowed = 0
+        self.limited = 0
+
+    def acquire(self, key: str) -> float:
+        """Take one token. Returns 0.0 if allowed, else seconds until one is available."""
+        if self.rate <= 0:
+            return 0.0
+        shard = self._shards[hash(key) % len(self._shards)]
+        now = self._clock()
+        tokens, last = shard.get(key, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+        if tokens >= 1.0:
+            shard[key] = (tokens - 1.0, now)
+            retry_after = 0.0
+            self.allowed += 1
+        else:
+            shard[key] = (tokens, now)
+            retry_after = (1.0 - tokens) / self.rate
+            self.limited += 1
+        shard.move_to_end(key)
+        while len(shard) > self.max_keys_per_shard:
+            shard.popitem(last=False)
+        return retry_after
+
+    def clear(self) -> None:
+        """Forget all buckets."""
+        for shard in self._shards:
+            shard.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for metrics."""
+        return {
+            "keys": sum(len(shard) for shard in self._shards),
+            "allowed": self.allowed,
+            "limited": self.limited,
+        }
+
+
+auth_ip_limiter = ShardedTokenBucketLimiter(
+    rate=settings.AUTH_RATE_LIMIT_IP_PER_MINUTE / 60,
+    burst=settings.AUTH_RATE_LIMIT_IP_BURST,
+)
+auth_email_limiter = ShardedTokenBucketLimiter(
+    rate=settings.AUTH_RATE_LIMIT_EMAIL_PER_MINUTE / 60,
+    burst=settings.AUTH_RATE_LIMIT_EMAIL_BURST,
+)
@@ -0,0 +1,68 @@
+"""Refresh-token rotation store - consumed tokens and revoked families."""
+
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.domain.enums import RefreshTokenStatus
+
+
+class RefreshTokenStore(ABC):
+    """
+    Tracks which refresh tokens (by jti) were already exchanged and which
+    token families were revoked. Records only live until the tokens they
+    cover expire, so the store stays small.
+    """
+
+    @abstractmethod
+    async def consume(
+        self, jti: str, family_id: str, expires_at: datetime
+    ) -> RefreshTokenStatus:
+        """
+        Mark a token as used. Returns REVOKED if its family is revoked,
+        REUSED if it was already consumed, otherwise OK.
+        """
+
+    @abstractmethod
+    async def revoke_family(self, family_id: str, expires_at: datetime) -> None:
+        """Revoke every token in a family until expires_at."""
+
+
+class InMemoryRefreshTokenStore(RefreshTokenStore):
+    """Per-process store. Fine for a single worker and for tests."""
+
+    PURGE_EVERY = 1000
+
+    def __init__(self) -> None:
+        self._consumed: dict[str, float] = {}
+        self._revoked: dict[str, float] = {}
+        self._ops = 0
+
+    def _purge(self) -> None:
+        now = time.time()
+        for entries in (self._consumed, self._revoked):
+            for key in [k for k, exp in entries.items() if exp <= now]:
+                del entries[key]
+
+    def _tick(self) -> None:
+        self._ops += 1
+        if self._ops % self.PURGE_EVERY == 0:
+            self._purge()
+
+    async def consume(
+        self, jti: str, family_id: str, expires_at: datetime
+    ) -> RefreshTokenStatus:
+        self._tick()
+        if self._revoked.get(family_id, 0) > time.time():
+            return RefreshTokenStatus.REVOKED
+        if jti in self._consumed:
+            return RefreshTokenStatus.REUSED
+        self._consumed[jti] = expires_at.timestamp()
+        return RefreshTokenStatus.OK
+
+    async def revoke_family(self, family_id: str, expires_at: datetime) -> None:
+        self._tick()
+        self._revoked[family_id] = expires_at.timestamp()
+
+    def __len__(self) -> int:
+        return len(self._consumed) + len(self._revoked)
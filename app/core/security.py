@@ -1,15 +1,38 @@
 """JWT authentication and password hashing."""
 
-from datetime import UTC, datetime, timedelta
+import secrets
+import time
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
-from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import get_settings, settings
+from app.core.token_codec import HS256TokenCodec, JoseTokenCodec, TokenCodec
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+# Active bcrypt cost; replaced by startup calibration
+_bcrypt_rounds = settings.BCRYPT_ROUNDS
+
+
+def get_bcrypt_rounds() -> int:
+    """Current bcrypt cost for new hashes."""
+    return _bcrypt_rounds
+
+
+def set_bcrypt_rounds(rounds: int) -> None:
+    """Change bcrypt cost for new hashes (startup calibration)."""
+    global _bcrypt_rounds
+    _bcrypt_rounds = rounds
+
+
+@lru_cache
+def _context_for_rounds(rounds: int) -> CryptContext:
+    return pwd_context.copy(bcrypt__rounds=rounds)
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -17,9 +40,47 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password."""
-    return pwd_context.hash(password)
+def get_password_hash(password: str, rounds: int | None = None) -> str:
+    """Hash a password (current cost unless rounds is given)."""
+    return _context_for_rounds(rounds or _bcrypt_rounds).hash(password)
+
+
+def bcrypt_cost(hashed: str) -> int | None:
+    """Cost factor of a bcrypt hash ($2b$12$...), None if not bcrypt."""
+    parts = hashed.split("$")
+    if len(parts) < 4 or not parts[1].startswith("2") or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def password_needs_rehash(hashed: str) -> bool:
+    """
+    True if a stored bcrypt hash uses a different cost than the current one,
+    in either direction, so login time follows the calibration. All workers
+    share one calibrated cost (app.services.password_calibration).
+    """
+    cost = bcrypt_cost(hashed)
+    return cost is not None and cost != _bcrypt_rounds
+
+
+@lru_cache
+def get_token_codec() -> TokenCodec:
+    """
+    Codec selected by JWT_CODEC. "auto" uses the lean HS256 codec when the
+    algorithm is HS256 and python-jose otherwise.
+    """
+    codec = settings.JWT_CODEC
+    if codec == "auto":
+        codec = "hs256" if settings.JWT_ALGORITHM == "HS256" else "jose"
+    if codec == "hs256":
+        if settings.JWT_ALGORITHM != "HS256":
+            raise RuntimeError("JWT_CODEC=hs256 requires JWT_ALGORITHM=HS256")
+        return HS256TokenCodec(settings.SECRET_KEY)
+    return JoseTokenCodec(settings.SECRET_KEY, settings.JWT_ALGORITHM)
+
+
+_ACCESS_TTL_SECONDS = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TTL_SECONDS = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 86400
 
 
 def create_access_token(
@@ -27,47 +88,35 @@ def create_access_token(
     extra_claims: dict[str, Any] | None = None,
 ) -> str:
     """Create JWT access token."""
-    expire = datetime.now(UTC) + timedelta(
-        minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
-    )
+    now = int(time.time())
     to_encode = {
         "sub": str(subject),
-        "exp": expire,
-        "iat": datetime.now(UTC),
+        "exp": now + _ACCESS_TTL_SECONDS,
+        "iat": now,
         "type": "access",
         **(extra_claims or {}),
     }
-    return jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM,
-    )
+    return get_token_codec().encode(to_encode)
 
 
-def create_refresh_token(subject: str | UUID) -> str:
-    """Create JWT refresh token."""
-    expire = datetime.now(UTC) + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+def create_refresh_token(subject: str | UUID, family_id: str | None = None) -> str:
+    """
+    Create JWT refresh token.
+    Each token gets a unique jti; tokens rotated from one login share a
+    family id (new family when not given).
+    """
+    now = int(time.time())
     to_encode = {
         "sub": str(subject),
-        "exp": expire,
-        "iat": datetime.now(UTC),
+        "exp": now + _REFRESH_TTL_SECONDS,
+        "iat": now,
         "type": "refresh",
+        "jti": secrets.token_urlsafe(16),
+        "fam": family_id or secrets.token_urlsafe(16),
     }
-    return jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM,
-    )
+    return get_token_codec().encode(to_encode)
 
 
 def decode_token(token: str) -> dict[str, Any] | None:
     """Decode and validate JWT token. Returns None if invalid."""
-    try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
-        return payload
-    except JWTError:
-        return None
+    return get_token_codec().decode(token)
@@ -0,0 +1,90 @@
+"""In-process cache of verified JWT payloads."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.core.config import settings
+from app.core.security import decode_token
+
+
+class VerifiedTokenCache:
+    """
+    LRU cache of decoded token payloads, keyed by a SHA-256 digest of the token.
+
+    Only tokens that passed signature verification are stored, and each entry
+    is dropped once the token's own ``exp`` has passed, so a hit never extends
+    a token's lifetime.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Return cached payload if present and not expired."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return payload
+
+    def put(self, token: str, payload: dict[str, Any]) -> None:
+        """Store a verified payload until its exp claim."""
+        exp = payload.get("exp")
+        if self.max_size <= 0 or not isinstance(exp, (int, float)):
+            return
+        key = self._key(token)
+        self._entries[key] = (float(exp), payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached payloads."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Cache counters for metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+token_cache = VerifiedTokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
+
+
+def decode_token_cached(token: str) -> dict[str, Any] | None:
+    """decode_token with the verified-payload cache in front. Returns None if invalid."""
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = decode_token(token)
+        if payload is not None:
+            token_cache.put(token, payload)
+    return payload
@@ -0,0 +1,104 @@
+"""JWT codecs - generic python-jose backend and a lean HS256 fast path."""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+from jose import JWTError, jwt
+
+
+class TokenCodec(ABC):
+    """Encodes claims into a signed JWT and verifies tokens back into claims."""
+
+    @abstractmethod
+    def encode(self, claims: dict[str, Any]) -> str:
+        """Sign claims (exp/iat as integer timestamps)."""
+
+    @abstractmethod
+    def decode(self, token: str) -> dict[str, Any] | None:
+        """Verify signature and time claims. Returns None if invalid."""
+
+
+class JoseTokenCodec(TokenCodec):
+    """python-jose backend; supports any algorithm jose supports."""
+
+    def __init__(self, key: str, algorithm: str):
+        self.key = key
+        self.algorithm = algorithm
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        return jwt.encode(claims, self.key, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> dict[str, Any] | None:
+        try:
+            return jwt.decode(token, self.key, algorithms=[self.algorithm])
+        except JWTError:
+            return None
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+class HS256TokenCodec(TokenCodec):
+    """
+    Minimal HS256 codec producing standard, jose-compatible tokens.
+
+    The header segment and the keyed HMAC state are computed once; encode is
+    one compact json.dumps plus one HMAC, decode skips generic header/claim
+    processing and only checks what the app relies on (signature, exp, nbf).
+    """
+
+    HEADER = {"alg": "HS256", "typ": "JWT"}
+
+    def __init__(self, key: str):
+        self._mac = hmac.new(key.encode(), digestmod=hashlib.sha256)
+        self._header = _b64encode(
+            json.dumps(self.HEADER, separators=(",", ":"), sort_keys=True).encode()
+        )
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+        signing_input = self._header + b"." + payload
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode()
+
+    def decode(self, token: str) -> dict[str, Any] | None:
+        try:
+            raw = token.encode("ascii")
+            if raw.count(b".") != 2:
+                return None
+            signing_input, _, signature = raw.rpartition(b".")
+            header, _, payload = signing_input.partition(b".")
+            if header != self._header:
+                # Same algorithm, different header serialization (other issuers)
+                if json.loads(_b64decode(header)).get("alg") != "HS256":
+                    return None
+            if not hmac.compare_digest(_b64decode(signature), self._sign(signing_input)):
+                return None
+            claims = json.loads(_b64decode(payload))
+        except (ValueError, binascii.Error, AttributeError):
+            return None
+        if not isinstance(claims, dict):
+            return None
+        now = time.time()
+        exp = claims.get("exp")
+        if exp is not None and (not isinstance(exp, (int, float)) or exp < now):
+            return None
+        nbf = claims.get("nbf")
+        if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+            return None
+        return claims
@@ -0,0 +1,185 @@
+"""Monthly range partitions of chrono_entries: creation ahead of time and retention.
+
+Run from cron with ``python -m app.db.partitions``, not at start-up: the
+DDL takes ACCESS EXCLUSIVE locks. Concurrent runs are serialized by a
+PostgreSQL advisory lock; the one that does not get it does nothing.
+"""
+
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "chrono_entries"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+_PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_(\d{{4}})_(\d{{2}})$")
+# pg_try_advisory_lock key held for the duration of one maintenance run
+MAINTENANCE_LOCK_KEY = 0x63687230
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """chrono_entries_YYYY_MM - the naming migration 005 also uses."""
+    return f"{PARENT_TABLE}_{month:%Y_%m}"
+
+
+def partition_month(name: str) -> date | None:
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def months_to_create(today: date, months_ahead: int) -> list[date]:
+    """Current month plus months_ahead following months."""
+    first = month_start(today)
+    return [add_months(first, i) for i in range(months_ahead + 1)]
+
+
+def partitions_to_detach(names: list[str], today: date, retention_months: int) -> list[str]:
+    """Monthly partitions ending before the retention window (0 = keep all)."""
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(today), -retention_months)
+    return sorted(
+        name
+        for name in names
+        if (month := partition_month(name)) is not None and month < cutoff
+    )
+
+
+def _create_partition_sql(month: date) -> str:
+    lower = f"{month:%Y-%m-%d} 00:00:00+00"
+    upper = f"{add_months(month, 1):%Y-%m-%d} 00:00:00+00"
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(month)}" PARTITION OF {PARENT_TABLE} '
+        f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    )
+
+
+def evidence_archive_name(month: date) -> str:
+    return f"evidence_{month:%Y_%m}"
+
+
+def _archive_evidence_sql(month: date) -> list[str]:
+    """
+    Move the month's evidence into a standalone evidence_YYYY_MM table: the
+    evidence FK would otherwise block detaching its entries' partition.
+    Safe to repeat; moved rows are no longer in evidence.
+    """
+    archive = evidence_archive_name(month)
+    where = (
+        f"WHERE chrono_entry_created_at >= '{month:%Y-%m-%d} 00:00:00+00' "
+        f"AND chrono_entry_created_at < '{add_months(month, 1):%Y-%m-%d} 00:00:00+00'"
+    )
+    return [
+        f'CREATE TABLE IF NOT EXISTS "{archive}" (LIKE evidence INCLUDING DEFAULTS)',
+        f'INSERT INTO "{archive}" SELECT * FROM evidence {where}',
+        f"DELETE FROM evidence {where}",
+    ]
+
+
+async def _attached_partitions(conn: AsyncConnection) -> list[str]:
+    result = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :parent"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return list(result.scalars().all())
+
+
+async def maintain_partitions(
+    engine: AsyncEngine,
+    months_ahead: int | None = None,
+    retention_months: int | None = None,
+    today: date | None = None,
+) -> dict[str, list[str]]:
+    """
+    Create missing monthly partitions up to months_ahead and detach those
+    older than retention_months. Detached partitions are kept as standalone
+    tables for archiving, next to their evidence (evidence_YYYY_MM); nothing
+    is dropped. A partition that cannot be created or detached is logged and
+    skipped. No-op outside PostgreSQL, or while another run holds the lock.
+    """
+    if engine.dialect.name != "postgresql":
+        return {"created": [], "detached": []}
+    months_ahead = settings.PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    retention_months = (
+        settings.PARTITION_RETENTION_MONTHS if retention_months is None else retention_months
+    )
+    today = today or datetime.now(timezone.utc).date()
+
+    created: list[str] = []
+    detached: list[str] = []
+    async with engine.connect() as conn:
+        locked = await conn.scalar(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+        )
+        if not locked:
+            await conn.rollback()
+            logger.info("Partition maintenance already running elsewhere, skipped")
+            return {"created": created, "detached": detached}
+        try:
+            existing = set(await _attached_partitions(conn))
+            # Session-level lock outlives this; each change gets its own transaction
+            await conn.commit()
+            for month in months_to_create(today, months_ahead):
+                name = partition_name(month)
+                if name in existing:
+                    continue
+                try:
+                    async with conn.begin():
+                        await conn.execute(text(_create_partition_sql(month)))
+                    created.append(name)
+                except Exception as exc:
+                    # e.g. rows for that month already sit in the default partition
+                    logger.warning("Could not create partition %s: %s", name, exc)
+            for name in partitions_to_detach(sorted(existing), today, retention_months):
+                try:
+                    async with conn.begin():
+                        for statement in _archive_evidence_sql(partition_month(name)):
+                            await conn.execute(text(statement))
+                        await conn.execute(
+                            text(f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION "{name}"')
+                        )
+                    detached.append(name)
+                except Exception as exc:
+                    logger.warning("Could not detach partition %s: %s", name, exc)
+        finally:
+            await conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+            )
+            await conn.commit()
+    if created or detached:
+        logger.info("Partitions created: %s; detached: %s", created, detached)
+    return {"created": created, "detached": detached}
+
+
+async def _main() -> None:
+    from app.db.session import engine
+
+    print(await maintain_partitions(engine))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,60 @@
+"""Instrumented connection pool and pool statistics."""
+
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records how long checkouts take.
+
+    Checkout time covers waiting for a free slot, opening overflow
+    connections and pre-ping, i.e. everything a request waits for before
+    its first statement can run.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    def connect(self):  # type: ignore[override]
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.checkouts += 1
+            self.wait_ms_total += elapsed
+            self.wait_ms_max = max(self.wait_ms_max, elapsed)
+
+
+def get_pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    """Live pool statistics for metrics scraping."""
+    pool = engine.pool
+    stats: dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        stats.update(
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            wait_ms_avg=round(pool.wait_ms_total / pool.checkouts, 3) if pool.checkouts else 0.0,
+            wait_ms_max=round(pool.wait_ms_max, 3),
+        )
+    return stats
@@ -0,0 +1,123 @@
+"""Per-request SQL statement accounting (count, DB time, rows, N+1 shapes) and budgets."""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+# Bind-parameter lists such as "IN ($1, $2, $3)" or "VALUES (?, ?), (?, ?)"
+_PARAM_LIST = re.compile(r"\(\s*(?:\$\d+|\?|%\(\w+\)s)(?:\s*,\s*(?:\$\d+|\?|%\(\w+\)s))*\s*\)")
+_VALUES_ROWS = re.compile(r"(VALUES \(\?\))(?:\s*,\s*\(\?\))+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize SQL so executions differing only in bind parameters compare equal."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PARAM_LIST.sub("(?)", shape)
+    return _VALUES_ROWS.sub(r"\1", shape)
+
+
+# Execution options for the app's own per-transaction setup (SET LOCAL ...,
+# SET TRANSACTION ...): not request work, so never counted or budgeted
+UNCOUNTED = {"query_stats": False}
+
+
+def _counted(context) -> bool:
+    return context is None or context.execution_options.get("query_stats", True)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A request ran more statements or spent more DB time than allowed."""
+
+
+@dataclass
+class QueryStats:
+    """SQL activity of one request, optionally bounded by a budget (0 = unlimited)."""
+
+    statements: int = 0
+    db_time_ms: float = 0.0
+    rows: int = 0
+    shapes: Counter = field(default_factory=Counter)
+    max_statements: int = 0
+    max_db_time_ms: float = 0.0
+
+    def check_budget(self, statement: str) -> None:
+        """Raise before running statement if the request is over budget."""
+        if self.max_statements and self.statements >= self.max_statements:
+            reason = f"statement budget of {self.max_statements} exhausted"
+        elif self.max_db_time_ms and self.db_time_ms >= self.max_db_time_ms:
+            reason = f"DB time budget of {self.max_db_time_ms:.0f}ms exhausted"
+        else:
+            return
+        logger.warning("Query budget exceeded (%s); refusing: %s", reason, statement_shape(statement)[:500])
+        raise QueryBudgetExceeded(reason)
+
+    def record(self, statement: str, elapsed_ms: float, rowcount: int) -> None:
+        self.statements += 1
+        self.db_time_ms += elapsed_ms
+        if rowcount > 0:
+            self.rows += rowcount
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed more than threshold times (N+1 suspects)."""
+        if threshold <= 0:
+            return []
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats(
+    max_statements: int = 0, max_db_time_ms: float = 0.0
+) -> tuple[QueryStats, Token]:
+    """Begin collecting statements for the current request context."""
+    stats = QueryStats(max_statements=max_statements, max_db_time_ms=max_db_time_ms)
+    return stats, _current.set(stats)
+
+
+def stop_query_stats(token: Token) -> None:
+    _current.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current.get()
+    if stats is not None and _counted(context):
+        stats.check_budget(statement)
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current.get()
+    if stats is None or not _counted(context):
+        return
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+    stats.record(statement, elapsed_ms, getattr(cursor, "rowcount", -1))
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context) -> None:
+    # after_cursor_execute is skipped for failed statements; drop their start time
+    conn = context.connection
+    if not _counted(context.execution_context):
+        return
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
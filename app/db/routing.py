@@ -0,0 +1,82 @@
+"""Read routing between primary and replica engines."""
+
+import itertools
+import time
+from collections.abc import Callable, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Client-held marker of the user's last write, so any worker can honour it
+LAST_WRITE_COOKIE = "last_write"
+LAST_WRITE_HEADER = "X-Last-Write"
+
+
+class ReplicaRouter:
+    """
+    Picks the engine for read-only sessions.
+
+    Reads round-robin over replicas, except for keys (user ids) that wrote
+    within the last ``sticky_seconds``: those read from the primary so they
+    see their own writes despite replication lag. Stickiness is tracked per
+    worker process; a write marker presented by the client (epoch ms of its
+    last write) covers the other workers.
+    """
+
+    MAX_STICKY_KEYS = 100_000
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine],
+        sticky_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.sticky_seconds = sticky_seconds
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._cycle = itertools.cycle(self.replicas) if self.replicas else None
+        self._sticky_until: dict[str, float] = {}
+
+    def mark_write(self, key: str | None) -> None:
+        """Record that key just committed a write."""
+        if key is None or not self.replicas:
+            return
+        now = self._clock()
+        if len(self._sticky_until) >= self.MAX_STICKY_KEYS:
+            self._sticky_until = {k: t for k, t in self._sticky_until.items() if t > now}
+        self._sticky_until[key] = now + self.sticky_seconds
+
+    def write_marker(self) -> str:
+        """Marker for a write committed now, to hand back to the client."""
+        return str(int(self._wall_clock() * 1000))
+
+    def marker_is_recent(self, marker: str | None) -> bool:
+        """
+        A presented marker is within the sticky window. Values further in
+        the future than that are ignored, so a forged marker pins at most
+        one window's worth of reads to the primary.
+        """
+        if not marker:
+            return False
+        try:
+            age = self._wall_clock() - int(marker) / 1000
+        except ValueError:
+            return False
+        return -self.sticky_seconds <= age < self.sticky_seconds
+
+    def engine_for_read(self, key: str | None, marker: str | None = None) -> AsyncEngine:
+        """Engine for a read-only session of key (None = anonymous)."""
+        if self._cycle is None:
+            return self.primary
+        if self.marker_is_recent(marker):
+            return self.primary
+        if key is not None:
+            until = self._sticky_until.get(key)
+            if until is not None:
+                if until > self._clock():
+                    return self.primary
+                del self._sticky_until[key]
+        return next(self._cycle)
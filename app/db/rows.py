@@ -0,0 +1,16 @@
+"""Column-row helpers for read paths that skip ORM object construction."""
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import Row
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def row_columns(model: type, row_type: type) -> list[InstrumentedAttribute]:
+    """The model's columns named by a TypedDict row type, in its field order."""
+    return [getattr(model, name) for name in row_type.__annotations__]
+
+
+def as_dicts(rows: Iterable[Row]) -> list[dict[str, Any]]:
+    return [row._asdict() for row in rows]
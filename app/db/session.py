@@ -1,20 +1,59 @@
 """Async database session factory and dependency injection."""
 
-from collections.abc import AsyncGenerator
-from typing import Annotated
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Annotated, Any
+from uuid import uuid4
 
-from fastapi import Depends
+from fastapi import Depends, Request
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from app.core.config import get_settings, settings
 from app.db.base import Base
+from app.db.pool import InstrumentedAsyncQueuePool
+from app.db.query_stats import UNCOUNTED
+from app.db.routing import LAST_WRITE_COOKIE, LAST_WRITE_HEADER, ReplicaRouter
 from app.domain import models  # noqa: F401 - ensure all models are registered
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DATABASE_ECHO,
-    future=True,
-)
+
+def _unique_statement_name() -> str:
+    """Prepared statement names that never collide behind PgBouncer."""
+    return f"__asyncpg_{uuid4()}__"
+
+
+def engine_options(url: str) -> dict[str, Any]:
+    """create_async_engine keyword arguments for a database URL, from Settings."""
+    options: dict[str, Any] = {"echo": settings.DATABASE_ECHO, "future": True}
+    if url.startswith("sqlite"):
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    )
+    if "+asyncpg" in url:
+        if settings.DATABASE_PGBOUNCER:
+            # Transaction pooling can hand each statement a different server
+            # connection, so server-side prepared statements must be off.
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_statement_name,
+            }
+        else:
+            options["connect_args"] = {
+                "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+                "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            }
+    return options
+
+
+engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -24,18 +63,146 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency that yields an async DB session."""
-    async with AsyncSessionLocal() as session:
+replica_engines = [
+    create_async_engine(url, **engine_options(url))
+    for url in settings.DATABASE_REPLICA_URLS
+]
+replica_router = ReplicaRouter(
+    primary=engine,
+    replicas=replica_engines,
+    sticky_seconds=settings.DATABASE_REPLICA_STICKY_SECONDS,
+)
+
+
+class ReadOnlySession(Session):
+    """Session whose transactions are started READ ONLY on PostgreSQL."""
+
+
+@event.listens_for(ReadOnlySession, "after_begin")
+def _begin_read_only(session, transaction, connection) -> None:
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY", execution_options=UNCOUNTED)
+
+
+ROUTE_CLASS_READ = "read"
+ROUTE_CLASS_WRITE = "write"
+ROUTE_CLASS_EXPORT = "export"
+
+
+def statement_timeout_ms(route_class: str) -> int:
+    """Configured statement_timeout for a route class (0 = server default)."""
+    return {
+        ROUTE_CLASS_READ: settings.DATABASE_STATEMENT_TIMEOUT_READ_MS,
+        ROUTE_CLASS_WRITE: settings.DATABASE_STATEMENT_TIMEOUT_WRITE_MS,
+        ROUTE_CLASS_EXPORT: settings.DATABASE_STATEMENT_TIMEOUT_EXPORT_MS,
+    }[route_class]
+
+
+@event.listens_for(Session, "after_begin")
+def _set_statement_timeout(session, transaction, connection) -> None:
+    route_class = session.info.get("route_class")
+    if route_class is None or connection.dialect.name != "postgresql":
+        return
+    timeout = statement_timeout_ms(route_class)
+    if timeout:
+        # LOCAL: reverts at transaction end, so pooled connections stay clean
+        connection.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {int(timeout)}", execution_options=UNCOUNTED
+        )
+
+
+WROTE_INFO_KEY = "wrote"
+
+
+@event.listens_for(Session, "after_flush")
+def _note_flushed_write(session, flush_context) -> None:
+    if session.new or session.dirty or session.deleted:
+        session.info[WROTE_INFO_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_executed_write(orm_execute_state) -> None:
+    # Upserts and bulk UPDATE/DELETE statements bypass the flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[WROTE_INFO_KEY] = True
+
+
+ReadOnlySessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=ReadOnlySession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
+def note_write(request: Request) -> None:
+    """
+    Record that the request committed a write: pin the user's reads to the
+    primary on this worker, and hand the client a marker for the others.
+    """
+    replica_router.mark_write(getattr(request.state, "user_id", None))
+    if replica_router.replicas:
+        request.state.last_write = replica_router.write_marker()
+
+
+def presented_write_marker(request: Request) -> str | None:
+    """Write marker sent back by the client (header first, then cookie)."""
+    return request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(LAST_WRITE_COOKIE)
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that yields an async DB session.
+
+    Sessions are lazily bound: a pooled connection is checked out on the first
+    query only, and commit/rollback are skipped when no transaction was begun,
+    so handlers that never touch the DB never hold a connection.
+    A committed transaction that wrote something pins the user's reads to
+    the primary for a while; read-only ones (login, /health) do not.
+    """
+    async with AsyncSessionLocal(info={"route_class": ROUTE_CLASS_WRITE}) as session:
         try:
             yield session
-            await session.commit()
+            if session.in_transaction():
+                await session.commit()
+                if session.info.get(WROTE_INFO_KEY):
+                    note_write(request)
         except Exception:
-            await session.rollback()
+            if session.in_transaction():
+                await session.rollback()
             raise
         finally:
             await session.close()
 
 
-# Type alias for dependency injection
+@asynccontextmanager
+async def read_session(
+    user_id: str | None, route_class: str = ROUTE_CLASS_READ, marker: str | None = None
+) -> AsyncIterator[AsyncSession]:
+    """
+    Read-only session routed like get_read_db, for code that outlives the
+    request's dependencies (e.g. a StreamingResponse body).
+    """
+    bind = replica_router.engine_for_read(user_id, marker)
+    async with ReadOnlySessionLocal(bind=bind, info={"route_class": route_class}) as session:
+        yield session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that yields a read-only session for GET endpoints.
+
+    Transactions run READ ONLY and are never committed. The session is bound
+    to a replica unless the current user wrote recently (on this worker, or
+    per the write marker the client presents); declare it after CurrentUser
+    so the user is known when the engine is picked.
+    """
+    async with read_session(
+        getattr(request.state, "user_id", None), marker=presented_write_marker(request)
+    ) as session:
+        yield session
+
+
+# Type aliases for dependency injection
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+ReadOnlyDbSession = Annotated[AsyncSession, Depends(get_read_db)]
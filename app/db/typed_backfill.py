@@ -0,0 +1,91 @@
+"""Backfill of the typed value columns of chrono_entries (value_num / value_bool / value_code).
+
+Migration 004 runs it while adding the columns. Code deployed before the
+columns existed keeps inserting rows without them until the new code is
+live, so run it once more after the deploy: ``python -m app.db.typed_backfill``.
+Parsing mirrors app.domain.values (PostgreSQL only).
+"""
+
+import asyncio
+
+from sqlalchemy import Connection, text
+
+BATCH_SIZE = 5000
+
+# Same accepted forms as app.domain.values.typed_value
+VALUE_NUM = r"""CASE
+        WHEN m.scale_type IN ('int', 'float')
+         AND length(btrim(c.value, E' \t\r\n')) <= 32
+         AND c.value ~ '^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]{1,2})?\s*$'
+        THEN c.value::double precision
+    END"""
+VALUE_BOOL = r"""CASE
+        WHEN m.scale_type = 'bool' AND lower(btrim(c.value, E' \t\r\n')) IN ('true', '1', 'yes') THEN true
+        WHEN m.scale_type = 'bool' AND lower(btrim(c.value, E' \t\r\n')) IN ('false', '0', 'no') THEN false
+    END"""
+VALUE_CODE = r"""CASE
+        WHEN m.scale_type = 'categorical' THEN btrim(c.value, E' \t\r\n')
+    END"""
+
+BACKFILL_SET = f"value_num = {VALUE_NUM}, value_bool = {VALUE_BOOL}, value_code = {VALUE_CODE}"
+
+# Rows without typed values that their value and metric can fill; updated rows leave this set
+PENDING = (
+    "c.value_num IS NULL AND c.value_bool IS NULL AND c.value_code IS NULL "
+    f"AND (({VALUE_NUM}) IS NOT NULL OR ({VALUE_BOOL}) IS NOT NULL OR ({VALUE_CODE}) IS NOT NULL)"
+)
+
+_AFTER_LAST = "(CAST(:last AS uuid) IS NULL OR {col} > CAST(:last AS uuid))"
+
+NEXT_CHUNK_SQL = (
+    "SELECT max(id) FROM (SELECT id FROM chrono_entries "
+    f"WHERE {_AFTER_LAST.format(col='id')} ORDER BY id LIMIT :batch) AS chunk"
+)
+UPDATE_CHUNK_SQL = (
+    f"UPDATE chrono_entries c SET {BACKFILL_SET} "
+    "FROM metric_definitions m "
+    f"WHERE m.id = c.metric_id AND {PENDING} "
+    f"AND {_AFTER_LAST.format(col='c.id')} AND c.id <= CAST(:upper AS uuid)"
+)
+
+
+def _walk(bind: Connection, batch_size: int) -> int:
+    """One pass over the table in id-keyset chunks; rows updated."""
+    updated = 0
+    last_id = None
+    while True:
+        upper = bind.execute(text(NEXT_CHUNK_SQL), {"last": last_id, "batch": batch_size}).scalar()
+        if upper is None:
+            return updated
+        result = bind.execute(text(UPDATE_CHUNK_SQL), {"last": last_id, "upper": upper})
+        updated += result.rowcount
+        last_id = str(upper)
+
+
+def backfill_typed_values(bind: Connection, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Fill the typed columns of every pending row; returns rows updated.
+
+    Chunks follow the random uuid4 id, so rows inserted during a pass by
+    code that does not write typed columns can land behind the cursor.
+    Passes therefore repeat until one updates nothing. Each chunk is its
+    own statement; run on an autocommit connection so locks stay short.
+    """
+    total = 0
+    while updated := _walk(bind, batch_size):
+        total += updated
+    return total
+
+
+async def _main() -> None:
+    from app.db.session import engine
+
+    if engine.dialect.name == "postgresql":
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            print(await conn.run_sync(backfill_typed_values))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,73 @@
+"""Deferred-flush unit of work shared by repositories."""
+
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+
+def apply_python_defaults(obj: Any) -> Any:
+    """
+    Fill unset columns that have Python-side defaults (ids, timestamps,
+    flags) now instead of at flush, so the object is complete before it is
+    written.
+    """
+    for attr in inspect(type(obj)).column_attrs:
+        default = attr.columns[0].default
+        if default is None or getattr(obj, attr.key) is not None:
+            continue
+        if default.is_callable:
+            setattr(obj, attr.key, default.arg(None))
+        elif default.is_scalar:
+            setattr(obj, attr.key, default.arg)
+    return obj
+
+
+class UnitOfWork:
+    """
+    Per-session write queue used by repositories.
+
+    In deferred mode (DATABASE_DEFERRED_FLUSH) repositories only register
+    new and changed objects; everything is written by a single flush at
+    commit or at an explicit sync point, where SQLAlchemy batches each
+    table's pending rows into one executemany/multi-row INSERT. Autoflush
+    is switched on for the session so queries still see pending rows.
+    In immediate mode every add/update is flushed right away (old behaviour).
+    """
+
+    INFO_KEY = "unit_of_work"
+
+    def __init__(self, session: AsyncSession, deferred: bool):
+        self.session = session
+        self.deferred = deferred
+        if deferred:
+            session.autoflush = True
+
+    @classmethod
+    def of(cls, session: AsyncSession) -> "UnitOfWork":
+        """The session's unit of work, created on first use."""
+        uow = session.info.get(cls.INFO_KEY)
+        if uow is None:
+            uow = cls(session, deferred=settings.DATABASE_DEFERRED_FLUSH)
+            session.info[cls.INFO_KEY] = uow
+        return uow
+
+    async def add(self, *objs: Any) -> None:
+        """Register new objects (defaults applied, ids usable immediately)."""
+        for obj in objs:
+            self.session.add(apply_python_defaults(obj))
+        if not self.deferred:
+            await self.session.flush()
+
+    async def updated(self) -> None:
+        """Call after modifying loaded objects."""
+        if not self.deferred:
+            await self.session.flush()
+
+    async def sync(self) -> None:
+        """Explicit sync point: write everything pending now."""
+        session = self.session
+        if session.new or session.dirty or session.deleted:
+            await session.flush()
@@ -32,3 +32,11 @@ class TaskStatus(str, enum.Enum):
     PENDING = "pending"
     COMPLETED = "completed"
     CANCELLED = "cancelled"
+
+
+class RefreshTokenStatus(str, enum.Enum):
+    """Outcome of presenting a refresh token for rotation."""
+
+    OK = "ok"
+    REUSED = "reused"
+    REVOKED = "revoked"
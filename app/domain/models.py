@@ -4,7 +4,19 @@ from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Text, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    LargeBinary,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -216,6 +228,7 @@ class ChronoEntry(Base):
 
     __tablename__ = "chrono_entries"
 
+    # Range-partitioned by month on created_at, so the partition key is part of the PK
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False), primary_key=True, default=gen_uuid
     )
@@ -232,6 +245,10 @@ class ChronoEntry(Base):
         index=True,
     )
     value: Mapped[str] = mapped_column(Text, nullable=False)
+    # Typed copies of value by metric scale type (app.domain.values), for SQL aggregates
+    value_num: Mapped[float | None] = mapped_column(Float, nullable=True)
+    value_bool: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    value_code: Mapped[str | None] = mapped_column(Text, nullable=True)
     confidence: Mapped[float] = mapped_column(Float, nullable=False, default=1.0)
     is_hypothesis: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     source_message_id: Mapped[str | None] = mapped_column(
@@ -244,7 +261,7 @@ class ChronoEntry(Base):
         UUID(as_uuid=False), nullable=True, index=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), primary_key=True, default=datetime.utcnow
     )
 
     user: Mapped["User"] = relationship("User", back_populates="chrono_entries")
@@ -255,10 +272,15 @@ class ChronoEntry(Base):
         "ChatMessage", back_populates="chrono_entries", foreign_keys=[source_message_id]
     )
     evidence: Mapped[list["Evidence"]] = relationship(
-        "Evidence", back_populates="chrono_entry", cascade="all, delete-orphan"
+        "Evidence",
+        back_populates="chrono_entry",
+        cascade="all, delete-orphan",
     )
 
-    __table_args__ = (Index("ix_chrono_user_created", "user_id", "created_at"),)
+    __table_args__ = (
+        Index("ix_chrono_user_created", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
 
 class Evidence(Base):
@@ -271,10 +293,13 @@ class Evidence(Base):
     )
     chrono_entry_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
-        ForeignKey("chrono_entries.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
+    # The entry's partition key: a partitioned table is referenced by its full PK
+    chrono_entry_created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
     text_snippet: Mapped[str] = mapped_column(Text, nullable=False)
     message_id: Mapped[str | None] = mapped_column(
         UUID(as_uuid=False),
@@ -287,7 +312,17 @@ class Evidence(Base):
     )
 
     chrono_entry: Mapped["ChronoEntry"] = relationship(
-        "ChronoEntry", back_populates="evidence"
+        "ChronoEntry",
+        back_populates="evidence",
+    )
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["chrono_entry_id", "chrono_entry_created_at"],
+            ["chrono_entries.id", "chrono_entries.created_at"],
+            name="evidence_chrono_entry_fkey",
+            ondelete="CASCADE",
+        ),
     )
 
 
@@ -319,3 +354,77 @@ class TaskReminder(Base):
     )
 
     user: Mapped["User"] = relationship("User", back_populates="task_reminders")
+
+
+class RefreshTokenRevocation(Base):
+    """
+    Refresh-token denylist: consumed token ids and revoked token families.
+    Rows are only needed until the tokens they cover expire.
+    """
+
+    __tablename__ = "refresh_token_revocations"
+
+    token_key: Mapped[str] = mapped_column(Text, primary_key=True)
+    kind: Mapped[str] = mapped_column(Text, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+
+class UserChangeWatermark(Base):
+    """
+    Per-user change marker for conditional GETs: version is bumped in the
+    same transaction as every entry write, last_entry_at follows the newest
+    entry. Timeline and summary ETags are derived from it.
+    """
+
+    __tablename__ = "user_change_watermarks"
+
+    user_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    last_entry_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+class IdempotencyKey(Base):
+    """
+    Idempotency-Key record: reserved in the same transaction as the write
+    it guards and completed with the response before commit. Rows are only
+    needed until expires_at.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    user_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    key: Mapped[str] = mapped_column(Text, primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(Text, nullable=False)
+    status_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    response_body: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+
+class BcryptCalibration(Base):
+    """
+    bcrypt cost calibrated by the first worker of a deployment
+    (BCRYPT_CALIBRATION_ID) and adopted by all others, so every worker
+    hashes and rehashes to the same cost.
+    """
+
+    __tablename__ = "bcrypt_calibrations"
+
+    calibration_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    rounds: Mapped[int] = mapped_column(Integer, nullable=False)
+    calibrated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+    )
@@ -1,10 +1,12 @@
 """Pydantic schemas for API request/response validation."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
+from typing_extensions import TypedDict
 
+from app.core.config import settings
 from app.domain.enums import MessageRole, ScaleType, TaskStatus
 
 
@@ -27,6 +29,12 @@ class TokenPayload(BaseModel):
     type: str = "access"
 
 
+class RefreshRequest(BaseModel):
+    """Refresh token exchange request body."""
+
+    refresh_token: str
+
+
 class LoginRequest(BaseModel):
     """Login request body."""
 
@@ -64,6 +72,20 @@ class UserResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class UserRow(TypedDict):
+    """Column row serialized like UserResponse (list fast path, no validation)."""
+
+    id: str
+    email: str
+    name: str | None
+    age: int | None
+    language: str | None
+    timezone: str | None
+    preferences: dict[str, Any] | None
+    consent_flags: dict[str, Any] | None
+    created_at: datetime
+
+
 # ----- Links / Invites -----
 
 
@@ -117,6 +139,13 @@ class MetricDefinitionResponse(MetricDefinitionBase):
 # ----- Chrono Entry -----
 
 
+class EvidenceCreate(BaseModel):
+    """Evidence snippet submitted with an entry."""
+
+    text_snippet: str = Field(..., min_length=1)
+    message_id: str | None = None
+
+
 class ChronoEntryCreate(BaseModel):
     """Create chrono entry request."""
 
@@ -125,6 +154,15 @@ class ChronoEntryCreate(BaseModel):
     confidence: float = Field(1.0, ge=0.0, le=1.0)
     is_hypothesis: bool = False
     source_message_id: str | None = None
+    evidence: list[EvidenceCreate] = Field(
+        default_factory=list, max_length=settings.ENTRY_EVIDENCE_MAX_ITEMS
+    )
+
+    def message_ids(self) -> set[str]:
+        """Chat messages referenced by the entry and its evidence."""
+        ids = {e.message_id for e in self.evidence} | {self.source_message_id}
+        ids.discard(None)
+        return ids
 
     @field_validator("value", mode="before")
     @classmethod
@@ -148,6 +186,19 @@ class ChronoEntryResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ChronoEntryRow(TypedDict):
+    """Column row serialized like ChronoEntryResponse (list fast path, no validation)."""
+
+    id: str
+    user_id: str
+    metric_id: str
+    value: str
+    confidence: float
+    is_hypothesis: bool
+    source_message_id: str | None
+    created_at: datetime
+
+
 class EvidenceResponse(BaseModel):
     """Evidence API response."""
 
@@ -160,6 +211,56 @@ class EvidenceResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class EvidenceRow(TypedDict):
+    """Column row serialized like EvidenceResponse."""
+
+    id: str
+    chrono_entry_id: str
+    text_snippet: str
+    message_id: str | None
+    created_at: datetime
+
+
+TimelineInclude = Literal["evidence"]
+
+
+class ChronoEntryWithEvidenceResponse(ChronoEntryResponse):
+    """Chrono entry with its evidence embedded (timeline include=evidence)."""
+
+    evidence: list[EvidenceResponse] = []
+
+
+class ChronoEntryWithEvidenceRow(ChronoEntryRow):
+    """Column row serialized like ChronoEntryWithEvidenceResponse."""
+
+    evidence: list[EvidenceRow]
+
+
+class ChronoEntryBatchCreate(BaseModel):
+    """Batch entry submission (mobile sync)."""
+
+    entries: list[ChronoEntryCreate] = Field(
+        ..., min_length=1, max_length=settings.ENTRY_BATCH_MAX_SIZE
+    )
+
+
+class ChronoEntryBatchItemResult(BaseModel):
+    """Outcome of one batch item, in request order."""
+
+    index: int
+    status: Literal["created", "error"]
+    entry: ChronoEntryResponse | None = None
+    error: str | None = None
+
+
+class ChronoEntryBatchResponse(BaseModel):
+    """Batch entry submission response."""
+
+    created: int
+    failed: int
+    results: list[ChronoEntryBatchItemResult]
+
+
 # ----- Chat -----
 
 
@@ -207,6 +308,18 @@ class TaskReminderResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class TaskReminderRow(TypedDict):
+    """Column row serialized like TaskReminderResponse (list fast path, no validation)."""
+
+    id: str
+    user_id: str
+    description: str
+    due_date: datetime | None
+    auto_generated: bool
+    status: str
+    created_at: datetime
+
+
 class TaskReminderUpdate(BaseModel):
     """Update task reminder request."""
 
@@ -214,11 +327,44 @@ class TaskReminderUpdate(BaseModel):
     description: str | None = None
 
 
-# ----- Summary (Analytics stub) -----
+# ----- Summary (Analytics) -----
+
+
+SeriesMethod = Literal["buckets", "lttb"]
+
+
+class SeriesPoint(BaseModel):
+    """One chart point. Buckets: value is the average, t the bucket start. LTTB: a raw entry."""
+
+    t: datetime
+    value: float
+    min: float | None = None
+    max: float | None = None
+    count: int | None = None
+
+
+class MetricSeries(BaseModel):
+    """Downsampled series of one metric."""
+
+    metric_id: str
+    name: str | None = None
+    scale_type: str | None = None
+    points: list[SeriesPoint] = Field(default_factory=list)
+
+
+class TimelineSeriesResponse(BaseModel):
+    """Per-metric chart series over a time range, at most `points` points each."""
+
+    user_id: str
+    period_start: datetime
+    period_end: datetime
+    method: SeriesMethod
+    bucket_seconds: int | None = None
+    series: list[MetricSeries] = Field(default_factory=list)
 
 
 class SummaryResponse(BaseModel):
-    """Wellness summary response - stub structure."""
+    """Wellness summary response - per-metric aggregates keyed by metric_id."""
 
     user_id: str
     period_start: datetime | None = None
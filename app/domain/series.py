@@ -0,0 +1,59 @@
+"""Downsampling helpers for charted timeline series."""
+
+import math
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+
+def as_utc(moment: datetime) -> datetime:
+    """Aware UTC datetime; naive values are UTC, as stored."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def epoch_seconds(moment: datetime) -> float:
+    return as_utc(moment).timestamp()
+
+
+def bucket_window(from_date: datetime, to_date: datetime, points: int) -> tuple[int, int]:
+    """
+    (start, width) in whole seconds such that every instant in [from, to]
+    falls in bucket (epoch - start) // width < points.
+    """
+    start = math.floor(epoch_seconds(from_date))
+    span = max(math.ceil(epoch_seconds(to_date)) - start, 0)
+    return start, span // points + 1
+
+
+def lttb(xs: Sequence[float], ys: Sequence[float], threshold: int) -> list[int]:
+    """
+    Largest-Triangle-Three-Buckets: indexes of at most threshold points that
+    keep the visual shape of the series. xs must be ascending.
+    """
+    n = len(xs)
+    if threshold >= n:
+        return list(range(n))
+    if threshold < 3:
+        return [0, n - 1][:threshold]
+    selected = [0]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / count
+        avg_y = sum(ys[next_start:next_end]) / count
+
+        ax, ay = xs[a], ys[a]
+        best, best_area = -1, -1.0
+        for j in range(int(i * every) + 1, next_start):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
@@ -0,0 +1,42 @@
+"""Typed representation of chrono entry values, derived from the metric scale type."""
+
+import re
+from typing import NamedTuple
+
+from app.domain.enums import ScaleType
+
+# Kept in sync with the SQL backfill in migration 004 (same accepted forms).
+# Length and exponent limits keep every match inside double precision range.
+NUMERIC_PATTERN = r"^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]{1,2})?\s*$"
+NUMERIC_MAX_LENGTH = 32
+TRUE_VALUES = ("true", "1", "yes")
+FALSE_VALUES = ("false", "0", "no")
+
+_NUMERIC = re.compile(NUMERIC_PATTERN)
+
+
+class TypedValue(NamedTuple):
+    """ChronoEntry typed value columns (at most one is set)."""
+
+    value_num: float | None = None
+    value_bool: bool | None = None
+    value_code: str | None = None
+
+
+def typed_value(scale_type: str, raw: str) -> TypedValue:
+    """
+    Interpret a stored text value according to its metric's scale type.
+    Values that do not parse for their scale leave every column NULL.
+    """
+    if scale_type in (ScaleType.INT, ScaleType.FLOAT):
+        if len(raw.strip()) <= NUMERIC_MAX_LENGTH and _NUMERIC.match(raw):
+            return TypedValue(value_num=float(raw))
+    elif scale_type == ScaleType.BOOL:
+        normalized = raw.strip().lower()
+        if normalized in TRUE_VALUES:
+            return TypedValue(value_bool=True)
+        if normalized in FALSE_VALUES:
+            return TypedValue(value_bool=False)
+    elif scale_type == ScaleType.CATEGORICAL:
+        return TypedValue(value_code=raw.strip())
+    return TypedValue()
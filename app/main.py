@@ -1,34 +1,81 @@
 """Wellness Tracker API - FastAPI application entry point."""
 
+import math
 import time
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy.exc import DBAPIError, IntegrityError
 
-from app.api.exceptions import generic_exception_handler, validation_exception_handler
+from app.api.exceptions import (
+    dbapi_exception_handler,
+    generic_exception_handler,
+    ingestion_unavailable_exception_handler,
+    integrity_error_handler,
+    query_budget_exception_handler,
+    validation_exception_handler,
+)
 from app.api.routes import auth, client, health, links, specialist
 from app.core.config import get_settings, settings
+from app.core.hashing import shutdown_password_hasher
 from app.core.logging import log_request, setup_logging
+from app.db.query_stats import QueryBudgetExceeded, start_query_stats, stop_query_stats
+from app.db.routing import LAST_WRITE_COOKIE, LAST_WRITE_HEADER
+from app.services.ingestion_queue import IngestionUnavailable, ingestion_queue
+from app.services.password_calibration import calibrate_password_hashing
+from app.warmup import readiness, stop_warm_up, warm_up
 
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application start-up and shutdown hooks."""
+    if settings.BCRYPT_CALIBRATE_ON_STARTUP:
+        await calibrate_password_hashing()
+    if settings.WARMUP_ENABLED:
+        await warm_up(app)
+    else:
+        readiness.ready = True
+    if settings.INGESTION_MODE == "queued":
+        ingestion_queue.start()
+    yield
+    await stop_warm_up()
+    # Acknowledge nothing that is not written: flush queued entries first
+    await ingestion_queue.stop()
+    shutdown_password_hasher()
+
+
 app = FastAPI(
     title="Wellness Tracker API",
     description="Mental wellness tracking system with evidence-first data model",
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
+app.add_exception_handler(QueryBudgetExceeded, query_budget_exception_handler)
+app.add_exception_handler(IngestionUnavailable, ingestion_unavailable_exception_handler)
+app.add_exception_handler(IntegrityError, integrity_error_handler)
+app.add_exception_handler(DBAPIError, dbapi_exception_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
 
 @app.middleware("http")
 async def logging_middleware(request: Request, call_next):
-    """Log request method, path, status and duration."""
+    """Log request method, path, status, duration and SQL activity."""
     start = time.perf_counter()
-    response = await call_next(request)
+    query_stats, token = start_query_stats(
+        max_statements=settings.DATABASE_REQUEST_MAX_STATEMENTS,
+        max_db_time_ms=settings.DATABASE_REQUEST_MAX_DB_TIME_MS,
+    )
+    try:
+        response = await call_next(request)
+    finally:
+        stop_query_stats(token)
     duration_ms = (time.perf_counter() - start) * 1000
     user_id = None
     if hasattr(request.state, "user_id"):
@@ -39,10 +86,28 @@ async def logging_middleware(request: Request, call_next):
         response.status_code,
         duration_ms,
         user_id=user_id,
+        db=query_stats,
     )
     return response
 
 
+@app.middleware("http")
+async def write_marker_middleware(request: Request, call_next):
+    """Return the last-write marker so other workers route this client's reads to the primary."""
+    response = await call_next(request)
+    marker = getattr(request.state, "last_write", None)
+    if marker:
+        response.headers[LAST_WRITE_HEADER] = marker
+        response.set_cookie(
+            LAST_WRITE_COOKIE,
+            marker,
+            max_age=math.ceil(settings.DATABASE_REPLICA_STICKY_SECONDS),
+            httponly=True,
+            samesite="lax",
+        )
+    return response
+
+
 # System routes (no prefix)
 app.include_router(health.router)
 
@@ -1,15 +1,21 @@
 """Repository layer - data access abstraction."""
 
 from app.repositories.access_link_repository import AccessLinkRepository
+from app.repositories.bcrypt_calibration_repository import BcryptCalibrationRepository
 from app.repositories.entry_repository import EntryRepository
+from app.repositories.refresh_token_repository import RefreshTokenRepository
 from app.repositories.specialist_repository import SpecialistRepository
 from app.repositories.task_repository import TaskRepository
 from app.repositories.user_repository import UserRepository
+from app.repositories.watermark_repository import WatermarkRepository
 
 __all__ = [
     "AccessLinkRepository",
+    "BcryptCalibrationRepository",
     "EntryRepository",
+    "RefreshTokenRepository",
     "SpecialistRepository",
     "TaskRepository",
     "UserRepository",
+    "WatermarkRepository",
 ]
@@ -6,8 +6,11 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.rows import as_dicts, row_columns
+from app.db.unit_of_work import UnitOfWork
 from app.domain.enums import InviteType
 from app.domain.models import InviteToken, User, UserAccessLink
+from app.domain.schemas import UserRow
 
 
 class AccessLinkRepository:
@@ -15,6 +18,7 @@ class AccessLinkRepository:
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.uow = UnitOfWork.of(session)
 
     async def get_active_link(
         self, specialist_user_id: str | UUID, client_user_id: str | UUID
@@ -41,25 +45,25 @@ class AccessLinkRepository:
             specialist_user_id=str(specialist_user_id),
             client_user_id=str(client_user_id),
         )
-        self.session.add(link)
-        await self.session.flush()
+        await self.uow.add(link)
         return link
 
-    async def get_clients_for_specialist(
+    async def get_client_rows_for_specialist(
         self, specialist_user_id: str | UUID
-    ) -> list[User]:
-        """Get all clients linked to a specialist."""
+    ) -> list[UserRow]:
+        """
+        Clients of a specialist as plain UserRow dicts. Filtering with IN
+        instead of a join keeps one row per user without de-duplicating.
+        """
+        linked = select(UserAccessLink.client_user_id).where(
+            UserAccessLink.specialist_user_id == str(specialist_user_id),
+            UserAccessLink.status == "active",
+            UserAccessLink.revoked_at.is_(None),
+        )
         result = await self.session.execute(
-            select(User).join(
-                UserAccessLink,
-                UserAccessLink.client_user_id == User.id,
-            ).where(
-                UserAccessLink.specialist_user_id == str(specialist_user_id),
-                UserAccessLink.status == "active",
-                UserAccessLink.revoked_at.is_(None),
-            )
+            select(*row_columns(User, UserRow)).where(User.id.in_(linked))
         )
-        return list(result.scalars().unique().all())
+        return as_dicts(result)
 
     async def has_specialist_access(
         self, specialist_user_id: str | UUID, client_user_id: str | UUID
@@ -84,8 +88,7 @@ class AccessLinkRepository:
             single_use=single_use,
             expires_at=expires_at,
         )
-        self.session.add(token)
-        await self.session.flush()
+        await self.uow.add(token)
         return token
 
     async def find_token_by_hash(self, token_hash: str) -> InviteToken | None:
@@ -108,4 +111,4 @@ class AccessLinkRepository:
 
             token.used_at = datetime.now(timezone.utc)
             token.used_by_user_id = used_by_user_id
-            await self.session.flush()
+            await self.uow.updated()
@@ -0,0 +1,37 @@
+"""Shared bcrypt calibration repository."""
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models import BcryptCalibration
+
+
+class BcryptCalibrationRepository:
+    """Repository for bcrypt_calibrations."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, calibration_id: str) -> int | None:
+        """Stored cost for a calibration id, None if not calibrated yet."""
+        result = await self.session.execute(
+            select(BcryptCalibration.rounds).where(
+                BcryptCalibration.calibration_id == calibration_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def claim(self, calibration_id: str, rounds: int) -> int:
+        """
+        Store rounds unless another worker stored a cost first; returns the
+        cost that won, which every worker then uses.
+        """
+        insert = pg_insert if self.session.get_bind().dialect.name == "postgresql" else sqlite_insert
+        await self.session.execute(
+            insert(BcryptCalibration)
+            .values(calibration_id=calibration_id, rounds=rounds)
+            .on_conflict_do_nothing(index_elements=[BcryptCalibration.calibration_id])
+        )
+        return await self.get(calibration_id)
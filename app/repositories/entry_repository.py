@@ -1,12 +1,31 @@
 """Chrono entry and related repository."""
 
+from collections.abc import Iterable, Sequence
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import BigInteger, Select, case, cast, extract, func, insert, inspect, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.models import ChronoEntry, Evidence
+from app.core.pagination import KeysetCursor
+from app.db.rows import as_dicts, row_columns
+from app.db.unit_of_work import UnitOfWork
+from app.domain.models import ChatMessage, ChronoEntry, Evidence
+from app.domain.schemas import ChronoEntryRow, EvidenceRow
+from app.domain.values import TypedValue
+
+
+# asyncpg allows at most 32767 bind parameters per statement
+MAX_BIND_PARAMS = 32767
+
+
+def _column_rows(objs: Sequence[Any]) -> list[dict[str, Any]]:
+    """Column values of mapped objects, for Core multi-row INSERTs."""
+    if not objs:
+        return []
+    columns = [attr.key for attr in inspect(type(objs[0])).column_attrs]
+    return [{c: getattr(obj, c) for c in columns} for obj in objs]
 
 
 class EntryRepository:
@@ -14,6 +33,7 @@ class EntryRepository:
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.uow = UnitOfWork.of(session)
 
     async def create_entry(
         self,
@@ -24,8 +44,9 @@ class EntryRepository:
         is_hypothesis: bool = False,
         source_message_id: str | None = None,
         clinic_id: str | None = None,
+        typed: TypedValue = TypedValue(),
     ) -> ChronoEntry:
-        """Create a chrono entry."""
+        """Create a chrono entry (typed: value_num/bool/code derived from value)."""
         entry = ChronoEntry(
             user_id=user_id,
             metric_id=metric_id,
@@ -34,46 +55,234 @@ class EntryRepository:
             is_hypothesis=is_hypothesis,
             source_message_id=source_message_id,
             clinic_id=clinic_id,
+            **typed._asdict(),
         )
-        self.session.add(entry)
-        await self.session.flush()
+        await self.uow.add(entry)
         return entry
 
-    async def get_timeline(
-        self,
+    @staticmethod
+    def _timeline_query(
+        q: Select,
         user_id: str | UUID,
-        limit: int = 100,
-        offset: int = 0,
-        from_date: datetime | None = None,
-        to_date: datetime | None = None,
-    ) -> list[ChronoEntry]:
-        """Get chrono entries for a user, ordered by created_at desc."""
+        limit: int,
+        offset: int,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        after: KeysetCursor | None,
+    ) -> Select:
         q = (
-            select(ChronoEntry)
-            .where(ChronoEntry.user_id == str(user_id))
-            .order_by(ChronoEntry.created_at.desc())
+            q.where(ChronoEntry.user_id == str(user_id))
+            .order_by(ChronoEntry.created_at.desc(), ChronoEntry.id.desc())
             .limit(limit)
             .offset(offset)
         )
+        if after is not None:
+            # created_at <= c bounds the index scan; the OR breaks ties on id
+            q = q.where(
+                ChronoEntry.created_at <= after.created_at,
+                or_(
+                    ChronoEntry.created_at < after.created_at,
+                    ChronoEntry.id < after.id,
+                ),
+            )
         if from_date:
             q = q.where(ChronoEntry.created_at >= from_date)
         if to_date:
             q = q.where(ChronoEntry.created_at <= to_date)
+        return q
+
+    async def get_timeline_rows(
+        self,
+        user_id: str | UUID,
+        limit: int = 100,
+        offset: int = 0,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        after: KeysetCursor | None = None,
+    ) -> list[ChronoEntryRow]:
+        """
+        Chrono entries for a user as plain ChronoEntryRow dicts (no ORM
+        identity map), newest first by (created_at, id).
+
+        With after, returns the rows following that cursor (keyset paging:
+        an index range scan on ix_chrono_user_created, constant cost per page).
+        Cursor and date bounds are plain created_at comparisons, so PostgreSQL
+        prunes the monthly partitions outside the range.
+        """
+        q = self._timeline_query(
+            select(*row_columns(ChronoEntry, ChronoEntryRow)),
+            user_id, limit, offset, from_date, to_date, after,
+        )
         result = await self.session.execute(q)
-        return list(result.scalars().all())
+        return as_dicts(result)
+
+    async def get_evidence_rows(
+        self, chrono_entry_ids: Sequence[str]
+    ) -> dict[str, list[EvidenceRow]]:
+        """
+        Evidence for a set of entries in one IN query (what selectinload
+        emits), grouped by entry id, oldest first.
+        """
+        grouped: dict[str, list[EvidenceRow]] = {}
+        if not chrono_entry_ids:
+            return grouped
+        result = await self.session.execute(
+            select(*row_columns(Evidence, EvidenceRow))
+            .where(Evidence.chrono_entry_id.in_(chrono_entry_ids))
+            .order_by(Evidence.created_at.asc(), Evidence.id.asc())
+        )
+        for row in as_dicts(result):
+            grouped.setdefault(row["chrono_entry_id"], []).append(row)
+        return grouped
+
+    async def get_existing_message_ids(self, message_ids: Iterable[str]) -> set[str]:
+        """The chat message ids among message_ids that exist (one IN query)."""
+        ids = set(message_ids)
+        if not ids:
+            return set()
+        result = await self.session.execute(select(ChatMessage.id).where(ChatMessage.id.in_(ids)))
+        return set(result.scalars().all())
 
     async def add_evidence(
         self,
-        chrono_entry_id: str,
+        entry: ChronoEntry,
         text_snippet: str,
         message_id: str | None = None,
     ) -> Evidence:
         """Add evidence to a chrono entry."""
         evidence = Evidence(
-            chrono_entry_id=chrono_entry_id,
+            chrono_entry_id=entry.id,
+            chrono_entry_created_at=entry.created_at,
             text_snippet=text_snippet,
             message_id=message_id,
         )
-        self.session.add(evidence)
-        await self.session.flush()
+        await self.uow.add(evidence)
         return evidence
+
+    async def add_evidence_many(
+        self,
+        entry: ChronoEntry,
+        snippets: list[tuple[str, str | None]],
+    ) -> list[Evidence]:
+        """Add several (text_snippet, message_id) evidence rows to an entry."""
+        evidence = [
+            Evidence(
+                chrono_entry_id=entry.id,
+                chrono_entry_created_at=entry.created_at,
+                text_snippet=text_snippet,
+                message_id=message_id,
+            )
+            for text_snippet, message_id in snippets
+        ]
+        await self.uow.add(*evidence)
+        return evidence
+
+    async def insert_many(
+        self, entries: Sequence[ChronoEntry], evidence: Sequence[Evidence] = ()
+    ) -> None:
+        """
+        Write entries and their evidence with multi-row INSERT ... VALUES
+        statements (one per table, split only to respect the bind-parameter
+        limit). Objects must already carry their ids (apply_python_defaults);
+        they are not added to the session.
+        """
+        for model, objs in ((ChronoEntry, entries), (Evidence, evidence)):
+            rows = _column_rows(objs)
+            if not rows:
+                continue
+            chunk = MAX_BIND_PARAMS // len(rows[0])
+            for start in range(0, len(rows), chunk):
+                await self.session.execute(
+                    insert(model.__table__).values(rows[start : start + chunk])
+                )
+
+    async def summarize_by_metric(
+        self, user_id: str | UUID, from_date: datetime, to_date: datetime
+    ) -> list[dict[str, Any]]:
+        """Per-metric aggregates over the typed value columns, computed in SQL."""
+        bool_as_num = case((ChronoEntry.value_bool.is_(True), 1.0), (ChronoEntry.value_bool.is_(False), 0.0))
+        q = (
+            select(
+                ChronoEntry.metric_id,
+                func.count().label("count"),
+                func.avg(ChronoEntry.value_num).label("avg"),
+                func.min(ChronoEntry.value_num).label("min"),
+                func.max(ChronoEntry.value_num).label("max"),
+                func.avg(bool_as_num).label("true_ratio"),
+                func.count(func.distinct(ChronoEntry.value_code)).label("distinct_codes"),
+                func.min(ChronoEntry.created_at).label("first_at"),
+                func.max(ChronoEntry.created_at).label("last_at"),
+            )
+            .where(
+                ChronoEntry.user_id == str(user_id),
+                ChronoEntry.created_at >= from_date,
+                ChronoEntry.created_at <= to_date,
+            )
+            .group_by(ChronoEntry.metric_id)
+        )
+        result = await self.session.execute(q)
+        return [dict(row._mapping) for row in result]
+
+    @staticmethod
+    def _numeric_in_range(
+        q: Select,
+        user_id: str | UUID,
+        from_date: datetime,
+        to_date: datetime,
+        metric_ids: Sequence[str] | None,
+    ) -> Select:
+        q = q.where(
+            ChronoEntry.user_id == str(user_id),
+            ChronoEntry.created_at >= from_date,
+            ChronoEntry.created_at <= to_date,
+            ChronoEntry.value_num.is_not(None),
+        )
+        if metric_ids:
+            q = q.where(ChronoEntry.metric_id.in_(metric_ids))
+        return q
+
+    async def bucket_series(
+        self,
+        user_id: str | UUID,
+        from_date: datetime,
+        to_date: datetime,
+        start: int,
+        width: int,
+        metric_ids: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Numeric values grouped into fixed-width time buckets per metric
+        (bucket = (epoch - start) // width seconds), with count/avg/min/max
+        computed by the database. One row per non-empty bucket.
+        """
+        bucket = (
+            (cast(extract("epoch", ChronoEntry.created_at), BigInteger) - start) // width
+        ).label("bucket")
+        q = self._numeric_in_range(
+            select(
+                ChronoEntry.metric_id,
+                bucket,
+                func.count().label("count"),
+                func.avg(ChronoEntry.value_num).label("avg"),
+                func.min(ChronoEntry.value_num).label("min"),
+                func.max(ChronoEntry.value_num).label("max"),
+            ),
+            user_id, from_date, to_date, metric_ids,
+        ).group_by(ChronoEntry.metric_id, bucket).order_by(ChronoEntry.metric_id, bucket)
+        result = await self.session.execute(q)
+        return as_dicts(result)
+
+    async def get_numeric_points(
+        self,
+        user_id: str | UUID,
+        from_date: datetime,
+        to_date: datetime,
+        metric_ids: Sequence[str] | None = None,
+    ) -> list[tuple[str, datetime, float]]:
+        """(metric_id, created_at, value_num) column tuples, ordered per metric by time."""
+        q = self._numeric_in_range(
+            select(ChronoEntry.metric_id, ChronoEntry.created_at, ChronoEntry.value_num),
+            user_id, from_date, to_date, metric_ids,
+        ).order_by(ChronoEntry.metric_id, ChronoEntry.created_at)
+        result = await self.session.execute(q)
+        return [tuple(row) for row in result]
@@ -0,0 +1,74 @@
+"""Table-backed Idempotency-Key store."""
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import Row, delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models import IdempotencyKey
+
+
+class IdempotencyRepository:
+    """Repository for idempotency_keys (shared across workers)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def reserve(
+        self, user_id: str | UUID, key: str, fingerprint: str, expires_at: datetime
+    ) -> bool:
+        """
+        Claim a key for this transaction (INSERT ... ON CONFLICT). An expired
+        record is taken over; a live one is left alone and False returned.
+        A concurrent request with the same key waits on the row until this
+        transaction ends.
+        """
+        insert = pg_insert if self.session.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(IdempotencyKey).values(
+            user_id=str(user_id), key=key, fingerprint=fingerprint, expires_at=expires_at
+        )
+        result = await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[IdempotencyKey.user_id, IdempotencyKey.key],
+                set_={
+                    "fingerprint": stmt.excluded.fingerprint,
+                    "status_code": None,
+                    "response_body": None,
+                    "expires_at": stmt.excluded.expires_at,
+                },
+                where=IdempotencyKey.expires_at <= datetime.now(timezone.utc),
+            ).returning(IdempotencyKey.key)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def get(self, user_id: str | UUID, key: str) -> Row | None:
+        """(fingerprint, status_code, response_body, expires_at) of a record."""
+        result = await self.session.execute(
+            select(
+                IdempotencyKey.fingerprint,
+                IdempotencyKey.status_code,
+                IdempotencyKey.response_body,
+                IdempotencyKey.expires_at,
+            ).where(IdempotencyKey.user_id == str(user_id), IdempotencyKey.key == key)
+        )
+        return result.one_or_none()
+
+    async def complete(
+        self, user_id: str | UUID, key: str, status_code: int, body: bytes
+    ) -> None:
+        """Store the response of a reserved key (same transaction as the write)."""
+        await self.session.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.user_id == str(user_id), IdempotencyKey.key == key)
+            .values(status_code=status_code, response_body=body)
+        )
+
+    async def purge_expired(self) -> int:
+        """Delete expired records. Returns rows removed."""
+        result = await self.session.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.expires_at <= datetime.now(timezone.utc))
+        )
+        return result.rowcount or 0
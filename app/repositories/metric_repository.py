@@ -1,5 +1,6 @@
 """Metric definition repository."""
 
+from collections.abc import Iterable
 from uuid import UUID
 
 from sqlalchemy import select
@@ -20,3 +21,18 @@ class MetricRepository:
             select(MetricDefinition).where(MetricDefinition.id == str(metric_id))
         )
         return result.scalar_one_or_none()
+
+    async def get_by_ids(self, metric_ids: Iterable[str | UUID]) -> list[MetricDefinition]:
+        """Get the metric definitions that exist among the given IDs (one query)."""
+        ids = {str(m) for m in metric_ids}
+        if not ids:
+            return []
+        result = await self.session.execute(
+            select(MetricDefinition).where(MetricDefinition.id.in_(ids))
+        )
+        return list(result.scalars().all())
+
+    async def get_all(self) -> list[MetricDefinition]:
+        """Get every metric definition."""
+        result = await self.session.execute(select(MetricDefinition))
+        return list(result.scalars().all())
@@ -0,0 +1,71 @@
+"""Table-backed refresh-token rotation store."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.refresh_store import RefreshTokenStore
+from app.domain.enums import RefreshTokenStatus
+from app.domain.models import RefreshTokenRevocation
+
+
+class RefreshTokenRepository(RefreshTokenStore):
+    """Repository for refresh_token_revocations (shared across workers)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _jti_key(jti: str) -> str:
+        return f"jti:{jti}"
+
+    @staticmethod
+    def _family_key(family_id: str) -> str:
+        return f"fam:{family_id}"
+
+    async def consume(
+        self, jti: str, family_id: str, expires_at: datetime
+    ) -> RefreshTokenStatus:
+        """Mark jti consumed. Concurrent reuse is serialized by the primary key."""
+        revoked = await self.session.execute(
+            select(RefreshTokenRevocation.token_key).where(
+                RefreshTokenRevocation.token_key == self._family_key(family_id),
+                RefreshTokenRevocation.expires_at > datetime.now(timezone.utc),
+            )
+        )
+        if revoked.scalar_one_or_none() is not None:
+            return RefreshTokenStatus.REVOKED
+        inserted = await self.session.execute(
+            insert(RefreshTokenRevocation)
+            .values(token_key=self._jti_key(jti), kind="consumed", expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=["token_key"])
+            .returning(RefreshTokenRevocation.token_key)
+        )
+        if inserted.scalar_one_or_none() is None:
+            return RefreshTokenStatus.REUSED
+        return RefreshTokenStatus.OK
+
+    async def revoke_family(self, family_id: str, expires_at: datetime) -> None:
+        """Revoke family (upsert, extends expiry)."""
+        stmt = insert(RefreshTokenRevocation).values(
+            token_key=self._family_key(family_id),
+            kind="revoked_family",
+            expires_at=expires_at,
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["token_key"],
+                set_={"expires_at": stmt.excluded.expires_at},
+            )
+        )
+
+    async def purge_expired(self) -> int:
+        """Delete records whose tokens have expired. Returns rows removed."""
+        result = await self.session.execute(
+            delete(RefreshTokenRevocation).where(
+                RefreshTokenRevocation.expires_at <= datetime.now(timezone.utc)
+            )
+        )
+        return result.rowcount or 0
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.models import User
+from app.domain.schemas import UserRow
 from app.repositories.access_link_repository import AccessLinkRepository
 
 
@@ -14,8 +14,8 @@ class SpecialistRepository:
     def __init__(self, session: AsyncSession):
         self.link_repo = AccessLinkRepository(session)
 
-    async def get_specialist_clients(
+    async def get_specialist_client_rows(
         self, specialist_user_id: str | UUID
-    ) -> list[User]:
-        """Get all clients for a specialist (from access links)."""
-        return await self.link_repo.get_clients_for_specialist(specialist_user_id)
+    ) -> list[UserRow]:
+        """Clients for a specialist as plain rows (list endpoint fast path)."""
+        return await self.link_repo.get_client_rows_for_specialist(specialist_user_id)
@@ -3,10 +3,13 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.rows import as_dicts, row_columns
+from app.db.unit_of_work import UnitOfWork
 from app.domain.models import TaskReminder
+from app.domain.schemas import TaskReminderRow
 
 
 class TaskRepository:
@@ -14,6 +17,7 @@ class TaskRepository:
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.uow = UnitOfWork.of(session)
 
     async def create(
         self,
@@ -33,29 +37,36 @@ class TaskRepository:
             status=status,
             clinic_id=clinic_id,
         )
-        self.session.add(task)
-        await self.session.flush()
+        await self.uow.add(task)
         return task
 
-    async def get_by_user(
-        self,
-        user_id: str | UUID,
-        limit: int = 50,
-        offset: int = 0,
-        status: str | None = None,
-    ) -> list[TaskReminder]:
-        """Get tasks for a user."""
+    @staticmethod
+    def _user_query(
+        q: Select, user_id: str | UUID, limit: int, offset: int, status: str | None
+    ) -> Select:
         q = (
-            select(TaskReminder)
-            .where(TaskReminder.user_id == str(user_id))
+            q.where(TaskReminder.user_id == str(user_id))
             .order_by(TaskReminder.due_date.asc().nullslast(), TaskReminder.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
         if status:
             q = q.where(TaskReminder.status == status)
+        return q
+
+    async def get_rows_by_user(
+        self,
+        user_id: str | UUID,
+        limit: int = 50,
+        offset: int = 0,
+        status: str | None = None,
+    ) -> list[TaskReminderRow]:
+        """Get tasks for a user as plain TaskReminderRow dicts."""
+        q = self._user_query(
+            select(*row_columns(TaskReminder, TaskReminderRow)), user_id, limit, offset, status
+        )
         result = await self.session.execute(q)
-        return list(result.scalars().all())
+        return as_dicts(result)
 
     async def get_by_id(self, task_id: str | UUID) -> TaskReminder | None:
         """Get task by ID."""
@@ -71,5 +82,5 @@ class TaskRepository:
         task = await self.get_by_id(task_id)
         if task:
             task.status = status
-            await self.session.flush()
+            await self.uow.updated()
         return task
@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.unit_of_work import UnitOfWork
 from app.domain.models import User
 
 
@@ -13,6 +14,7 @@ class UserRepository:
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.uow = UnitOfWork.of(session)
 
     async def get_by_email(self, email: str) -> User | None:
         """Find user by email."""
@@ -44,6 +46,11 @@ class UserRepository:
             timezone=timezone,
             clinic_id=clinic_id,
         )
-        self.session.add(user)
-        await self.session.flush()
+        await self.uow.add(user)
+        return user
+
+    async def update_password_hash(self, user: User, hashed_password: str) -> User:
+        """Replace a user's password hash (e.g. after a cost change)."""
+        user.hashed_password = hashed_password
+        await self.uow.updated()
         return user
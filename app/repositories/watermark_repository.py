@@ -0,0 +1,47 @@
+"""Per-user change watermark repository."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models import UserChangeWatermark
+
+
+class WatermarkRepository:
+    """Repository for user_change_watermarks."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, user_id: str | UUID) -> tuple[int, datetime | None]:
+        """(version, last_entry_at); (0, None) for a user who never wrote."""
+        result = await self.session.execute(
+            select(UserChangeWatermark.version, UserChangeWatermark.last_entry_at).where(
+                UserChangeWatermark.user_id == str(user_id)
+            )
+        )
+        row = result.one_or_none()
+        return (row.version, row.last_entry_at) if row else (0, None)
+
+    async def bump(self, user_id: str | UUID, last_entry_at: datetime) -> None:
+        """
+        Advance the user's version in the caller's transaction with a single
+        upsert (the row lock orders concurrent writers for the same user).
+        """
+        insert = pg_insert if self.session.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(UserChangeWatermark).values(
+            user_id=str(user_id), version=1, last_entry_at=last_entry_at
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UserChangeWatermark.user_id],
+                set_={
+                    "version": UserChangeWatermark.version + 1,
+                    "last_entry_at": stmt.excluded.last_entry_at,
+                },
+            )
+        )
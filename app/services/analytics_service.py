@@ -1,39 +1,137 @@
-"""Analytics and summary service - stub implementation."""
+"""Analytics and summary service."""
 
-from datetime import datetime, timedelta
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
 
 from app.db.session import DbSession
-from app.domain.schemas import SummaryResponse
+from app.domain.schemas import (
+    MetricSeries,
+    SeriesMethod,
+    SeriesPoint,
+    SummaryResponse,
+    TimelineSeriesResponse,
+)
+from app.domain.series import bucket_window, epoch_seconds, lttb
+from app.repositories.entry_repository import EntryRepository
+from app.services.metric_catalog import metric_catalog
 
 
 class AnalyticsService:
     """
-    Analytics service - stub for future implementation.
-    Will aggregate chrono entries, compute metrics, generate insights.
+    Analytics service - per-metric aggregates over the summary window.
+    Insight generation is not implemented yet.
     """
 
     def __init__(self, session: DbSession):
         self.session = session
+        self.entry_repo = EntryRepository(session)
+
+    @staticmethod
+    def summary_start(period_days: int, now: datetime | None = None) -> datetime:
+        """
+        Start of the summary window, snapped down to the minute so the
+        window (and the summary ETag) only moves once a minute.
+        """
+        now = now or datetime.utcnow()
+        return now.replace(second=0, microsecond=0) - timedelta(days=period_days)
 
     async def get_summary(
         self,
         user_id: str,
         period_days: int = 7,
+        period_start: datetime | None = None,
     ) -> SummaryResponse:
         """
         Get wellness summary for a user.
-        Stub: returns empty structure. Real implementation will:
-        - Aggregate chrono entries by metric
-        - Compute trends, averages
-        - Run LLM insight extraction
+
+        Aggregates (count, avg/min/max of numeric values, share of true for
+        boolean metrics, distinct categories) are computed by the database
+        over the typed value columns, one row per metric. period_start
+        defaults to summary_start(period_days).
         """
-        now = datetime.utcnow()
-        period_end = now
-        period_start = now - timedelta(days=period_days)
+        period_end = datetime.utcnow()
+        period_start = period_start or self.summary_start(period_days, period_end)
+        rows = await self.entry_repo.summarize_by_metric(user_id, period_start, period_end)
+        catalog = await metric_catalog.get_many(self.session, (r["metric_id"] for r in rows))
+        metrics = {}
+        for row in rows:
+            metric_id = row.pop("metric_id")
+            info = catalog.get(metric_id)
+            metrics[metric_id] = {
+                "name": info.name if info else None,
+                "scale_type": info.scale_type if info else None,
+                **row,
+            }
         return SummaryResponse(
             user_id=user_id,
             period_start=period_start,
             period_end=period_end,
-            metrics={},
+            metrics=metrics,
             insights=[],
         )
+
+    async def get_series(
+        self,
+        user_id: str,
+        from_date: datetime,
+        to_date: datetime,
+        points: int = 200,
+        method: SeriesMethod = "buckets",
+        metric_ids: Sequence[str] | None = None,
+    ) -> TimelineSeriesResponse:
+        """
+        Numeric metric series downsampled to at most `points` points each.
+
+        buckets: fixed-width time buckets aggregated (count/avg/min/max) in
+        SQL, so only the buckets leave the database. lttb: the range's values
+        are fetched as column tuples and reduced with Largest-Triangle-Three-
+        Buckets, which keeps peaks and dips of sparse series.
+        """
+        by_metric: dict[str, list[SeriesPoint]] = defaultdict(list)
+        bucket_seconds = None
+        if method == "buckets":
+            start, bucket_seconds = bucket_window(from_date, to_date, points)
+            rows = await self.entry_repo.bucket_series(
+                user_id, from_date, to_date, start, bucket_seconds, metric_ids
+            )
+            for row in rows:
+                t = datetime.fromtimestamp(start + row["bucket"] * bucket_seconds, timezone.utc)
+                by_metric[row["metric_id"]].append(
+                    SeriesPoint(
+                        t=t, value=row["avg"], min=row["min"], max=row["max"], count=row["count"]
+                    )
+                )
+        else:
+            raw: dict[str, list[tuple[datetime, float]]] = defaultdict(list)
+            for metric_id, created_at, value in await self.entry_repo.get_numeric_points(
+                user_id, from_date, to_date, metric_ids
+            ):
+                raw[metric_id].append((created_at, value))
+            for metric_id, values in raw.items():
+                xs = [epoch_seconds(t) for t, _ in values]
+                ys = [v for _, v in values]
+                by_metric[metric_id] = [
+                    SeriesPoint(t=values[i][0], value=values[i][1]) for i in lttb(xs, ys, points)
+                ]
+
+        catalog = await metric_catalog.get_many(self.session, by_metric)
+        series = []
+        for metric_id, metric_points in by_metric.items():
+            info = catalog.get(metric_id)
+            series.append(
+                MetricSeries(
+                    metric_id=metric_id,
+                    name=info.name if info else None,
+                    scale_type=info.scale_type if info else None,
+                    points=metric_points,
+                )
+            )
+        return TimelineSeriesResponse(
+            user_id=user_id,
+            period_start=from_date,
+            period_end=to_date,
+            method=method,
+            bucket_seconds=bucket_seconds,
+            series=series,
+        )
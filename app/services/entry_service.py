@@ -1,53 +1,225 @@
 """Chrono entry and timeline service."""
 
+from collections.abc import Iterable
 from datetime import datetime
 
+from app.core.config import settings
+from app.core.idempotency import IdempotencyClaim, StoredResponse
+from app.core.pagination import KeysetCursor
 from app.db.session import DbSession
-from app.domain.schemas import ChronoEntryCreate, ChronoEntryResponse
+from app.db.unit_of_work import apply_python_defaults
+from app.domain.models import ChronoEntry, Evidence
+from app.domain.values import typed_value
+from app.domain.schemas import (
+    ChronoEntryBatchItemResult,
+    ChronoEntryBatchResponse,
+    ChronoEntryCreate,
+    ChronoEntryResponse,
+    ChronoEntryRow,
+)
 from app.repositories.entry_repository import EntryRepository
-from app.repositories.metric_repository import MetricRepository
+from app.repositories.watermark_repository import WatermarkRepository
+from app.services.ingestion_queue import ingestion_queue
+from app.services.metric_catalog import MetricInfo, metric_catalog
 
 
 class EntryService:
     """Handles chrono entries and timeline."""
 
     def __init__(self, session: DbSession):
+        self.session = session
         self.entry_repo = EntryRepository(session)
-        self.metric_repo = MetricRepository(session)
+        self.watermarks = WatermarkRepository(session)
+
+    @staticmethod
+    def _build(
+        user_id: str, data: ChronoEntryCreate, metric: MetricInfo, clinic_id: str | None
+    ) -> tuple[ChronoEntry, list[Evidence]]:
+        """Entry and evidence objects with ids and defaults filled, not yet added."""
+        value = str(data.value)
+        entry = apply_python_defaults(
+            ChronoEntry(
+                user_id=user_id,
+                metric_id=data.metric_id,
+                value=value,
+                confidence=data.confidence,
+                is_hypothesis=data.is_hypothesis,
+                source_message_id=data.source_message_id,
+                clinic_id=clinic_id,
+                **typed_value(metric.scale_type, value)._asdict(),
+            )
+        )
+        evidence = [
+            apply_python_defaults(
+                Evidence(
+                    chrono_entry_id=entry.id,
+                    chrono_entry_created_at=entry.created_at,
+                    text_snippet=e.text_snippet,
+                    message_id=e.message_id,
+                )
+            )
+            for e in data.evidence
+        ]
+        return entry, evidence
+
+    async def _metric(self, metric_id: str) -> MetricInfo:
+        metric = await metric_catalog.get(self.session, metric_id)
+        if not metric:
+            raise ValueError(f"Metric {metric_id} not found")
+        return metric
+
+    async def _missing_messages(self, items: Iterable[ChronoEntryCreate]) -> set[str]:
+        """
+        Referenced chat message ids that do not exist, checked up front so a
+        bad reference is reported instead of failing the INSERT.
+        """
+        referenced = {m for item in items for m in item.message_ids()}
+        if not referenced:
+            return set()
+        return referenced - await self.entry_repo.get_existing_message_ids(referenced)
+
+    async def _check_messages(self, data: ChronoEntryCreate) -> None:
+        missing = await self._missing_messages([data])
+        if missing:
+            raise ValueError(f"Message {min(missing)} not found")
+
+    async def _release_connection(self) -> None:
+        """
+        End the request's transaction (opened only by a catalog miss) so no
+        pooled connection is held while waiting for the ingestion flusher,
+        which needs one of its own.
+        """
+        if self.session.in_transaction():
+            await self.session.commit()
 
     async def submit_entry(
         self, user_id: str, data: ChronoEntryCreate, clinic_id: str | None = None
     ) -> ChronoEntryResponse:
-        """Submit a new chrono entry."""
-        metric = await self.metric_repo.get_by_id(data.metric_id)
-        if not metric:
-            raise ValueError(f"Metric {data.metric_id} not found")
+        """
+        Submit a new chrono entry. With INGESTION_MODE=queued the entry is
+        written by the ingestion queue's next batch and this returns once
+        that batch committed.
+        """
+        metric = await self._metric(data.metric_id)
+        await self._check_messages(data)
+        if settings.INGESTION_MODE == "queued":
+            entry, evidence = self._build(user_id, data, metric, clinic_id)
+            await self._release_connection()
+            await ingestion_queue.submit(entry, evidence)
+            return ChronoEntryResponse.model_validate(entry)
 
+        value = str(data.value)
         entry = await self.entry_repo.create_entry(
             user_id=user_id,
             metric_id=data.metric_id,
-            value=str(data.value),
+            value=value,
             confidence=data.confidence,
             is_hypothesis=data.is_hypothesis,
             source_message_id=data.source_message_id,
             clinic_id=clinic_id,
+            typed=typed_value(metric.scale_type, value),
         )
+        if data.evidence:
+            await self.entry_repo.add_evidence_many(
+                entry, [(e.text_snippet, e.message_id) for e in data.evidence]
+            )
+        await self.watermarks.bump(user_id, entry.created_at)
         return ChronoEntryResponse.model_validate(entry)
 
-    async def get_timeline(
+    async def submit_entry_claimed(
+        self,
+        user_id: str,
+        data: ChronoEntryCreate,
+        claim: IdempotencyClaim,
+        clinic_id: str | None = None,
+    ) -> tuple[StoredResponse, bool]:
+        """
+        Queued submit whose Idempotency-Key is reserved and completed in the
+        ingestion batch transaction, together with the entry. Returns the
+        response to send and whether it is a replay of an earlier request.
+        """
+        metric = await self._metric(data.metric_id)
+        await self._check_messages(data)
+        entry, evidence = self._build(user_id, data, metric, clinic_id)
+        response = StoredResponse(
+            fingerprint=claim.fingerprint,
+            status_code=200,
+            body=ChronoEntryResponse.model_validate(entry).model_dump_json().encode(),
+            expires_at=claim.expires_at.timestamp(),
+        )
+        await self._release_connection()
+        return await ingestion_queue.submit(entry, evidence, claim, response)
+
+    async def submit_batch(
+        self, user_id: str, items: list[ChronoEntryCreate], clinic_id: str | None = None
+    ) -> ChronoEntryBatchResponse:
+        """
+        Submit many entries at once. Metrics are resolved from the catalog and all
+        valid entries and their evidence are written with multi-row INSERTs;
+        items with an unknown metric or chat message are reported individually.
+        """
+        known = await metric_catalog.get_many(self.session, (i.metric_id for i in items))
+        missing_messages = await self._missing_messages(items)
+        entries: list[ChronoEntry] = []
+        evidence: list[Evidence] = []
+        results: list[ChronoEntryBatchItemResult] = []
+        for index, item in enumerate(items):
+            metric = known.get(item.metric_id)
+            error = None
+            if metric is None:
+                error = f"Metric {item.metric_id} not found"
+            elif missing := item.message_ids() & missing_messages:
+                error = f"Message {min(missing)} not found"
+            if error is not None:
+                results.append(ChronoEntryBatchItemResult(index=index, status="error", error=error))
+                continue
+            entry, entry_evidence = self._build(user_id, item, metric, clinic_id)
+            entries.append(entry)
+            evidence.extend(entry_evidence)
+            results.append(
+                ChronoEntryBatchItemResult(
+                    index=index, status="created", entry=ChronoEntryResponse.model_validate(entry)
+                )
+            )
+        await self.entry_repo.insert_many(entries, evidence)
+        if entries:
+            await self.watermarks.bump(user_id, max(e.created_at for e in entries))
+        return ChronoEntryBatchResponse(
+            created=len(entries), failed=len(items) - len(entries), results=results
+        )
+
+    async def get_timeline_page(
         self,
         user_id: str,
         limit: int = 100,
         offset: int = 0,
         from_date: datetime | None = None,
         to_date: datetime | None = None,
-    ) -> list[ChronoEntryResponse]:
-        """Get timeline for a user."""
-        entries = await self.entry_repo.get_timeline(
+        cursor: str | None = None,
+        include_evidence: bool = False,
+    ) -> tuple[list[ChronoEntryRow], str | None]:
+        """
+        Get one timeline page as column rows (serialized by the route without
+        building models) and the cursor for the next one (None on the last
+        page). include_evidence embeds each entry's evidence, loaded for the
+        whole page in a second query. Raises InvalidCursor for a malformed cursor.
+        """
+        after = KeysetCursor.decode(cursor) if cursor else None
+        entries = await self.entry_repo.get_timeline_rows(
             user_id=user_id,
-            limit=limit,
+            limit=limit + 1,
             offset=offset,
             from_date=from_date,
             to_date=to_date,
+            after=after,
         )
-        return [ChronoEntryResponse.model_validate(e) for e in entries]
+        next_cursor = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            last = entries[-1]
+            next_cursor = KeysetCursor(created_at=last["created_at"], id=last["id"]).encode()
+        if include_evidence:
+            evidence = await self.entry_repo.get_evidence_rows([e["id"] for e in entries])
+            for entry in entries:
+                entry["evidence"] = evidence.get(entry["id"], [])
+        return entries, next_cursor
@@ -0,0 +1,115 @@
+"""Streaming timeline export (NDJSON / CSV)."""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any, Literal
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import ROUTE_CLASS_EXPORT, read_session
+from app.domain.models import ChronoEntry
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+EXPORT_COLUMNS = (
+    ChronoEntry.id,
+    ChronoEntry.metric_id,
+    ChronoEntry.value,
+    ChronoEntry.value_num,
+    ChronoEntry.value_bool,
+    ChronoEntry.value_code,
+    ChronoEntry.confidence,
+    ChronoEntry.is_hypothesis,
+    ChronoEntry.source_message_id,
+    ChronoEntry.created_at,
+)
+FIELD_NAMES = [c.key for c in EXPORT_COLUMNS]
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class ExportService:
+    """
+    Streams a user's entries oldest first, one encoded chunk per fetched batch.
+
+    Rows come from a server-side cursor as plain column tuples (no ORM
+    objects, no Pydantic models), so memory stays flat regardless of size.
+    The session must stay open while the stream is consumed.
+    """
+
+    def __init__(self, session: AsyncSession, batch_size: int = 1000):
+        self.session = session
+        self.batch_size = batch_size
+
+    async def stream(
+        self,
+        user_id: str,
+        fmt: ExportFormat = "ndjson",
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
+        encode = self._encode_csv if fmt == "csv" else self._encode_ndjson
+        if fmt == "csv":
+            yield self._encode_csv([FIELD_NAMES])  # headers go out before the query runs
+
+        q = (
+            select(*EXPORT_COLUMNS)
+            .where(ChronoEntry.user_id == str(user_id))
+            .order_by(ChronoEntry.created_at.asc(), ChronoEntry.id.asc())
+            .execution_options(yield_per=self.batch_size)
+        )
+        if from_date:
+            q = q.where(ChronoEntry.created_at >= from_date)
+        if to_date:
+            q = q.where(ChronoEntry.created_at <= to_date)
+
+        result = await self.session.stream(q)
+        async for rows in result.partitions():
+            yield encode(rows)
+
+    @staticmethod
+    def _encode_ndjson(rows: Sequence[Sequence[Any]]) -> bytes:
+        lines = (
+            json.dumps(dict(zip(FIELD_NAMES, row)), default=_json_default, separators=(",", ":"))
+            for row in rows
+        )
+        return ("\n".join(lines) + "\n").encode()
+
+    @staticmethod
+    def _encode_csv(rows: Sequence[Sequence[Any]]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(
+            [v.isoformat() if isinstance(v, datetime) else v for v in row] for row in rows
+        )
+        return buffer.getvalue().encode()
+
+
+async def stream_user_export(
+    reader_id: str,
+    user_id: str,
+    fmt: ExportFormat = "ndjson",
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Export generator for a StreamingResponse body. It owns its read session
+    (export statement timeout), since request dependencies are closed before
+    the body is sent. reader_id picks the replica like get_read_db.
+    """
+    async with read_session(reader_id, ROUTE_CLASS_EXPORT) as session:
+        async for chunk in ExportService(session).stream(user_id, fmt, from_date, to_date):
+            yield chunk
@@ -0,0 +1,261 @@
+"""Write-behind ingestion: single-entry submissions coalesced into batch commits."""
+
+import asyncio
+import contextvars
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.idempotency import IdempotencyClaim, IdempotencyKeyInUse, StoredResponse
+from app.db.session import ROUTE_CLASS_WRITE, AsyncSessionLocal, replica_router
+from app.domain.models import ChronoEntry, Evidence
+from app.domain.series import as_utc
+from app.repositories.entry_repository import EntryRepository
+from app.repositories.idempotency_repository import IdempotencyRepository
+from app.repositories.watermark_repository import WatermarkRepository
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionUnavailable(RuntimeError):
+    """The queue is full (backpressure) or shutting down."""
+
+
+@dataclass(slots=True)
+class PendingWrite:
+    entry: ChronoEntry
+    evidence: list[Evidence]
+    future: asyncio.Future = field(repr=False)
+    # Idempotency-Key reserved and completed (with response) in the batch transaction
+    claim: IdempotencyClaim | None = None
+    response: StoredResponse | None = None
+
+
+# Result of one write: (response to send, replayed) for claimed writes, else None
+WriteResult = tuple[StoredResponse, bool] | None
+
+
+def _inserted(result: WriteResult | BaseException) -> bool:
+    """The write's entry went into the batch (not a replay, not an error)."""
+    return result is None or (isinstance(result, tuple) and not result[1])
+
+
+_STOP = object()
+
+
+class EntryIngestionQueue:
+    """
+    Bounded in-process queue of validated entries with one background flusher.
+
+    The flusher takes whatever is queued, waits flush_interval_ms for more
+    when the batch is not full, and writes up to batch_max_rows entries
+    (plus evidence and watermarks) in one transaction. submit() returns only
+    after that transaction committed, so an acknowledged entry is durable;
+    a batch that fails is retried entry by entry and only the failing
+    submissions see the error. A full queue rejects new entries after
+    enqueue_timeout_ms instead of growing.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_max_rows: int,
+        flush_interval_ms: float,
+        enqueue_timeout_ms: float,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    ):
+        self.max_size = max_size
+        self.batch_max_rows = batch_max_rows
+        self.flush_interval = flush_interval_ms / 1000
+        self.enqueue_timeout = enqueue_timeout_ms / 1000
+        self.session_factory = session_factory
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = False
+        self.batches = 0
+        self.rows = 0
+        self.failures = 0
+        self.rejected = 0
+        self.flush_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the flusher (idempotent)."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._closing = False
+        # A fresh context keeps request-scoped state (query stats) out of the flusher
+        self._task = asyncio.create_task(
+            self._run(), name="entry-ingestion-flusher", context=contextvars.Context()
+        )
+
+    async def stop(self) -> None:
+        """Stop accepting entries, flush everything queued, then end the flusher."""
+        if not self.running:
+            return
+        self._closing = True
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def submit(
+        self,
+        entry: ChronoEntry,
+        evidence: list[Evidence],
+        claim: IdempotencyClaim | None = None,
+        response: StoredResponse | None = None,
+    ) -> WriteResult:
+        """
+        Queue an entry (ids already assigned) and wait until its batch committed.
+
+        With a claim, the Idempotency-Key is reserved and completed with
+        response in the same batch transaction as the entry, and the result
+        is (response, False). If the key was already completed, the entry is
+        dropped and the result is (stored response, True). A key still in
+        progress elsewhere raises IdempotencyKeyInUse.
+        """
+        if self._closing:
+            raise IngestionUnavailable("Ingestion is shutting down")
+        if not self.running:
+            self.start()
+        write = PendingWrite(
+            entry, evidence, asyncio.get_running_loop().create_future(), claim, response
+        )
+        try:
+            await asyncio.wait_for(self._queue.put(write), timeout=self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise IngestionUnavailable("Ingestion queue is full") from None
+        return await write.future
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            item = await queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            if queue.qsize() < self.batch_max_rows - 1 and self.flush_interval > 0:
+                await asyncio.sleep(self.flush_interval)
+            stopping = False
+            while len(batch) < self.batch_max_rows and not queue.empty():
+                item = queue.get_nowait()
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+            if stopping:
+                # Submits that were already waiting for space when stop() ran
+                rest = []
+                while not queue.empty():
+                    rest.append(queue.get_nowait())
+                for start in range(0, len(rest), self.batch_max_rows):
+                    await self._flush(rest[start : start + self.batch_max_rows])
+                return
+
+    async def _flush(self, batch: list[PendingWrite]) -> None:
+        start = time.perf_counter()
+        try:
+            results = await self._write(batch)
+        except Exception as exc:
+            if len(batch) > 1:
+                logger.warning("Ingestion batch of %d failed, retrying one by one: %s", len(batch), exc)
+                for write in batch:
+                    await self._flush([write])
+                return
+            self.failures += 1
+            logger.exception("Ingestion of entry %s failed", batch[0].entry.id)
+            if not batch[0].future.done():
+                batch[0].future.set_exception(exc)
+            return
+        self.batches += 1
+        self.rows += sum(1 for r in results if _inserted(r))
+        self.flush_ms += (time.perf_counter() - start) * 1000
+        for write, result in zip(batch, results):
+            if write.future.done():
+                continue
+            if isinstance(result, BaseException):
+                write.future.set_exception(result)
+            else:
+                write.future.set_result(result)
+
+    async def _claim(
+        self, keys: IdempotencyRepository, write: PendingWrite
+    ) -> WriteResult | BaseException:
+        """Reserve and complete a write's key; a used key yields its stored response."""
+        claim = write.claim
+        if await keys.reserve(claim.user_id, claim.key, claim.fingerprint, claim.expires_at):
+            await keys.complete(
+                claim.user_id, claim.key, write.response.status_code, write.response.body
+            )
+            return write.response, False
+        row = await keys.get(claim.user_id, claim.key)
+        if row is None or row.status_code is None:
+            return IdempotencyKeyInUse(claim.key)
+        stored = StoredResponse(
+            fingerprint=row.fingerprint,
+            status_code=row.status_code,
+            body=row.response_body,
+            expires_at=as_utc(row.expires_at).timestamp(),
+        )
+        return stored, True
+
+    async def _write(self, batch: list[PendingWrite]) -> list[WriteResult | BaseException]:
+        async with self.session_factory(info={"route_class": ROUTE_CLASS_WRITE}) as session:
+            keys = IdempotencyRepository(session)
+            results: list[WriteResult | BaseException] = []
+            accepted: list[PendingWrite] = []
+            for write in batch:
+                result = None if write.claim is None else await self._claim(keys, write)
+                results.append(result)
+                # Writes whose key was already used are answered, not inserted again
+                if _inserted(result):
+                    accepted.append(write)
+
+            latest: dict[str, datetime] = {}
+            for write in accepted:
+                user_id, created_at = write.entry.user_id, write.entry.created_at
+                if user_id not in latest or created_at > latest[user_id]:
+                    latest[user_id] = created_at
+            await EntryRepository(session).insert_many(
+                [w.entry for w in accepted], [e for w in accepted for e in w.evidence]
+            )
+            watermarks = WatermarkRepository(session)
+            for user_id, created_at in latest.items():
+                await watermarks.bump(user_id, created_at)
+            await session.commit()
+        for user_id in latest:
+            replica_router.mark_write(user_id)
+        return results
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "mode": settings.INGESTION_MODE,
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": self.max_size,
+            "batches": self.batches,
+            "rows": self.rows,
+            "avg_batch_rows": round(self.rows / self.batches, 1) if self.batches else 0.0,
+            "avg_flush_ms": round(self.flush_ms / self.batches, 2) if self.batches else 0.0,
+            "failures": self.failures,
+            "rejected": self.rejected,
+        }
+
+
+ingestion_queue = EntryIngestionQueue(
+    max_size=settings.INGESTION_QUEUE_MAX_SIZE,
+    batch_max_rows=settings.INGESTION_BATCH_MAX_ROWS,
+    flush_interval_ms=settings.INGESTION_FLUSH_INTERVAL_MS,
+    enqueue_timeout_ms=settings.INGESTION_ENQUEUE_TIMEOUT_MS,
+)
@@ -0,0 +1,190 @@
+"""In-process catalog of metric definitions."""
+
+import asyncio
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.domain.models import MetricDefinition
+from app.repositories.metric_repository import MetricRepository
+
+
+@dataclass(frozen=True, slots=True)
+class MetricInfo:
+    """Immutable copy of a metric definition, safe to share across requests."""
+
+    id: str
+    name: str
+    scale_type: str
+    canonical_id: str | None
+    clinic_id: str | None
+
+    @classmethod
+    def from_model(cls, metric: MetricDefinition) -> "MetricInfo":
+        return cls(
+            id=metric.id,
+            name=metric.name,
+            scale_type=metric.scale_type,
+            canonical_id=metric.canonical_id,
+            clinic_id=metric.clinic_id,
+        )
+
+
+class MetricCatalog:
+    """
+    Versioned snapshot of all metric definitions.
+
+    Lookups are dictionary reads. The snapshot is reloaded when older than
+    ``ttl_seconds`` or after invalidate() (called when a session that wrote
+    metric definitions commits); a reload builds a new dict and swaps it in,
+    bumping ``version``, so readers never see a partial load.
+    An id missing from the snapshot (created since the last load) falls back
+    to the database and is added to the current snapshot; ids not found there
+    either are remembered as absent for ``negative_ttl_seconds``.
+    """
+
+    MAX_ABSENT_IDS = 10_000
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        negative_ttl_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._metrics: dict[str, MetricInfo] = {}
+        self._absent_until: dict[str, float] = {}
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.reloads = 0
+
+    def is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return self.ttl_seconds > 0 and self._clock() - self._loaded_at >= self.ttl_seconds
+
+    def invalidate(self) -> None:
+        """Force a reload on the next lookup (call after changing definitions)."""
+        self._loaded_at = None
+        self._absent_until = {}
+
+    def clear(self) -> None:
+        """Drop the snapshot entirely."""
+        self._metrics = {}
+        self._absent_until = {}
+        self._loaded_at = None
+
+    async def load(self, session: AsyncSession) -> int:
+        """Replace the snapshot with every definition in the database."""
+        metrics = await MetricRepository(session).get_all()
+        self._metrics = {m.id: MetricInfo.from_model(m) for m in metrics}
+        self._absent_until = {}
+        self._loaded_at = self._clock()
+        self.version += 1
+        self.reloads += 1
+        return len(self._metrics)
+
+    async def _ensure_fresh(self, session: AsyncSession) -> None:
+        if not self.is_stale():
+            return
+        async with self._lock:
+            if self.is_stale():  # another request may have reloaded meanwhile
+                await self.load(session)
+
+    async def get(self, session: AsyncSession, metric_id: str) -> MetricInfo | None:
+        """Definition by id, or None if it does not exist."""
+        found = await self.get_many(session, [metric_id])
+        return found.get(str(metric_id))
+
+    async def get_many(
+        self, session: AsyncSession, metric_ids: Iterable[str]
+    ) -> dict[str, MetricInfo]:
+        """Definitions for the ids that exist, keyed by id."""
+        await self._ensure_fresh(session)
+        metrics = self._metrics
+        now = self._clock()
+        found: dict[str, MetricInfo] = {}
+        missing: list[str] = []
+        for metric_id in {str(m) for m in metric_ids}:
+            info = metrics.get(metric_id)
+            if info is not None:
+                found[metric_id] = info
+            elif self._absent_until.get(metric_id, 0.0) > now:
+                self.negative_hits += 1
+            else:
+                missing.append(metric_id)
+        self.hits += len(found)
+        if missing:
+            self.misses += len(missing)
+            fetched = await MetricRepository(session).get_by_ids(missing)
+            if fetched:
+                updated = dict(self._metrics)
+                for metric in fetched:
+                    info = MetricInfo.from_model(metric)
+                    updated[info.id] = found[info.id] = info
+                self._metrics = updated
+            self._remember_absent([m for m in missing if m not in found], now)
+        return found
+
+    def _remember_absent(self, metric_ids: list[str], now: float) -> None:
+        if not metric_ids or self.negative_ttl_seconds <= 0:
+            return
+        absent = self._absent_until
+        if len(absent) >= self.MAX_ABSENT_IDS:
+            absent = {k: t for k, t in absent.items() if t > now}
+        until = now + self.negative_ttl_seconds
+        for metric_id in metric_ids:
+            absent[metric_id] = until
+        self._absent_until = absent
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "size": len(self._metrics),
+            "hits": self.hits,
+            "misses": self.misses,
+            "negative_hits": self.negative_hits,
+            "reloads": self.reloads,
+            "stale": self.is_stale(),
+        }
+
+
+metric_catalog = MetricCatalog(
+    ttl_seconds=settings.METRIC_CATALOG_TTL_SECONDS,
+    negative_ttl_seconds=settings.METRIC_CATALOG_NEGATIVE_TTL_SECONDS,
+)
+
+_CHANGED = "metric_definitions_changed"
+
+
+@event.listens_for(MetricDefinition, "after_insert")
+@event.listens_for(MetricDefinition, "after_update")
+@event.listens_for(MetricDefinition, "after_delete")
+def _note_metric_change(mapper, connection, target: MetricDefinition) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info[_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    """ORM writes to metric definitions reload this process's catalog once durable."""
+    if session.info.pop(_CHANGED, False):
+        metric_catalog.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_metric_change(session: Session) -> None:
+    session.info.pop(_CHANGED, None)
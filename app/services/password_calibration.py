@@ -0,0 +1,47 @@
+"""bcrypt cost calibration shared by every worker of a deployment."""
+
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.hashing import measure_password_cost
+from app.core.security import get_bcrypt_rounds, set_bcrypt_rounds
+from app.db.session import ROUTE_CLASS_WRITE, AsyncSessionLocal
+from app.repositories.bcrypt_calibration_repository import BcryptCalibrationRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def calibrate_password_hashing(
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+) -> int:
+    """
+    Make the deployment's bcrypt cost the cost for new hashes.
+
+    The first worker to start under BCRYPT_CALIBRATION_ID measures the cost
+    and stores it; every other worker adopts the stored value, so all of them
+    hash (and rehash on login) to one cost. If the cost cannot be shared,
+    the configured BCRYPT_ROUNDS is kept, which is also the same everywhere.
+    """
+    calibration_id = settings.BCRYPT_CALIBRATION_ID
+    try:
+        async with session_factory(info={"route_class": ROUTE_CLASS_WRITE}) as session:
+            rounds = await BcryptCalibrationRepository(session).get(calibration_id)
+        if rounds is None:
+            # Measured without holding a connection; concurrent workers race on the insert
+            measured = await measure_password_cost()
+            async with session_factory(info={"route_class": ROUTE_CLASS_WRITE}) as session:
+                rounds = await BcryptCalibrationRepository(session).claim(calibration_id, measured)
+                await session.commit()
+    except Exception:
+        logger.exception("bcrypt calibration failed, keeping %d rounds", get_bcrypt_rounds())
+        return get_bcrypt_rounds()
+    set_bcrypt_rounds(rounds)
+    logger.info(
+        "bcrypt cost for %r is %d rounds (target %.0fms)",
+        calibration_id,
+        rounds,
+        settings.BCRYPT_TARGET_MS,
+    )
+    return rounds
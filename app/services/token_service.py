@@ -0,0 +1,94 @@
+"""Token issuing and refresh-token rotation service."""
+
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+
+from app.core.config import settings
+from app.core.refresh_store import InMemoryRefreshTokenStore, RefreshTokenStore
+from app.core.security import create_access_token, create_refresh_token, decode_token
+from app.db.session import DbSession
+from app.domain.enums import RefreshTokenStatus
+from app.domain.schemas import Token
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+
+
+class RefreshTokenReused(ValueError):
+    """An already-exchanged refresh token was presented; its family is now revoked."""
+
+
+@dataclass
+class RefreshMetrics:
+    """Counters for token issuing and rotation."""
+
+    issued: int = 0
+    rotated: int = 0
+    rejected: int = 0
+    reuse_detected: int = 0
+
+    def snapshot(self) -> dict[str, int]:
+        return asdict(self)
+
+
+refresh_metrics = RefreshMetrics()
+_memory_store = InMemoryRefreshTokenStore()
+
+
+def get_refresh_token_store(session: DbSession) -> RefreshTokenStore:
+    """Store selected by REFRESH_TOKEN_STORE."""
+    if settings.REFRESH_TOKEN_STORE == "memory":
+        return _memory_store
+    return RefreshTokenRepository(session)
+
+
+class TokenService:
+    """
+    Issues access/refresh pairs and exchanges refresh tokens.
+
+    Every exchange rotates the refresh token: the presented token is consumed
+    and a new one from the same family is issued. Presenting a consumed token
+    again revokes the whole family (the token was likely stolen).
+    """
+
+    def __init__(self, session: DbSession, store: RefreshTokenStore | None = None):
+        self.store = store if store is not None else get_refresh_token_store(session)
+
+    def issue(self, user_id: str, family_id: str | None = None) -> Token:
+        """Issue a new token pair (new refresh family unless given)."""
+        refresh_metrics.issued += 1
+        return Token(
+            access_token=create_access_token(user_id),
+            refresh_token=create_refresh_token(user_id, family_id=family_id),
+        )
+
+    async def refresh(self, refresh_token: str) -> Token:
+        """
+        Exchange a refresh token for a new pair.
+        Raises ValueError if invalid or revoked, RefreshTokenReused on reuse.
+        """
+        payload = decode_token(refresh_token)
+        if not payload or payload.get("type") != "refresh":
+            refresh_metrics.rejected += 1
+            raise ValueError("Invalid or expired refresh token")
+        user_id = payload.get("sub")
+        jti = payload.get("jti")
+        family_id = payload.get("fam")
+        if not user_id or not jti or not family_id:
+            refresh_metrics.rejected += 1
+            raise ValueError("Invalid refresh token payload")
+
+        expires_at = datetime.fromtimestamp(payload["exp"], UTC)
+        result = await self.store.consume(jti, family_id, expires_at)
+        if result == RefreshTokenStatus.REUSED:
+            refresh_metrics.reuse_detected += 1
+            # Any token of the family expires within one refresh lifetime from now
+            family_expires = datetime.now(UTC) + timedelta(
+                days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
+            )
+            await self.store.revoke_family(family_id, family_expires)
+            raise RefreshTokenReused("Refresh token reuse detected")
+        if result == RefreshTokenStatus.REVOKED:
+            refresh_metrics.rejected += 1
+            raise ValueError("Refresh token revoked")
+
+        refresh_metrics.rotated += 1
+        return self.issue(user_id, family_id=family_id)
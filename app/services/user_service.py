@@ -1,11 +1,20 @@
 """User and authentication service."""
 
-from app.core.security import get_password_hash, verify_password
+import logging
+
+from app.core.hashing import (
+    HashingPoolSaturated,
+    hash_password_async,
+    verify_password_async,
+)
+from app.core.security import password_needs_rehash
 from app.db.session import DbSession
 from app.domain.schemas import RegisterRequest
 from app.domain.models import User
 from app.repositories.user_repository import UserRepository
 
+logger = logging.getLogger(__name__)
+
 
 class UserService:
     """Handles user registration and auth."""
@@ -22,7 +31,7 @@ class UserService:
             raise ValueError("User with this email already exists")
         return await self.repo.create(
             email=data.email,
-            hashed_password=get_password_hash(data.password),
+            hashed_password=await hash_password_async(data.password),
             name=data.name,
             age=data.age,
             language=data.language,
@@ -33,9 +42,18 @@ class UserService:
     async def authenticate(self, email: str, password: str) -> User:
         """
         Authenticate user. Returns User.
-        Raises ValueError if credentials invalid.
+        Raises ValueError if credentials invalid, HashingPoolSaturated if
+        the hashing pool is full.
+        Hashes stored with a different bcrypt cost are transparently rehashed.
         """
         user = await self.repo.get_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await verify_password_async(password, user.hashed_password):
             raise ValueError("Invalid email or password")
+        if password_needs_rehash(user.hashed_password):
+            try:
+                rehashed = await hash_password_async(password)
+            except HashingPoolSaturated:
+                logger.info("Skipping rehash for user %s: hashing pool saturated", user.id)
+            else:
+                await self.repo.update_password_hash(user, rehashed)
         return user
@@ -0,0 +1,278 @@
+"""Startup warm-up: connections, compiled statements, schemas, clients and caches."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.hashing import get_password_hasher
+from app.core.security import get_token_codec
+from app.db.session import (
+    ROUTE_CLASS_READ,
+    ROUTE_CLASS_WRITE,
+    AsyncSessionLocal,
+    ReadOnlySessionLocal,
+    engine,
+    replica_engines,
+)
+from app.repositories import (
+    AccessLinkRepository,
+    EntryRepository,
+    RefreshTokenRepository,
+    TaskRepository,
+    UserRepository,
+    WatermarkRepository,
+)
+from app.repositories.idempotency_repository import IdempotencyRepository
+from app.repositories.metric_repository import MetricRepository
+from app.services.metric_catalog import metric_catalog
+
+logger = logging.getLogger(__name__)
+
+# Never matches a row; used to run hot queries for their compile/prepare cost only
+NIL_ID = "00000000-0000-0000-0000-000000000000"
+
+
+@dataclass
+class Readiness:
+    """Whether warm-up has finished, and how each step went."""
+
+    ready: bool = False
+    steps: dict[str, dict[str, Any]] = field(default_factory=dict)
+    failed: list[str] = field(default_factory=list)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"ready": self.ready, "failed": self.failed, "steps": self.steps}
+
+
+readiness = Readiness()
+
+
+async def open_connections(db_engine: AsyncEngine, count: int) -> int:
+    """Check out count connections at once so the pool holds them afterwards."""
+    size = getattr(db_engine.pool, "size", None)
+    if callable(size):
+        count = min(count, size())
+    if count <= 0:
+        return 0
+
+    async def _open() -> None:
+        try:
+            async with db_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                # Hold the connection until all are open so each one is distinct
+                await barrier.wait()
+        except BaseException:
+            # Release the others parked on the barrier (and their connections)
+            await barrier.abort()
+            raise
+
+    barrier = asyncio.Barrier(count)
+    async with asyncio.TaskGroup() as group:
+        for _ in range(count):
+            group.create_task(_open())
+    return count
+
+
+async def compile_hot_statements(db_engine: AsyncEngine) -> int:
+    """Run the hot repository reads once so their SQL is compiled and prepared."""
+    async with ReadOnlySessionLocal(bind=db_engine, info={"route_class": ROUTE_CLASS_READ}) as session:
+        users = UserRepository(session)
+        links = AccessLinkRepository(session)
+        tasks = TaskRepository(session)
+        warm: list[Callable[[], Awaitable[Any]]] = [
+            lambda: users.get_by_id(NIL_ID),
+            lambda: users.get_by_email(""),
+            lambda: EntryRepository(session).get_timeline_rows(NIL_ID),
+            lambda: MetricRepository(session).get_by_id(NIL_ID),
+            lambda: tasks.get_rows_by_user(NIL_ID),
+            lambda: tasks.get_by_id(NIL_ID),
+            lambda: links.get_active_link(NIL_ID, NIL_ID),
+            lambda: links.get_client_rows_for_specialist(NIL_ID),
+            lambda: links.find_token_by_hash(""),
+            lambda: WatermarkRepository(session).get(NIL_ID),
+        ]
+        for query in warm:
+            await query()
+    return len(warm)
+
+
+async def purge_refresh_revocations(db_engine: AsyncEngine) -> int:
+    """Drop expired refresh-token revocations (keeps the reuse check index small)."""
+    if settings.REFRESH_TOKEN_STORE != "database":
+        return 0
+    async with AsyncSessionLocal(bind=db_engine, info={"route_class": ROUTE_CLASS_WRITE}) as session:
+        removed = await RefreshTokenRepository(session).purge_expired()
+        await session.commit()
+    return removed
+
+
+async def purge_idempotency_keys(db_engine: AsyncEngine) -> int:
+    """Drop expired Idempotency-Key records."""
+    async with AsyncSessionLocal(bind=db_engine, info={"route_class": ROUTE_CLASS_WRITE}) as session:
+        removed = await IdempotencyRepository(session).purge_expired()
+        await session.commit()
+    return removed
+
+
+async def load_metric_catalog(db_engine: AsyncEngine) -> int:
+    """Load all metric definitions into the in-process catalog."""
+    async with ReadOnlySessionLocal(bind=db_engine, info={"route_class": ROUTE_CLASS_READ}) as session:
+        return await metric_catalog.load(session)
+
+
+def build_openapi(app: FastAPI) -> int:
+    """Generate the OpenAPI document, building every request/response schema."""
+    return len(app.openapi()["paths"])
+
+
+def create_llm_clients() -> int:
+    """Instantiate the LLM service singletons (creates their HTTP clients)."""
+    from app.llm.access_target_resolver_service import AccessTargetResolverService
+    from app.llm.query_recognizer_service import QueryRecognizerService
+    from app.llm.security_gate_service import SecurityGateService
+    from app.llm.turn_manager_service import TurnManagerService
+
+    services = (
+        TurnManagerService,
+        SecurityGateService,
+        QueryRecognizerService,
+        AccessTargetResolverService,
+    )
+    for service in services:
+        service()
+    return len(services)
+
+
+async def prime_process_caches() -> int:
+    """Build the token codec and start the password hashing workers."""
+    get_token_codec()
+    await get_password_hasher().run(abs, 0)
+    return 2
+
+
+async def _step(name: str, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    entry: dict[str, Any] = {}
+    try:
+        result = fn()
+        if asyncio.iscoroutine(result):
+            result = await result
+        entry["result"] = result
+    except Exception as exc:
+        logger.warning("Warm-up step %s failed: %s", name, exc)
+        entry["error"] = str(exc)
+    entry["ms"] = round((time.perf_counter() - start) * 1000, 2)
+    readiness.steps[name] = entry
+
+
+def _pending(steps: dict[str, Callable[[], Any]]) -> list[str]:
+    """Steps that have not succeeded yet (failed, or never reached before a timeout)."""
+    return [
+        name for name in steps if name not in readiness.steps or "error" in readiness.steps[name]
+    ]
+
+
+async def _run_steps(steps: dict[str, Callable[[], Any]], names: list[str]) -> bool:
+    """Run the named steps in order within WARMUP_TIMEOUT_SECONDS; False on timeout."""
+
+    async def _run() -> None:
+        for name in names:
+            await _step(name, steps[name])
+
+    try:
+        await asyncio.wait_for(_run(), timeout=settings.WARMUP_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning("Warm-up timed out after %ss", settings.WARMUP_TIMEOUT_SECONDS)
+        return False
+    return True
+
+
+async def retry_until_ready(
+    steps: dict[str, Callable[[], Any]], initial_delay: float = 1.0
+) -> None:
+    """
+    Re-run the steps that have not succeeded, with exponential backoff capped
+    at WARMUP_RETRY_MAX_SECONDS, and mark the process ready once all have.
+    """
+    delay = initial_delay
+    while pending := _pending(steps):
+        await asyncio.sleep(delay)
+        await _run_steps(steps, pending)
+        readiness.failed = _pending(steps)
+        delay = min(delay * 2, settings.WARMUP_RETRY_MAX_SECONDS)
+    readiness.ready = True
+    logger.info("Warm-up retry succeeded, process ready")
+
+
+async def run_housekeeping(db_engine: AsyncEngine) -> None:
+    """Purge expired rows; recorded in the steps but never blocks readiness."""
+    await _step("refresh_revocations_purged", lambda: purge_refresh_revocations(db_engine))
+    await _step("idempotency_keys_purged", lambda: purge_idempotency_keys(db_engine))
+
+
+_background: set[asyncio.Task] = set()
+
+
+def _spawn(coro: Awaitable[None], name: str) -> None:
+    task = asyncio.create_task(coro, name=name)
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+async def stop_warm_up() -> None:
+    """Cancel warm-up retries and housekeeping still running (shutdown)."""
+    tasks = list(_background)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def warm_up(app: FastAPI, db_engine: AsyncEngine | None = None) -> Readiness:
+    """
+    Run all warm-up steps, then mark the process ready if they all succeeded.
+
+    The phase is bounded by WARMUP_TIMEOUT_SECONDS. Steps that failed or did
+    not run before the timeout are retried in the background with backoff,
+    and /ready answers 503 until they succeed (unless WARMUP_FAIL_OPEN is
+    set). Purges of expired rows run in the background and do not count.
+    """
+    db_engine = db_engine or engine
+    connections = settings.WARMUP_DB_CONNECTIONS
+
+    steps: dict[str, Callable[[], Any]] = {
+        "db_connections": lambda: open_connections(db_engine, connections)
+    }
+    for i, replica in enumerate(replica_engines if db_engine is engine else []):
+        steps[f"db_replica_connections_{i}"] = lambda r=replica: open_connections(r, connections)
+    steps.update(
+        compiled_statements=lambda: compile_hot_statements(db_engine),
+        metric_catalog=lambda: load_metric_catalog(db_engine),
+        openapi_paths=lambda: build_openapi(app),
+        llm_clients=create_llm_clients,
+        process_caches=prime_process_caches,
+    )
+
+    start = time.perf_counter()
+    completed = await _run_steps(steps, list(steps))
+    failed = _pending(steps)
+    readiness.ready = settings.WARMUP_FAIL_OPEN or not failed
+    readiness.failed = failed
+    logger.info(
+        "Warm-up finished in %.0fms (ready=%s, failed=%s, timed_out=%s)",
+        (time.perf_counter() - start) * 1000,
+        readiness.ready,
+        failed,
+        not completed,
+    )
+    if failed:
+        _spawn(retry_until_ready(steps), "warm-up-retry")
+    _spawn(run_housekeeping(db_engine), "warm-up-housekeeping")
+    return readiness
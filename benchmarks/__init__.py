@@ -0,0 +1 @@
+"""Micro-benchmarks for hot request paths (run as modules, not collected by pytest)."""
@@ -0,0 +1,71 @@
+"""
+Micro-benchmark: list endpoint serialization, ORM + response models vs column rows.
+
+Run: python -m benchmarks.bench_serialization [--rows 500] [--number 50]
+"""
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from app.api.serialization import list_adapter
+from app.domain.models import ChronoEntry
+from app.domain.schemas import ChronoEntryResponse, ChronoEntryRow
+
+
+def _rows(count: int) -> list[dict]:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    user_id, metric_id = str(uuid4()), str(uuid4())
+    return [
+        {
+            "id": str(uuid4()),
+            "user_id": user_id,
+            "metric_id": metric_id,
+            "value": str(i % 10),
+            "confidence": 0.9,
+            "is_hypothesis": False,
+            "source_message_id": None,
+            "created_at": base + timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+
+def orm_models(rows: list[dict]) -> bytes:
+    """Previous path: ORM objects, model_validate, then FastAPI's response_model pass."""
+    entries = [ChronoEntry(**row) for row in rows]
+    models = [ChronoEntryResponse.model_validate(e) for e in entries]
+    adapter = TypeAdapter(list[ChronoEntryResponse])
+    payload = adapter.dump_python(adapter.validate_python(models), mode="json")
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def column_rows(rows: list[dict]) -> bytes:
+    """Fast path: row dicts straight to JSON bytes in pydantic-core."""
+    return list_adapter(ChronoEntryRow).dump_json(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    assert json.loads(orm_models(rows)) == json.loads(column_rows(rows))
+    results = {
+        name: min(timeit.repeat(lambda fn=fn: fn(rows), number=args.number, repeat=5)) / args.number
+        for name, fn in {"orm+models": orm_models, "rows": column_rows}.items()
+    }
+    base = results["orm+models"]
+    print(f"{'path':<11} {'ms/response':>12} {'x':>6}  ({args.rows} rows)")
+    for name, seconds in results.items():
+        print(f"{name:<11} {seconds * 1000:>12.3f} {base / seconds:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Refresh-token revocation store (consumed jti / revoked families).
+
+Revises: 002_unified_user
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "003_refresh_revocations"
+down_revision: Union[str, None] = "002_unified_user"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "refresh_token_revocations",
+        sa.Column("token_key", sa.Text(), primary_key=True),
+        sa.Column("kind", sa.Text(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_refresh_token_revocations_expires_at",
+        "refresh_token_revocations",
+        ["expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("refresh_token_revocations")
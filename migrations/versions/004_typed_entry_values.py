@@ -0,0 +1,48 @@
+"""Typed value columns on chrono_entries (value_num / value_bool / value_code).
+
+Adds nullable columns (metadata-only in PostgreSQL) and backfills them in
+chunks ordered by id, each committed on its own, so the table is never
+locked for the whole backfill (app.db.typed_backfill). Ids are random
+uuid4s, so rows the running code inserts meanwhile can fall behind the
+chunk cursor: passes repeat until one updates nothing. Rows inserted after
+the migration by code that predates the typed columns are not covered;
+run ``python -m app.db.typed_backfill`` once the new code is deployed.
+
+Revises: 003_refresh_revocations
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.db.typed_backfill import BACKFILL_SET, backfill_typed_values
+
+revision: str = "004_typed_entry_values"
+down_revision: Union[str, None] = "003_refresh_revocations"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("chrono_entries", sa.Column("value_num", sa.Float(), nullable=True))
+    op.add_column("chrono_entries", sa.Column("value_bool", sa.Boolean(), nullable=True))
+    op.add_column("chrono_entries", sa.Column("value_code", sa.Text(), nullable=True))
+
+    if context.is_offline_mode():
+        op.execute(
+            f"UPDATE chrono_entries c SET {BACKFILL_SET} "
+            "FROM metric_definitions m WHERE m.id = c.metric_id"
+        )
+        return
+
+    # Chunked online backfill: each chunk commits separately
+    with op.get_context().autocommit_block():
+        backfill_typed_values(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_column("chrono_entries", "value_code")
+    op.drop_column("chrono_entries", "value_bool")
+    op.drop_column("chrono_entries", "value_num")
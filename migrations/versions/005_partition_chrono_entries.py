@@ -0,0 +1,130 @@
+"""Range-partition chrono_entries by month on created_at.
+
+The table is rebuilt as a partitioned table with monthly partitions
+(chrono_entries_YYYY_MM, UTC bounds) from the oldest row up to three months
+ahead, plus a default partition. The primary key becomes (id, created_at),
+and evidence loses its FK to chrono_entries: PostgreSQL only allows FKs
+that reference a partitioned table's full key. Later months are created by
+app.db.partitions. Rows are copied inside the migration transaction, so
+writes to chrono_entries block until it commits.
+Revises: 004_typed_entry_values
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "005_partition_chrono_entries"
+down_revision: Union[str, None] = "004_typed_entry_values"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, user_id, metric_id, value, value_num, value_bool, value_code, "
+    "confidence, is_hypothesis, source_message_id, clinic_id, created_at"
+)
+
+INDEXES = (
+    ("ix_chrono_entries_user_id", "user_id"),
+    ("ix_chrono_entries_metric_id", "metric_id"),
+    ("ix_chrono_entries_source_message_id", "source_message_id"),
+    ("ix_chrono_entries_clinic_id", "clinic_id"),
+    ("ix_chrono_user_created", "user_id, created_at"),
+)
+
+CREATE_TABLE = """
+CREATE TABLE chrono_entries (
+    id uuid NOT NULL,
+    user_id uuid NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    metric_id uuid NOT NULL REFERENCES metric_definitions (id) ON DELETE RESTRICT,
+    value text NOT NULL,
+    value_num double precision,
+    value_bool boolean,
+    value_code text,
+    confidence double precision NOT NULL DEFAULT 1.0,
+    is_hypothesis boolean NOT NULL DEFAULT false,
+    source_message_id uuid REFERENCES chat_messages (id) ON DELETE SET NULL,
+    clinic_id uuid,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    CONSTRAINT chrono_entries_pkey PRIMARY KEY ({primary_key})
+) {partition_clause}
+"""
+
+
+def _drop_indexes() -> None:
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _create_indexes() -> None:
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON chrono_entries ({columns})")
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE chrono_entries RENAME TO chrono_entries_legacy")
+    op.execute(
+        "ALTER TABLE chrono_entries_legacy RENAME CONSTRAINT chrono_entries_pkey "
+        "TO chrono_entries_legacy_pkey"
+    )
+    _drop_indexes()
+    op.execute("ALTER TABLE evidence DROP CONSTRAINT IF EXISTS evidence_chrono_entry_id_fkey")
+
+    op.execute(
+        CREATE_TABLE.format(
+            primary_key="id, created_at", partition_clause="PARTITION BY RANGE (created_at)"
+        )
+    )
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            m date;
+            last_month date := (date_trunc('month', now() AT TIME ZONE 'UTC')
+                                + interval '{MONTHS_AHEAD} months')::date;
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(created_at), now()) AT TIME ZONE 'UTC')::date
+              INTO m FROM chrono_entries_legacy;
+            WHILE m <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF chrono_entries FOR VALUES FROM (%L) TO (%L)',
+                    'chrono_entries_' || to_char(m, 'YYYY_MM'),
+                    to_char(m, 'YYYY-MM-DD') || ' 00:00:00+00',
+                    to_char(m + interval '1 month', 'YYYY-MM-DD') || ' 00:00:00+00'
+                );
+                m := (m + interval '1 month')::date;
+            END LOOP;
+        END $$;
+        """
+    )
+    op.execute("CREATE TABLE chrono_entries_default PARTITION OF chrono_entries DEFAULT")
+
+    op.execute(
+        f"INSERT INTO chrono_entries ({COLUMNS}) "
+        f"SELECT {COLUMNS.replace('created_at', 'coalesce(created_at, now())')} "
+        "FROM chrono_entries_legacy"
+    )
+    op.execute("DROP TABLE chrono_entries_legacy")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE chrono_entries RENAME TO chrono_entries_partitioned")
+    op.execute(
+        "ALTER TABLE chrono_entries_partitioned RENAME CONSTRAINT chrono_entries_pkey "
+        "TO chrono_entries_partitioned_pkey"
+    )
+    _drop_indexes()
+
+    op.execute(CREATE_TABLE.format(primary_key="id", partition_clause=""))
+    op.execute(f"INSERT INTO chrono_entries ({COLUMNS}) SELECT {COLUMNS} FROM chrono_entries_partitioned")
+    # Drops every attached partition; detached (archived) ones are left alone
+    op.execute("DROP TABLE chrono_entries_partitioned")
+    _create_indexes()
+    op.execute(
+        "ALTER TABLE evidence ADD CONSTRAINT evidence_chrono_entry_id_fkey "
+        "FOREIGN KEY (chrono_entry_id) REFERENCES chrono_entries (id) ON DELETE CASCADE"
+    )
@@ -0,0 +1,40 @@
+"""Per-user change watermarks (ETag source for timeline and summary).
+
+Revises: 005_partition_chrono_entries
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "006_user_change_watermarks"
+down_revision: Union[str, None] = "005_partition_chrono_entries"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_change_watermarks",
+        sa.Column(
+            "user_id",
+            sa.UUID(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("last_entry_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Existing users start at their newest entry so the first ETag is stable
+    op.execute(
+        """
+        INSERT INTO user_change_watermarks (user_id, version, last_entry_at)
+        SELECT user_id, 1, max(created_at) FROM chrono_entries GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_change_watermarks")
@@ -0,0 +1,47 @@
+"""Restore evidence -> chrono_entries FK through the partitioned key.
+
+Migration 005 dropped the FK because a partitioned table can only be
+referenced by its full primary key. evidence now carries the entry's
+created_at, and (chrono_entry_id, chrono_entry_created_at) references
+chrono_entries (id, created_at) with ON DELETE CASCADE again. Evidence
+whose entry was deleted while the FK was missing is removed first.
+
+Revises: 007_idempotency_keys
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "008_evidence_entry_fk"
+down_revision: Union[str, None] = "007_idempotency_keys"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "evidence",
+        sa.Column("chrono_entry_created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        "UPDATE evidence e SET chrono_entry_created_at = c.created_at "
+        "FROM chrono_entries c WHERE c.id = e.chrono_entry_id"
+    )
+    op.execute("DELETE FROM evidence WHERE chrono_entry_created_at IS NULL")
+    op.alter_column("evidence", "chrono_entry_created_at", nullable=False)
+    op.create_foreign_key(
+        "evidence_chrono_entry_fkey",
+        "evidence",
+        "chrono_entries",
+        ["chrono_entry_id", "chrono_entry_created_at"],
+        ["id", "created_at"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("evidence_chrono_entry_fkey", "evidence", type_="foreignkey")
+    op.drop_column("evidence", "chrono_entry_created_at")
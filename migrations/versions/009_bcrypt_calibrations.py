@@ -0,0 +1,33 @@
+"""bcrypt cost chosen by start-up calibration, shared by all workers.
+
+Revises: 008_evidence_entry_fk
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "009_bcrypt_calibrations"
+down_revision: Union[str, None] = "008_evidence_entry_fk"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bcrypt_calibrations",
+        sa.Column("calibration_id", sa.Text(), primary_key=True),
+        sa.Column("rounds", sa.Integer(), nullable=False),
+        sa.Column(
+            "calibrated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("bcrypt_calibrations")
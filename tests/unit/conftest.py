@@ -9,7 +9,10 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.core.idempotency import idempotency_cache
+from app.core.rate_limit import auth_email_limiter, auth_ip_limiter
 from app.db.base import Base
+from app.services.metric_catalog import metric_catalog
 from app.main import app
 
 # Use in-memory SQLite for tests (or override with TEST_DATABASE_URL)
@@ -24,6 +27,28 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_auth_rate_limits() -> Generator[None, None, None]:
+    """Each test starts with full auth rate-limit buckets."""
+    auth_ip_limiter.clear()
+    auth_email_limiter.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_metric_catalog() -> Generator[None, None, None]:
+    """Each test starts with an empty metric catalog (databases differ per test)."""
+    metric_catalog.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_idempotency_cache() -> Generator[None, None, None]:
+    """Each test starts without cached Idempotency-Key responses."""
+    idempotency_cache.clear()
+    yield
+
+
 @pytest_asyncio.fixture
 async def db_engine():
     """Create async engine for tests."""
@@ -57,3 +82,25 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
+
+
+@pytest_asyncio.fixture
+async def entries_session() -> AsyncGenerator[AsyncSession, None]:
+    """SQLite session with only the entry tables (the full schema needs PostgreSQL types)."""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    tables = [
+        Base.metadata.tables[name]
+        for name in (
+            "metric_definitions",
+            "chat_messages",
+            "chrono_entries",
+            "evidence",
+            "user_change_watermarks",
+            "idempotency_keys",
+        )
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+    async with AsyncSession(engine, expire_on_commit=False, autoflush=False) as session:
+        yield session
+    await engine.dispose()
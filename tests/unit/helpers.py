@@ -0,0 +1,15 @@
+"""Constants and fakes shared by unit tests."""
+
+# Letters keep SQLite from storing the hex form as a number
+USER_ID = "aaaaaaaa-1111-1111-1111-111111111111"
+METRIC_ID = "bbbbbbbb-2222-2222-2222-222222222222"
+
+
+class FakeClock:
+    """Manually advanced clock for code that takes a ``clock`` callable."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
@@ -0,0 +1,65 @@
+"""Change watermarks and conditional GET tests."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from starlette.requests import Request
+
+from app.api.conditional import etag_matches, make_etag, user_etag
+from app.domain.models import MetricDefinition
+from app.domain.schemas import ChronoEntryCreate
+from app.repositories.watermark_repository import WatermarkRepository
+from app.services.analytics_service import AnalyticsService
+from app.services.entry_service import EntryService
+from tests.unit.helpers import METRIC_ID, USER_ID
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/entries/timeline",
+            "query_string": b"limit=10",
+            "headers": headers,
+        }
+    )
+
+
+def test_etag_matching_is_weak_and_handles_lists():
+    etag = make_etag(3, "timeline")
+    assert etag.startswith('W/"3-')
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(make_etag(4, "timeline"), etag)
+
+
+def test_summary_start_snaps_to_minute():
+    now = datetime(2026, 3, 1, 12, 30, 45, 123456)
+    assert AnalyticsService.summary_start(7, now) == datetime(2026, 2, 22, 12, 30)
+
+
+@pytest.mark.asyncio
+async def test_entry_writes_bump_watermark_and_invalidate_etag(entries_session):
+    entries_session.add(MetricDefinition(id=METRIC_ID, name="mood", scale_type="int"))
+    await entries_session.commit()
+    service = EntryService(entries_session)
+    assert await WatermarkRepository(entries_session).get(USER_ID) == (0, None)
+
+    etag, not_modified = await user_etag(entries_session, _request(), USER_ID)
+    assert not_modified is None
+    _, not_modified = await user_etag(entries_session, _request(etag), USER_ID)
+    assert not_modified is not None and not_modified.status_code == 304
+
+    await service.submit_entry(USER_ID, ChronoEntryCreate(metric_id=METRIC_ID, value=5))
+    await service.submit_batch(USER_ID, [ChronoEntryCreate(metric_id=METRIC_ID, value=6)])
+    await entries_session.commit()
+
+    version, last_entry_at = await WatermarkRepository(entries_session).get(USER_ID)
+    assert version == 2
+    assert datetime.utcnow() - last_entry_at.replace(tzinfo=None) < timedelta(minutes=1)
+    _, not_modified = await user_etag(entries_session, _request(etag), USER_ID)
+    assert not_modified is None
@@ -0,0 +1,55 @@
+"""Engine pool configuration and statistics tests."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.pool import InstrumentedAsyncQueuePool, get_pool_stats
+from app.db.session import engine_options
+
+
+def test_engine_options_pool_settings():
+    """Postgres URLs get the configured pool and statement cache."""
+    options = engine_options("postgresql+asyncpg://u:p@db/app")
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+    assert options["pool_size"] == settings.DATABASE_POOL_SIZE
+    assert options["connect_args"]["statement_cache_size"] == settings.DATABASE_STATEMENT_CACHE_SIZE
+
+
+def test_engine_options_pgbouncer_disables_prepared_statements(monkeypatch):
+    """PgBouncer mode turns off both asyncpg statement caches."""
+    monkeypatch.setattr(settings, "DATABASE_PGBOUNCER", True)
+    connect_args = engine_options("postgresql+asyncpg://u:p@db/app")["connect_args"]
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+
+def test_engine_options_sqlite_keeps_default_pool():
+    """SQLite (tests) keeps SQLAlchemy's default pool."""
+    assert "poolclass" not in engine_options("sqlite+aiosqlite:///:memory:")
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_checkouts(tmp_path):
+    """Checked-out connections and checkout timing are reported."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=2,
+        max_overflow=1,
+    )
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            stats = get_pool_stats(engine)
+            assert stats["checked_out"] == 1
+            assert stats["size"] == 2
+        stats = get_pool_stats(engine)
+        assert stats["checked_out"] == 0
+        assert stats["checkouts"] == 1
+        assert stats["wait_ms_max"] >= 0
+    finally:
+        await engine.dispose()
@@ -0,0 +1,123 @@
+"""Batch entry submission tests."""
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import event, func, select
+
+from app.core.config import settings
+from app.domain.enums import ScaleType
+from app.domain.models import ChatMessage, ChronoEntry, Evidence, MetricDefinition
+from app.domain.schemas import ChronoEntryCreate
+from app.services.entry_service import EntryService
+from app.services.metric_catalog import metric_catalog
+from tests.unit.helpers import METRIC_ID, USER_ID
+
+MISSING_METRIC_ID = "cccccccc-3333-3333-3333-333333333333"
+MESSAGE_ID = "eeeeeeee-5555-5555-5555-555555555555"
+MISSING_MESSAGE_ID = "ffffffff-6666-6666-6666-666666666666"
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_writes_with_one_insert_per_table(entries_session):
+    """Metrics come from the catalog; one INSERT for entries, one for evidence."""
+    entries_session.add(MetricDefinition(id=METRIC_ID, name="mood", scale_type=ScaleType.INT.value))
+    await entries_session.commit()
+    await metric_catalog.load(entries_session)
+
+    statements: list[str] = []
+    sync_engine = entries_session.bind.sync_engine
+    event.listen(
+        sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    items = [
+        ChronoEntryCreate(
+            metric_id=METRIC_ID if i != 2 else MISSING_METRIC_ID,
+            value=i,
+            evidence=[{"text_snippet": f"note {i}"}, {"text_snippet": "again"}],
+        )
+        for i in range(5)
+    ]
+    result = await EntryService(entries_session).submit_batch(USER_ID, items)
+    await entries_session.commit()
+
+    assert (result.created, result.failed) == (4, 1)
+    assert [r.status for r in result.results] == ["created", "created", "error", "created", "created"]
+    assert result.results[3].entry.value == "3"
+    # Only the unknown metric falls back to the database
+    assert sum(s.startswith("SELECT") for s in statements) == 1
+    assert sum(s.startswith("INSERT INTO chrono_entries") for s in statements) == 1
+    assert sum(s.startswith("INSERT INTO evidence") for s in statements) == 1
+    assert await entries_session.scalar(select(func.count()).select_from(ChronoEntry)) == 4
+    assert await entries_session.scalar(select(func.count()).select_from(Evidence)) == 8
+    # The int scale fills the typed numeric column
+    values = await entries_session.scalars(select(ChronoEntry.value_num).order_by(ChronoEntry.value_num))
+    assert values.all() == [0.0, 1.0, 3.0, 4.0]
+
+
+@pytest.mark.asyncio
+async def test_evidence_references_entry_by_full_partition_key(entries_session):
+    """Single and batch submits store the entry's created_at next to its id."""
+    entries_session.add(MetricDefinition(id=METRIC_ID, name="mood", scale_type=ScaleType.INT.value))
+    await entries_session.commit()
+    service = EntryService(entries_session)
+    item = ChronoEntryCreate(metric_id=METRIC_ID, value=1, evidence=[{"text_snippet": "note"}])
+
+    await service.submit_entry(USER_ID, item)
+    await service.submit_batch(USER_ID, [item])
+    await entries_session.commit()
+
+    rows = (
+        await entries_session.execute(
+            select(Evidence.chrono_entry_created_at, ChronoEntry.created_at).join(
+                ChronoEntry, ChronoEntry.id == Evidence.chrono_entry_id
+            )
+        )
+    ).all()
+    assert len(rows) == 2
+    assert all(evidence_at == entry_at for evidence_at, entry_at in rows)
+    foreign_key = next(
+        fk
+        for fk in Evidence.__table__.foreign_key_constraints
+        if fk.name == "evidence_chrono_entry_fkey"
+    )
+    assert [e.target_fullname for e in foreign_key.elements] == [
+        "chrono_entries.id",
+        "chrono_entries.created_at",
+    ]
+    assert foreign_key.ondelete == "CASCADE"
+
+
+def test_evidence_list_is_capped():
+    """An entry carries at most ENTRY_EVIDENCE_MAX_ITEMS evidence snippets."""
+    snippets = [{"text_snippet": "note"}] * (settings.ENTRY_EVIDENCE_MAX_ITEMS + 1)
+    with pytest.raises(ValidationError):
+        ChronoEntryCreate(metric_id=METRIC_ID, value=1, evidence=snippets)
+
+
+@pytest.mark.asyncio
+async def test_unknown_message_references_fail_only_their_items(entries_session):
+    """Missing chat messages are reported per item instead of failing the INSERT."""
+    entries_session.add(MetricDefinition(id=METRIC_ID, name="mood", scale_type=ScaleType.INT.value))
+    entries_session.add(ChatMessage(id=MESSAGE_ID, user_id=USER_ID, role="user", content="hi"))
+    await entries_session.commit()
+    service = EntryService(entries_session)
+    items = [
+        ChronoEntryCreate(metric_id=METRIC_ID, value=1, source_message_id=MESSAGE_ID),
+        ChronoEntryCreate(metric_id=METRIC_ID, value=2, source_message_id=MISSING_MESSAGE_ID),
+        ChronoEntryCreate(
+            metric_id=METRIC_ID,
+            value=3,
+            evidence=[{"text_snippet": "note", "message_id": MISSING_MESSAGE_ID}],
+        ),
+    ]
+
+    result = await service.submit_batch(USER_ID, items)
+    await entries_session.commit()
+
+    assert [r.status for r in result.results] == ["created", "error", "error"]
+    assert result.results[1].error == f"Message {MISSING_MESSAGE_ID} not found"
+    assert await entries_session.scalar(select(func.count()).select_from(ChronoEntry)) == 1
+    with pytest.raises(ValueError, match="not found"):
+        await service.submit_entry(USER_ID, items[2])
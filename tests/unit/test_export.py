@@ -0,0 +1,51 @@
+"""Streaming timeline export tests."""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.domain.models import ChronoEntry
+from app.services.export_service import FIELD_NAMES, ExportService
+from tests.unit.helpers import METRIC_ID, USER_ID
+
+
+async def _seed(session, count: int) -> None:
+    base = datetime(2026, 1, 1)
+    session.add_all(
+        ChronoEntry(
+            id=str(uuid4()),
+            user_id=USER_ID,
+            metric_id=METRIC_ID,
+            value=str(i),
+            value_num=float(i),
+            created_at=base + timedelta(hours=i),
+        )
+        for i in range(count)
+    )
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_streams_in_batches(entries_session):
+    """One chunk per fetched batch, rows oldest first."""
+    await _seed(entries_session, 7)
+    chunks = [c async for c in ExportService(entries_session, batch_size=3).stream(USER_ID)]
+    assert len(chunks) == 3
+    rows = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+    assert [r["value"] for r in rows] == [str(i) for i in range(7)]
+    assert rows[0]["created_at"].startswith("2026-01-01T00:00:00")
+
+
+@pytest.mark.asyncio
+async def test_csv_export_sends_header_first(entries_session):
+    await _seed(entries_session, 2)
+    stream = ExportService(entries_session).stream(USER_ID, "csv")
+    header = await stream.__anext__()
+    assert header.decode().strip() == ",".join(FIELD_NAMES)
+    body = b"".join([c async for c in stream]).decode()
+    rows = list(csv.reader(io.StringIO(body)))
+    assert [r[FIELD_NAMES.index("value_num")] for r in rows] == ["0.0", "1.0"]
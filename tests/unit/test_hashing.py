@@ -0,0 +1,111 @@
+"""Password hashing pool tests."""
+
+import asyncio
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.core.hashing import (
+    HashingPoolSaturated,
+    PasswordHasher,
+    calibrate_bcrypt_rounds,
+    default_hash_workers,
+)
+
+
+@pytest.mark.asyncio
+async def test_hasher_runs_work_in_pool():
+    """Work submitted to the pool returns its result."""
+    hasher = PasswordHasher(workers=1, max_pending=2)
+    try:
+        assert await hasher.run(abs, -3) == 3
+        stats = hasher.stats()
+        assert stats["completed"] == 1
+        assert stats["pending"] == 0
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hasher_rejects_when_saturated():
+    """Jobs beyond max_pending are rejected instead of queued."""
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    try:
+        slow = asyncio.create_task(hasher.run(time.sleep, 0.2))
+        await asyncio.sleep(0)
+        assert hasher.stats()["saturation"] == 1.0
+        with pytest.raises(HashingPoolSaturated):
+            await hasher.run(abs, -1)
+        await slow
+        stats = hasher.stats()
+        assert stats["rejected"] == 1
+        assert stats["peak_pending"] == 1
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hasher_rebuilds_a_broken_pool():
+    """A dead worker fails its job, is not counted as completed, and the next job gets a new pool."""
+    hasher = PasswordHasher(workers=1, max_pending=2)
+    try:
+        with pytest.raises(BrokenProcessPool):
+            await hasher.run(os._exit, 1)
+        assert await hasher.run(abs, -3) == 3
+        stats = hasher.stats()
+        assert (stats["completed"], stats["failed"], stats["pending"]) == (1, 1, 0)
+    finally:
+        hasher.shutdown()
+
+
+def test_default_hash_workers_split_cores_across_app_workers():
+    assert default_hash_workers(8, 1) == 8
+    assert default_hash_workers(8, 4) == 2
+    assert default_hash_workers(2, 4) == 1
+
+
+def test_calibration_picks_highest_cost_within_target():
+    """Cost doubling per round: 10 -> 50ms, 11 -> 100ms, 12 -> 200ms, 13 -> 400ms."""
+    measure = lambda rounds: 50.0 * 2 ** (rounds - 10)  # noqa: E731
+    assert calibrate_bcrypt_rounds(250, 10, 14, measure=measure) == 12
+    assert calibrate_bcrypt_rounds(10, 10, 14, measure=measure) == 10
+    assert calibrate_bcrypt_rounds(10_000, 10, 14, measure=measure) == 14
+
+
+def test_calibration_steps_down_when_estimate_is_optimistic():
+    """A confirming probe over target lowers the cost."""
+    measure = lambda rounds: 50.0 if rounds == 10 else 1_000.0  # noqa: E731
+    assert calibrate_bcrypt_rounds(250, 10, 14, measure=measure) == 10
+
+
+@pytest.mark.asyncio
+async def test_calibration_is_shared_by_all_workers(monkeypatch):
+    """The first worker's measured cost is stored; later workers adopt it without measuring."""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from app.core.security import get_bcrypt_rounds, set_bcrypt_rounds
+    from app.db.base import Base
+    from app.services import password_calibration
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        table = Base.metadata.tables["bcrypt_calibrations"]
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=[table]))
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    measured = iter([11, 13])
+
+    async def measure() -> int:
+        return next(measured)
+
+    monkeypatch.setattr(password_calibration, "measure_password_cost", measure)
+    original = get_bcrypt_rounds()
+    try:
+        assert await password_calibration.calibrate_password_hashing(factory) == 11
+        # A worker on a differently loaded core would have measured 13
+        assert await password_calibration.calibrate_password_hashing(factory) == 11
+        assert get_bcrypt_rounds() == 11
+    finally:
+        set_bcrypt_rounds(original)
+        await engine.dispose()
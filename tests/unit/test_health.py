@@ -14,3 +14,15 @@ async def test_health_check(client: AsyncClient):
     data = response.json()
     assert "status" in data
     assert "database" in data
+
+
+@pytest.mark.asyncio
+async def test_metrics(client: AsyncClient):
+    """Metrics endpoint reports pool and cache statistics without a DB."""
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["db_pool"]["pool"] == "InstrumentedAsyncQueuePool"
+    assert "checked_out" in data["db_pool"]
+    assert "saturation" in data["password_hasher"]
+    assert "hit_ratio" in data["token_cache"]
@@ -0,0 +1,91 @@
+"""Idempotency-Key tests."""
+
+import time
+
+import pytest
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from app.api.idempotency import REPLAYED_HEADER, run_idempotent
+from app.core.idempotency import (
+    IdempotencyCache,
+    StoredResponse,
+    idempotency_cache,
+    request_fingerprint,
+)
+from tests.unit.helpers import USER_ID
+
+
+class Created(BaseModel):
+    n: int
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> Created:
+        self.calls += 1
+        return Created(n=self.calls)
+
+
+def test_cache_evicts_lru_and_drops_expired():
+    cache = IdempotencyCache(max_size=2)
+    live = time.time() + 60
+    cache.put("a", StoredResponse("f", 200, b"1", live))
+    cache.put("b", StoredResponse("f", 200, b"2", live))
+    assert cache.get("a") is not None
+    cache.put("c", StoredResponse("f", 200, b"3", live))
+    assert cache.get("b") is None
+    cache.put("d", StoredResponse("f", 200, b"4", time.time() - 1))
+    assert cache.get("d") is None
+    assert cache.stats()["evictions"] == 2
+
+
+def test_fingerprint_depends_on_scope_and_body():
+    assert request_fingerprint("x", Created(n=1)) == request_fingerprint("x", Created(n=1))
+    assert request_fingerprint("x", Created(n=1)) != request_fingerprint("x", Created(n=2))
+    assert request_fingerprint("x", Created(n=1)) != request_fingerprint("y", Created(n=1))
+
+
+@pytest.mark.asyncio
+async def test_repeat_is_replayed_from_cache_then_table(entries_session):
+    operation = Counter()
+    fingerprint = request_fingerprint("t", Created(n=0))
+
+    first = await run_idempotent(entries_session, USER_ID, "k1", fingerprint, operation)
+    await entries_session.commit()
+    assert first.body == b'{"n":1}' and REPLAYED_HEADER not in first.headers
+
+    cached = await run_idempotent(entries_session, USER_ID, "k1", fingerprint, operation)
+    assert cached.body == b'{"n":1}' and cached.headers[REPLAYED_HEADER] == "true"
+    assert idempotency_cache.stats()["hits"] == 1
+
+    idempotency_cache.clear()  # another worker: only the table knows the key
+    from_table = await run_idempotent(entries_session, USER_ID, "k1", fingerprint, operation)
+    await entries_session.commit()
+    assert from_table.body == b'{"n":1}' and from_table.headers[REPLAYED_HEADER] == "true"
+    assert operation.calls == 1
+
+    with pytest.raises(HTTPException) as exc:
+        await run_idempotent(entries_session, USER_ID, "k1", "other", operation)
+    assert exc.value.status_code == 422
+
+    await run_idempotent(entries_session, USER_ID, None, fingerprint, operation)
+    assert operation.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_operation_releases_key(entries_session):
+    async def failing() -> Created:
+        raise HTTPException(status_code=400, detail="bad")
+
+    with pytest.raises(HTTPException):
+        await run_idempotent(entries_session, USER_ID, "k2", "f", failing)
+    await entries_session.rollback()
+    assert idempotency_cache.stats()["size"] == 0
+
+    operation = Counter()
+    response = await run_idempotent(entries_session, USER_ID, "k2", "f", operation)
+    await entries_session.commit()
+    assert response.body == b'{"n":1}' and operation.calls == 1
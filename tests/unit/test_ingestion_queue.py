@@ -0,0 +1,176 @@
+"""Write-behind ingestion queue tests."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.db.unit_of_work import apply_python_defaults
+from app.domain.models import ChronoEntry, Evidence
+from app.repositories.watermark_repository import WatermarkRepository
+from app.services.ingestion_queue import EntryIngestionQueue, IngestionUnavailable
+from tests.unit.helpers import METRIC_ID, USER_ID
+
+
+def _entry(entry_id: str | None = None) -> ChronoEntry:
+    return apply_python_defaults(
+        ChronoEntry(id=entry_id or str(uuid4()), user_id=USER_ID, metric_id=METRIC_ID, value="1")
+    )
+
+
+def _queue(entries_session, **overrides) -> EntryIngestionQueue:
+    options = dict(max_size=100, batch_max_rows=20, flush_interval_ms=5, enqueue_timeout_ms=100)
+    options.update(overrides)
+    factory = async_sessionmaker(entries_session.bind, expire_on_commit=False)
+    return EntryIngestionQueue(session_factory=factory, **options)
+
+
+async def _count(session, model) -> int:
+    return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_are_coalesced_into_batches(entries_session):
+    queue = _queue(entries_session)
+    entries = [_entry() for _ in range(50)]
+    evidence = [
+        [
+            apply_python_defaults(
+                Evidence(
+                    chrono_entry_id=e.id, chrono_entry_created_at=e.created_at, text_snippet="note"
+                )
+            )
+        ]
+        for e in entries
+    ]
+
+    await asyncio.gather(*(queue.submit(e, ev) for e, ev in zip(entries, evidence)))
+    await queue.stop()
+
+    assert queue.rows == 50
+    assert queue.batches <= 5
+    assert await _count(entries_session, ChronoEntry) == 50
+    assert await _count(entries_session, Evidence) == 50
+    version, _ = await WatermarkRepository(entries_session).get(USER_ID)
+    assert version == queue.batches
+
+
+@pytest.mark.asyncio
+async def test_failing_entry_does_not_fail_its_batch(entries_session):
+    existing = _entry()
+    entries_session.add(existing)
+    await entries_session.commit()
+    queue = _queue(entries_session)
+
+    duplicate = _entry(existing.id)
+    duplicate.created_at = existing.created_at
+    results = await asyncio.gather(
+        queue.submit(_entry(), []),
+        queue.submit(duplicate, []),
+        queue.submit(_entry(), []),
+        return_exceptions=True,
+    )
+    await queue.stop()
+
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], Exception)
+    assert queue.failures == 1
+    assert await _count(entries_session, ChronoEntry) == 3
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_and_stop_drains(entries_session):
+    release = asyncio.Event()
+    factory = async_sessionmaker(entries_session.bind, expire_on_commit=False)
+
+    def blocked_factory(**kwargs):
+        class Blocked:
+            async def __aenter__(self):
+                await release.wait()
+                self.session = factory(**kwargs)
+                return await self.session.__aenter__()
+
+            async def __aexit__(self, *exc):
+                return await self.session.__aexit__(*exc)
+
+        return Blocked()
+
+    queue = EntryIngestionQueue(
+        max_size=1,
+        batch_max_rows=1,
+        flush_interval_ms=0,
+        enqueue_timeout_ms=10,
+        session_factory=blocked_factory,
+    )
+    first = asyncio.create_task(queue.submit(_entry(), []))  # taken by the flusher, blocked
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(queue.submit(_entry(), []))  # fills the queue
+    await asyncio.sleep(0.01)
+    with pytest.raises(IngestionUnavailable):
+        await queue.submit(_entry(), [])
+    assert queue.rejected == 1
+
+    release.set()
+    await queue.stop()
+    await asyncio.gather(first, second)
+    assert await _count(entries_session, ChronoEntry) == 2
+    with pytest.raises(IngestionUnavailable):
+        await queue.submit(_entry(), [])
+
+
+@pytest.mark.asyncio
+async def test_keyed_submit_in_queued_mode_claims_key_in_batch(entries_session, monkeypatch):
+    """The key is reserved with the entry in the flusher's transaction, never on the request session."""
+    from fastapi import HTTPException
+
+    from app.api.idempotency import REPLAYED_HEADER, run_idempotent
+    from app.core.config import settings
+    from app.core.idempotency import idempotency_cache, request_fingerprint
+    from app.domain.models import IdempotencyKey, MetricDefinition
+    from app.domain.schemas import ChronoEntryCreate
+    from app.services import entry_service
+    from app.services.entry_service import EntryService
+
+    entries_session.add(MetricDefinition(id=METRIC_ID, name="mood", scale_type="int"))
+    await entries_session.commit()
+    queue = _queue(entries_session)
+    monkeypatch.setattr(settings, "INGESTION_MODE", "queued")
+    monkeypatch.setattr(entry_service, "ingestion_queue", queue)
+    factory = async_sessionmaker(entries_session.bind, expire_on_commit=False)
+
+    async def submit(key: str, value: int):
+        data = ChronoEntryCreate(metric_id=METRIC_ID, value=value)
+        async with factory() as request_session:
+            service = EntryService(request_session)
+
+            async def direct():
+                raise AssertionError("queued submits must not run in the request transaction")
+
+            response = await run_idempotent(
+                request_session,
+                USER_ID,
+                key,
+                request_fingerprint("entries.submit", data),
+                direct,
+                claimed=lambda claim: service.submit_entry_claimed(USER_ID, data, claim),
+            )
+            assert not request_session.in_transaction()
+            return response
+
+    first, concurrent = await asyncio.gather(submit("k1", 5), submit("k1", 5))
+    assert first.body == concurrent.body
+    assert [REPLAYED_HEADER in r.headers for r in (first, concurrent)].count(True) == 1
+
+    idempotency_cache.clear()  # another worker
+    again = await submit("k1", 5)
+    assert again.body == first.body and again.headers[REPLAYED_HEADER] == "true"
+    with pytest.raises(HTTPException) as exc:
+        await submit("k1", 6)
+    assert exc.value.status_code == 422
+    await queue.stop()
+
+    assert await _count(entries_session, ChronoEntry) == 1
+    stored = (await entries_session.execute(select(IdempotencyKey.response_body))).scalar_one()
+    assert stored == first.body
@@ -0,0 +1,98 @@
+"""Metric catalog cache tests."""
+
+import pytest
+from sqlalchemy import event
+
+from app.domain.enums import ScaleType
+from app.domain.models import MetricDefinition
+from app.services.metric_catalog import MetricCatalog, metric_catalog
+from tests.unit.helpers import METRIC_ID
+
+NEW_METRIC_ID = "dddddddd-4444-4444-4444-444444444444"
+
+
+@pytest.mark.asyncio
+async def test_catalog_serves_from_memory_and_reloads_on_ttl(entries_session):
+    """Lookups skip the DB until the TTL expires; reloads bump the version."""
+    entries_session.add(
+        MetricDefinition(id=METRIC_ID, name="sleep", scale_type=ScaleType.FLOAT.value, canonical_id=None)
+    )
+    await entries_session.commit()
+
+    now = [0.0]
+    catalog = MetricCatalog(ttl_seconds=60, clock=lambda: now[0])
+    statements: list[str] = []
+    event.listen(
+        entries_session.bind.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    assert (await catalog.get(entries_session, METRIC_ID)).scale_type == ScaleType.FLOAT.value
+    assert catalog.version == 1
+    loaded = len(statements)
+    for _ in range(5):
+        await catalog.get(entries_session, METRIC_ID)
+    assert len(statements) == loaded
+
+    now[0] = 61
+    await catalog.get(entries_session, METRIC_ID)
+    assert catalog.version == 2
+    assert catalog.stats()["hits"] == 7
+
+
+@pytest.mark.asyncio
+async def test_catalog_falls_back_to_db_for_new_metrics(entries_session):
+    """A metric created after the snapshot is found and cached; unknown ids are None."""
+    catalog = MetricCatalog(ttl_seconds=0)
+    await catalog.load(entries_session)
+    entries_session.add(MetricDefinition(id=NEW_METRIC_ID, name="mood", scale_type=ScaleType.INT.value))
+    await entries_session.commit()
+
+    assert (await catalog.get(entries_session, NEW_METRIC_ID)).name == "mood"
+    assert catalog.stats()["size"] == 1
+    assert await catalog.get(entries_session, METRIC_ID) is None
+    catalog.invalidate()
+    assert catalog.is_stale()
+
+
+@pytest.mark.asyncio
+async def test_committed_metric_writes_invalidate_the_catalog(entries_session, monkeypatch):
+    """Creating or changing a definition is visible at once, without waiting for the TTL."""
+    monkeypatch.setattr(metric_catalog, "negative_ttl_seconds", 60)
+    entries_session.add(MetricDefinition(id=METRIC_ID, name="sleep", scale_type=ScaleType.INT.value))
+    await entries_session.commit()
+    await metric_catalog.load(entries_session)
+    assert await metric_catalog.get(entries_session, NEW_METRIC_ID) is None
+
+    entries_session.add(MetricDefinition(id=NEW_METRIC_ID, name="mood", scale_type=ScaleType.INT.value))
+    metric = await entries_session.get(MetricDefinition, METRIC_ID)
+    metric.scale_type = ScaleType.BOOL.value
+    await entries_session.commit()
+
+    assert metric_catalog.is_stale()
+    assert (await metric_catalog.get(entries_session, NEW_METRIC_ID)).name == "mood"
+    assert (await metric_catalog.get(entries_session, METRIC_ID)).scale_type == ScaleType.BOOL.value
+
+
+@pytest.mark.asyncio
+async def test_unknown_ids_are_cached_negatively(entries_session):
+    """A missing id is looked up once per negative TTL, not on every request."""
+    now = [0.0]
+    catalog = MetricCatalog(ttl_seconds=0, negative_ttl_seconds=5, clock=lambda: now[0])
+    await catalog.load(entries_session)
+    statements: list[str] = []
+    event.listen(
+        entries_session.bind.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    for _ in range(3):
+        assert await catalog.get(entries_session, NEW_METRIC_ID) is None
+    assert len(statements) == 1
+    assert catalog.stats()["negative_hits"] == 2
+
+    now[0] = 6
+    await catalog.get(entries_session, NEW_METRIC_ID)
+    assert len(statements) == 2
@@ -0,0 +1,66 @@
+"""chrono_entries partition maintenance tests."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.partitions import (
+    _archive_evidence_sql,
+    add_months,
+    maintain_partitions,
+    months_to_create,
+    partition_name,
+    partitions_to_detach,
+)
+
+
+def test_months_to_create_spans_year_boundary():
+    months = months_to_create(date(2026, 11, 17), months_ahead=3)
+    assert [partition_name(m) for m in months] == [
+        "chrono_entries_2026_11",
+        "chrono_entries_2026_12",
+        "chrono_entries_2027_01",
+        "chrono_entries_2027_02",
+    ]
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_partitions_to_detach_respects_retention():
+    names = [
+        "chrono_entries_2025_12",
+        "chrono_entries_2026_07",
+        "chrono_entries_2026_08",
+        "chrono_entries_2026_09",
+        "chrono_entries_2026_10",
+        "chrono_entries_default",
+    ]
+    today = date(2026, 10, 17)
+    # Current month plus two full months back stay attached
+    assert partitions_to_detach(names, today, retention_months=2) == [
+        "chrono_entries_2025_12",
+        "chrono_entries_2026_07",
+    ]
+    assert partitions_to_detach(names, today, retention_months=0) == []
+
+
+def test_detach_archives_the_months_evidence_first():
+    """Evidence referencing a retired partition moves to evidence_YYYY_MM."""
+    create, copy, delete = _archive_evidence_sql(date(2025, 12, 1))
+    bounds = (
+        "chrono_entry_created_at >= '2025-12-01 00:00:00+00' "
+        "AND chrono_entry_created_at < '2026-01-01 00:00:00+00'"
+    )
+    # Repeatable: a second run finds the table and nothing left to move
+    assert create == 'CREATE TABLE IF NOT EXISTS "evidence_2025_12" (LIKE evidence INCLUDING DEFAULTS)'
+    assert copy == f'INSERT INTO "evidence_2025_12" SELECT * FROM evidence WHERE {bounds}'
+    assert delete == f"DELETE FROM evidence WHERE {bounds}"
+
+
+@pytest.mark.asyncio
+async def test_maintenance_is_noop_without_postgres():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        assert await maintain_partitions(engine) == {"created": [], "detached": []}
+    finally:
+        await engine.dispose()
@@ -0,0 +1,117 @@
+"""Per-request SQL accounting tests."""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.exceptions import query_budget_exception_handler
+from app.core.logging import log_request
+from app.db.query_stats import (
+    UNCOUNTED,
+    QueryBudgetExceeded,
+    QueryStats,
+    current_query_stats,
+    start_query_stats,
+    statement_shape,
+    stop_query_stats,
+)
+
+
+def test_statement_shape_ignores_bind_lists():
+    """IN lists and multi-row VALUES of any length share one shape."""
+    assert statement_shape("SELECT * FROM t WHERE id IN ($1, $2)") == statement_shape(
+        "SELECT *\n  FROM t WHERE id IN ($1, $2, $3)"
+    )
+    assert statement_shape("INSERT INTO t (a) VALUES (?), (?), (?)") == "INSERT INTO t (a) VALUES (?)"
+
+
+@pytest.mark.asyncio
+async def test_statements_counted_inside_request_scope():
+    """Statements run in child tasks and greenlets are attributed to the request."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 0"))  # outside any request: ignored
+        stats, token = start_query_stats()
+        try:
+
+            async def handler():
+                async with engine.connect() as conn:
+                    for i in range(4):
+                        await conn.execute(text("SELECT :i"), {"i": i})
+
+            await asyncio.create_task(handler())
+        finally:
+            stop_query_stats(token)
+        assert current_query_stats() is None
+        assert stats.statements == 4
+        assert stats.db_time_ms > 0
+        assert stats.repeated(3) == [("SELECT ?", 4)]
+        assert stats.repeated(4) == []
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_transaction_setup_statements_are_not_counted():
+    """Per-transaction setup (SET LOCAL statement_timeout ...) uses no budget and is no N+1 suspect."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        stats, token = start_query_stats(max_statements=3)
+        try:
+            for i in range(3):
+                async with engine.connect() as conn:
+                    await conn.exec_driver_sql("SELECT 'setup'", execution_options=UNCOUNTED)
+                    await conn.execute(text("SELECT :i"), {"i": i})
+        finally:
+            stop_query_stats(token)
+        assert stats.statements == 3
+        assert stats.repeated(1) == [("SELECT ?", 3)]
+    finally:
+        await engine.dispose()
+
+
+def test_log_request_flags_repeated_statements(caplog):
+    """Request log carries SQL totals; repeated shapes are warned about."""
+    stats = QueryStats()
+    for _ in range(12):
+        stats.record("SELECT * FROM evidence WHERE chrono_entry_id = $1", 1.0, 1)
+    with caplog.at_level(logging.INFO):
+        log_request("GET", "/x", 200, 5.0, db=stats)
+    request_record = next(r for r in caplog.records if r.name == "api.requests")
+    assert request_record.db_statements == 12
+    assert request_record.db_rows == 12
+    assert any(r.name == "api.queries" and r.count == 12 for r in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_statement_over_budget_fails_before_running():
+    """The statement that would exceed the budget is refused."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        stats, token = start_query_stats(max_statements=2)
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT 2"))
+                with pytest.raises(QueryBudgetExceeded):
+                    await conn.execute(text("SELECT 3"))
+        finally:
+            stop_query_stats(token)
+        assert stats.statements == 2
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_budget_violation_maps_to_503():
+    """Over-budget requests get a fast 503 instead of a 500."""
+    response = await query_budget_exception_handler(
+        SimpleNamespace(method="GET", url=SimpleNamespace(path="/x")),
+        QueryBudgetExceeded("statement budget of 2 exhausted"),
+    )
+    assert response.status_code == 503
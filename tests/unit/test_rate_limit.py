@@ -0,0 +1,47 @@
+"""Auth admission control tests."""
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.rate_limit import ShardedTokenBucketLimiter, auth_email_limiter
+from tests.unit.helpers import FakeClock
+
+
+def test_bucket_allows_burst_then_limits():
+    """Burst is allowed immediately; the next call gets a retry delay."""
+    clock = FakeClock()
+    limiter = ShardedTokenBucketLimiter(rate=1.0, burst=3, clock=clock)
+    assert [limiter.acquire("ip") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("ip") == pytest.approx(1.0)
+    clock.now += 1.0
+    assert limiter.acquire("ip") == 0.0
+    assert limiter.acquire("other") == 0.0
+    assert limiter.stats()["limited"] == 1
+
+
+def test_bucket_shards_are_bounded():
+    """Idle keys are evicted once a shard is full."""
+    limiter = ShardedTokenBucketLimiter(rate=1.0, burst=1, shards=2, max_keys_per_shard=4)
+    for i in range(100):
+        limiter.acquire(f"user{i}@test.com")
+    assert limiter.stats()["keys"] <= 8
+
+
+def test_zero_rate_disables_limiter():
+    """rate=0 means unlimited."""
+    limiter = ShardedTokenBucketLimiter(rate=0, burst=1)
+    assert all(limiter.acquire("ip") == 0.0 for _ in range(10))
+
+
+@pytest.mark.asyncio
+async def test_login_rate_limited_by_email(client: AsyncClient):
+    """Exceeding the email bucket returns 429 with Retry-After before any DB work."""
+    for _ in range(auth_email_limiter.burst):
+        auth_email_limiter.acquire("victim@test.com")
+
+    r = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "Victim@test.com", "password": "password123"},
+    )
+    assert r.status_code == 429
+    assert int(r.headers["Retry-After"]) >= 1
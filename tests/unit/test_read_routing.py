@@ -0,0 +1,116 @@
+"""Read-only sessions and replica routing tests."""
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import column, insert, table, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db import session as db_session_module
+from app.db.routing import LAST_WRITE_COOKIE, LAST_WRITE_HEADER, ReplicaRouter
+from app.db.session import DbSession, ReadOnlySessionLocal, presented_write_marker
+from app.main import write_marker_middleware
+from tests.unit.helpers import FakeClock
+
+
+def test_reads_use_primary_without_replicas():
+    """No replicas configured: everything reads from the primary."""
+    router = ReplicaRouter(primary="primary", replicas=[], sticky_seconds=5)
+    router.mark_write("u1")
+    assert router.engine_for_read("u1") == "primary"
+    assert router.engine_for_read(None) == "primary"
+
+
+def test_reads_round_robin_over_replicas():
+    """Reads alternate between replicas."""
+    router = ReplicaRouter(primary="primary", replicas=["r1", "r2"], sticky_seconds=5)
+    assert [router.engine_for_read("u1") for _ in range(4)] == ["r1", "r2", "r1", "r2"]
+
+
+def test_writer_reads_own_writes_until_sticky_window_ends():
+    """After a write the user reads from the primary, then from replicas again."""
+    clock = FakeClock()
+    router = ReplicaRouter(primary="primary", replicas=["r1"], sticky_seconds=5, clock=clock)
+    router.mark_write("u1")
+    assert router.engine_for_read("u1") == "primary"
+    assert router.engine_for_read("u2") == "r1"
+    clock.now = 6
+    assert router.engine_for_read("u1") == "r1"
+
+
+def test_recent_write_marker_reads_from_primary_on_any_worker():
+    """A marker from another worker's write pins reads to the primary for the window."""
+    wall = FakeClock()
+    wall.now = 1000.0
+    writer = ReplicaRouter(primary="primary", replicas=["r1"], sticky_seconds=5, wall_clock=wall)
+    reader = ReplicaRouter(primary="primary", replicas=["r1"], sticky_seconds=5, wall_clock=wall)
+    marker = writer.write_marker()
+    assert reader.engine_for_read("u1", marker) == "primary"
+    wall.now = 1006.0
+    assert reader.engine_for_read("u1", marker) == "r1"
+
+
+def test_invalid_or_far_future_marker_is_ignored():
+    """Garbage and markers beyond the window do not pin reads."""
+    wall = FakeClock()
+    wall.now = 1000.0
+    router = ReplicaRouter(primary="primary", replicas=["r1"], sticky_seconds=5, wall_clock=wall)
+    assert router.engine_for_read("u1", "not-a-number") == "r1"
+    assert router.engine_for_read("u1", str(int((wall.now + 3600) * 1000))) == "r1"
+
+
+@pytest.mark.asyncio
+async def test_committed_write_returns_marker(monkeypatch):
+    """A request that commits a write gets the marker back; a read-only one does not."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    router = ReplicaRouter(primary="primary", replicas=["r1"], sticky_seconds=5)
+    monkeypatch.setattr(db_session_module, "replica_router", router)
+    monkeypatch.setattr(
+        db_session_module,
+        "AsyncSessionLocal",
+        async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    test_app = FastAPI()
+    test_app.middleware("http")(write_marker_middleware)
+
+    @test_app.post("/login")
+    async def login(request: Request, session: DbSession):
+        request.state.user_id = "u1"
+        await session.execute(text("SELECT 1"))
+
+    @test_app.post("/write")
+    async def write(request: Request, session: DbSession):
+        request.state.user_id = "u1"
+        await session.execute(text("CREATE TABLE IF NOT EXISTS t (x INTEGER)"))
+        await session.execute(insert(table("t", column("x"))).values(x=1))
+
+    @test_app.get("/read")
+    async def read(request: Request):
+        return {"engine": router.engine_for_read("u2", presented_write_marker(request))}
+
+    try:
+        transport = ASGITransport(app=test_app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/login")
+            assert LAST_WRITE_HEADER not in response.headers
+            assert router.engine_for_read("u1") == "r1"
+            response = await client.post("/write")
+            marker = response.headers[LAST_WRITE_HEADER]
+            assert response.cookies[LAST_WRITE_COOKIE] == marker
+            assert router.engine_for_read("u1") == "primary"
+            # The cookie jar presents the marker on the next request
+            assert (await client.get("/read")).json() == {"engine": "primary"}
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_read_only_session_runs_queries():
+    """Read-only sessions work on non-PostgreSQL engines (no SET issued)."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with ReadOnlySessionLocal(bind=engine) as session:
+            result = await session.execute(text("SELECT 1"))
+            assert result.scalar_one() == 1
+    finally:
+        await engine.dispose()
@@ -0,0 +1,47 @@
+"""Refresh-token rotation tests (in-memory store, no DB)."""
+
+import pytest
+
+from app.core.refresh_store import InMemoryRefreshTokenStore
+from app.core.security import create_access_token, decode_token
+from app.services.token_service import RefreshTokenReused, TokenService
+
+
+def _service() -> TokenService:
+    return TokenService(session=None, store=InMemoryRefreshTokenStore())
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_within_family():
+    """Exchange returns a new refresh token from the same family."""
+    service = _service()
+    pair = service.issue("user-1")
+    rotated = await service.refresh(pair.refresh_token)
+
+    old = decode_token(pair.refresh_token)
+    new = decode_token(rotated.refresh_token)
+    assert new["sub"] == "user-1"
+    assert new["fam"] == old["fam"]
+    assert new["jti"] != old["jti"]
+    assert decode_token(rotated.access_token)["type"] == "access"
+
+
+@pytest.mark.asyncio
+async def test_refresh_reuse_revokes_family():
+    """Reusing a consumed token fails and kills the rotated successor too."""
+    service = _service()
+    pair = service.issue("user-1")
+    rotated = await service.refresh(pair.refresh_token)
+
+    with pytest.raises(RefreshTokenReused):
+        await service.refresh(pair.refresh_token)
+    with pytest.raises(ValueError, match="revoked"):
+        await service.refresh(rotated.refresh_token)
+
+
+@pytest.mark.asyncio
+async def test_refresh_rejects_access_token():
+    """Access tokens cannot be exchanged."""
+    service = _service()
+    with pytest.raises(ValueError):
+        await service.refresh(create_access_token("user-1"))
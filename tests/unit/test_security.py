@@ -1,5 +1,7 @@
 """Security module unit tests."""
 
+from types import SimpleNamespace
+
 import pytest
 from app.core.security import decode_token, get_password_hash, verify_password
 
@@ -17,3 +19,63 @@ def test_decode_invalid_token():
     """Invalid token returns None."""
     assert decode_token("invalid.jwt.token") is None
     assert decode_token("") is None
+
+
+def test_password_needs_rehash_on_cost_change():
+    """Hashes with a cost other than the active one are flagged, in either direction."""
+    from app.core.security import bcrypt_cost, get_bcrypt_rounds, password_needs_rehash
+
+    current = get_bcrypt_rounds()
+    same = f"$2b${current:02d}$" + "a" * 53
+    weaker = f"$2b${current - 1:02d}$" + "a" * 53
+    stronger = f"$2b${current + 1:02d}$" + "a" * 53
+    assert bcrypt_cost(same) == current
+    assert password_needs_rehash(same) is False
+    assert password_needs_rehash(weaker) is True
+    assert password_needs_rehash(stronger) is True
+    assert password_needs_rehash("not-a-bcrypt-hash") is False
+
+
+class _Users:
+    """UserRepository stand-in holding one user (the users table needs PostgreSQL types)."""
+
+    def __init__(self, user):
+        self.user = user
+        self.updated: list[str] = []
+
+    async def get_by_email(self, email):
+        return self.user if email == self.user.email else None
+
+    async def update_password_hash(self, user, hashed_password):
+        user.hashed_password = hashed_password
+        self.updated.append(hashed_password)
+        return user
+
+
+@pytest.mark.asyncio
+async def test_authenticate_rehashes_to_current_cost(monkeypatch):
+    """Login rewrites hashes of any other cost and leaves current-cost hashes alone."""
+    from app.core.security import get_bcrypt_rounds
+    from app.domain.models import User
+    from app.services import user_service
+    from app.services.user_service import UserService
+
+    current = get_bcrypt_rounds()
+
+    async def verify(plain, hashed):
+        return plain == "pw"
+
+    async def rehash(plain):
+        return f"$2b${current:02d}$" + "n" * 53
+
+    monkeypatch.setattr(user_service, "verify_password_async", verify)
+    monkeypatch.setattr(user_service, "hash_password_async", rehash)
+
+    for cost, expect_rehash in ((current + 1, True), (current - 1, True), (current, False)):
+        stored = f"$2b${cost:02d}$" + "o" * 53
+        users = _Users(User(id="u1", email="a@example.com", hashed_password=stored))
+        service = UserService(SimpleNamespace(info={}))
+        service.repo = users
+        user = await service.authenticate("a@example.com", "pw")
+        assert bool(users.updated) is expect_rehash
+        assert user.hashed_password == (await rehash("pw") if expect_rehash else stored)
@@ -0,0 +1,49 @@
+"""List endpoint fast path: row JSON must match the response models."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.api.serialization import json_rows_response, list_adapter
+from app.domain.schemas import (
+    ChronoEntryResponse,
+    ChronoEntryRow,
+    TaskReminderResponse,
+    TaskReminderRow,
+    UserResponse,
+    UserRow,
+)
+
+
+@pytest.mark.parametrize(
+    "row_type,model",
+    [
+        (ChronoEntryRow, ChronoEntryResponse),
+        (TaskReminderRow, TaskReminderResponse),
+        (UserRow, UserResponse),
+    ],
+)
+def test_row_types_match_response_fields(row_type, model):
+    assert list(row_type.__annotations__) == list(model.model_fields)
+
+
+def test_rows_serialize_like_response_models():
+    row = {
+        "id": "aaaaaaaa-1111-4111-8111-111111111111",
+        "user_id": "bbbbbbbb-2222-4222-8222-222222222222",
+        "metric_id": "cccccccc-3333-4333-8333-333333333333",
+        "value": "7",
+        "confidence": 0.5,
+        "is_hypothesis": True,
+        "source_message_id": None,
+        "created_at": datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc),
+    }
+    expected = [json.loads(ChronoEntryResponse(**row).model_dump_json())]
+
+    response = json_rows_response(ChronoEntryRow, [row], {"X-Next-Cursor": "abc"})
+
+    assert json.loads(response.body) == expected
+    assert response.media_type == "application/json"
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert list_adapter(ChronoEntryRow) is list_adapter(ChronoEntryRow)
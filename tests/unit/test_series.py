@@ -0,0 +1,86 @@
+"""Downsampled timeline series tests."""
+
+import math
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.domain.models import ChronoEntry
+from app.domain.series import bucket_window, lttb
+from app.services.analytics_service import AnalyticsService
+from tests.unit.helpers import METRIC_ID, USER_ID
+
+
+def test_bucket_window_keeps_range_inside_points():
+    start, width = bucket_window(datetime(2026, 1, 1), datetime(2026, 1, 2), 24)
+    assert width == 3601
+    last = (math.ceil(datetime(2026, 1, 2).timestamp()) - start) // width
+    assert last < 24
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    xs = list(range(100))
+    ys = [0.0] * 100
+    ys[37] = 10.0
+    ys[71] = -10.0
+    picked = lttb(xs, ys, 10)
+    assert len(picked) == 10
+    assert picked[0] == 0 and picked[-1] == 99
+    assert 37 in picked and 71 in picked
+    assert picked == sorted(picked)
+    assert lttb(xs[:5], ys[:5], 10) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_bucket_series_aggregates_in_sql(entries_session):
+    base = datetime(2026, 1, 1)
+    entries_session.add_all(
+        ChronoEntry(
+            id=str(uuid4()),
+            user_id=USER_ID,
+            metric_id=METRIC_ID,
+            value=str(v),
+            value_num=float(v),
+            created_at=base + timedelta(hours=h),
+        )
+        for h, v in [(0, 1), (1, 3), (12, 5), (13, 9), (23, 7)]
+    )
+    await entries_session.commit()
+
+    result = await AnalyticsService(entries_session).get_series(
+        USER_ID, base, base + timedelta(days=1), points=2
+    )
+
+    assert result.bucket_seconds == 12 * 3600 + 1
+    [series] = result.series
+    assert series.metric_id == METRIC_ID
+    assert [(p.t.hour, p.count, p.min, p.value, p.max) for p in series.points] == [
+        (0, 3, 1.0, 3.0, 5.0),
+        (12, 2, 7.0, 8.0, 9.0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_lttb_series_caps_points(entries_session):
+    base = datetime(2026, 1, 1)
+    entries_session.add_all(
+        ChronoEntry(
+            id=str(uuid4()),
+            user_id=USER_ID,
+            metric_id=METRIC_ID,
+            value="x",
+            value_num=float(i % 7),
+            created_at=base + timedelta(minutes=i),
+        )
+        for i in range(50)
+    )
+    await entries_session.commit()
+
+    result = await AnalyticsService(entries_session).get_series(
+        USER_ID, base, base + timedelta(days=1), points=10, method="lttb"
+    )
+
+    [series] = result.series
+    assert len(series.points) == 10
+    assert series.points[0].t == base and series.points[-1].t == base + timedelta(minutes=49)
@@ -0,0 +1,83 @@
+"""DB session dependency tests."""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.exceptions import integrity_error_handler
+from app.db import session as db_session_module
+from app.db.base import Base
+from app.db.query_stats import UNCOUNTED
+from app.db.session import (
+    ROUTE_CLASS_EXPORT,
+    ROUTE_CLASS_READ,
+    DbSession,
+    _set_statement_timeout,
+    engine,
+    get_db,
+    statement_timeout_ms,
+)
+from app.domain.enums import ScaleType
+from app.domain.models import MetricDefinition
+from tests.unit.helpers import METRIC_ID
+
+
+@pytest.mark.asyncio
+async def test_unused_session_does_not_check_out_connection():
+    """A request that runs no query never touches the pool (no DB needed)."""
+    gen = get_db(SimpleNamespace(state=SimpleNamespace()))
+    session = await gen.__anext__()
+    assert session.in_transaction() is False
+    with pytest.raises(StopAsyncIteration):
+        await gen.__anext__()
+    assert engine.pool.checkedout() == 0
+
+
+def test_statement_timeout_set_per_route_class():
+    """PostgreSQL transactions get SET LOCAL statement_timeout for their route class."""
+    executed: list[tuple[str, dict]] = []
+    connection = SimpleNamespace(
+        dialect=SimpleNamespace(name="postgresql"),
+        exec_driver_sql=lambda sql, execution_options: executed.append((sql, execution_options)),
+    )
+    _set_statement_timeout(SimpleNamespace(info={"route_class": "read"}), None, connection)
+    _set_statement_timeout(SimpleNamespace(info={}), None, connection)
+    # Setup statements stay out of the request's query budget
+    assert executed == [
+        (f"SET LOCAL statement_timeout = {statement_timeout_ms(ROUTE_CLASS_READ)}", UNCOUNTED)
+    ]
+    assert statement_timeout_ms(ROUTE_CLASS_EXPORT) > statement_timeout_ms(ROUTE_CLASS_READ)
+
+
+@pytest.mark.asyncio
+async def test_constraint_error_at_teardown_commit_is_409(monkeypatch, tmp_path):
+    """A duplicate first written by get_db's commit (deferred flush) maps to 409, not 500."""
+    test_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'session.db'}")
+    tables = [Base.metadata.tables["metric_definitions"]]
+    async with test_engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+    factory = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        session.add(MetricDefinition(id=METRIC_ID, name="mood", scale_type=ScaleType.INT.value))
+        await session.commit()
+    monkeypatch.setattr(db_session_module, "AsyncSessionLocal", factory)
+
+    test_app = FastAPI()
+    test_app.add_exception_handler(IntegrityError, integrity_error_handler)
+
+    @test_app.post("/metrics")
+    async def create(session: DbSession):
+        session.add(MetricDefinition(id=METRIC_ID, name="mood", scale_type=ScaleType.INT.value))
+        return {"status": "queued"}
+
+    try:
+        transport = ASGITransport(app=test_app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/metrics")
+        assert response.status_code == 409
+    finally:
+        await test_engine.dispose()
@@ -0,0 +1,112 @@
+"""Keyset timeline pagination tests."""
+
+import base64
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.core.pagination import InvalidCursor, KeysetCursor
+from app.domain.models import ChronoEntry
+from app.services.entry_service import EntryService
+from tests.unit.helpers import METRIC_ID, USER_ID
+
+
+def _raw_cursor(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def test_cursor_roundtrip_and_rejects_garbage():
+    moment = datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc)
+    cursor = KeysetCursor(created_at=moment, id=USER_ID)
+    assert KeysetCursor.decode(cursor.encode()) == cursor
+    # Naive row timestamps are UTC
+    naive = KeysetCursor(created_at=moment.replace(tzinfo=None), id=USER_ID)
+    assert KeysetCursor.decode(naive.encode()) == cursor
+    for bad in (
+        "not-a-cursor",
+        _raw_cursor("2024-01-01T00:00:00+00:00|x"),
+        _raw_cursor(f"2024-01-01T00:00:00|{USER_ID}"),
+    ):
+        with pytest.raises(InvalidCursor):
+            KeysetCursor.decode(bad)
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_cover_timeline_without_gaps(entries_session):
+    """Walking next cursors yields every entry once, newest first, ties broken by id."""
+    base = datetime(2026, 1, 1)
+    entries = [
+        ChronoEntry(
+            id=str(uuid4()),
+            user_id=USER_ID,
+            metric_id=METRIC_ID,
+            value=str(i),
+            # Pairs of entries share a timestamp
+            created_at=base + timedelta(minutes=i // 2),
+        )
+        for i in range(7)
+    ]
+    entries_session.add_all(entries)
+    await entries_session.commit()
+
+    service = EntryService(entries_session)
+    seen: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        page, cursor = await service.get_timeline_page(USER_ID, limit=3, cursor=cursor)
+        seen.extend(e["id"] for e in page)
+        pages += 1
+        if cursor is None:
+            break
+    expected = sorted(entries, key=lambda e: (e.created_at, e.id), reverse=True)
+    assert seen == [e.id for e in expected]
+    assert pages == 3
+
+
+@pytest.mark.asyncio
+async def test_include_evidence_loads_page_in_two_queries(entries_session):
+    """Evidence for the whole page comes from one extra IN query."""
+    from sqlalchemy import event
+
+    from app.domain.models import Evidence
+
+    entries = [
+        ChronoEntry(
+            id=str(uuid4()),
+            user_id=USER_ID,
+            metric_id=METRIC_ID,
+            value=str(i),
+            created_at=datetime(2026, 1, 1) + timedelta(minutes=i),
+        )
+        for i in range(4)
+    ]
+    entries_session.add_all(entries)
+    entries_session.add_all(
+        Evidence(
+            id=str(uuid4()),
+            chrono_entry_id=entries[i].id,
+            chrono_entry_created_at=entries[i].created_at,
+            text_snippet=f"note {i}{n}",
+            created_at=datetime(2026, 1, 2) + timedelta(seconds=n),
+        )
+        for i in (1, 3)
+        for n in range(2)
+    )
+    await entries_session.commit()
+
+    statements: list[str] = []
+    engine = entries_session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        page, _ = await EntryService(entries_session).get_timeline_page(
+            USER_ID, limit=10, include_evidence=True
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 2
+    snippets = {e["value"]: [ev["text_snippet"] for ev in e["evidence"]] for e in page}
+    assert snippets == {"0": [], "1": ["note 10", "note 11"], "2": [], "3": ["note 30", "note 31"]}
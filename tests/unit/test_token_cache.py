@@ -0,0 +1,53 @@
+"""Verified-token cache tests."""
+
+import time
+
+from app.core.security import create_access_token
+from app.core.token_cache import VerifiedTokenCache, decode_token_cached, token_cache
+
+
+def test_cache_hit_after_put():
+    """Stored payloads are served until exp and counted as hits."""
+    cache = VerifiedTokenCache(max_size=10)
+    payload = {"sub": "u1", "exp": time.time() + 60}
+    assert cache.get("tok") is None
+    cache.put("tok", payload)
+    assert cache.get("tok") is payload
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_cache_drops_expired_entries():
+    """Entries past exp are evicted on lookup."""
+    cache = VerifiedTokenCache(max_size=10)
+    cache.put("tok", {"sub": "u1", "exp": time.time() - 1})
+    assert cache.get("tok") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_cache_evicts_least_recently_used():
+    """Cache never grows past max_size."""
+    cache = VerifiedTokenCache(max_size=2)
+    exp = time.time() + 60
+    cache.put("a", {"exp": exp})
+    cache.put("b", {"exp": exp})
+    cache.get("a")
+    cache.put("c", {"exp": exp})
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_decode_token_cached_skips_invalid_tokens():
+    """Valid tokens are cached; invalid ones are never stored."""
+    token_cache.clear()
+    assert decode_token_cached("invalid.jwt.token") is None
+    assert token_cache.stats()["size"] == 0
+
+    token = create_access_token("user-1")
+    first = decode_token_cached(token)
+    second = decode_token_cached(token)
+    assert first is not None and first["sub"] == "user-1"
+    assert second is first
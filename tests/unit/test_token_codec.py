@@ -0,0 +1,48 @@
+"""Token codec tests."""
+
+import time
+
+import pytest
+
+from app.core.token_codec import HS256TokenCodec, JoseTokenCodec
+
+KEY = "test-secret-key-at-least-32-characters"
+
+
+def _claims(exp_offset: int = 60) -> dict:
+    now = int(time.time())
+    return {"sub": "user-1", "exp": now + exp_offset, "iat": now, "type": "access"}
+
+
+@pytest.mark.parametrize(
+    "encoder,decoder",
+    [
+        (HS256TokenCodec(KEY), HS256TokenCodec(KEY)),
+        (HS256TokenCodec(KEY), JoseTokenCodec(KEY, "HS256")),
+        (JoseTokenCodec(KEY, "HS256"), HS256TokenCodec(KEY)),
+    ],
+)
+def test_codecs_are_interchangeable(encoder, decoder):
+    """Tokens from either codec verify with the other."""
+    claims = _claims()
+    assert decoder.decode(encoder.encode(claims)) == claims
+
+
+def test_hs256_rejects_tampering_and_wrong_key():
+    """Modified payloads and foreign keys fail verification."""
+    codec = HS256TokenCodec(KEY)
+    token = codec.encode(_claims())
+    header, payload, signature = token.split(".")
+    forged = HS256TokenCodec(KEY).encode({**_claims(), "sub": "admin"}).split(".")[1]
+    assert codec.decode(f"{header}.{forged}.{signature}") is None
+    assert HS256TokenCodec("another-key-at-least-32-characters!!").decode(token) is None
+    assert codec.decode("invalid.jwt.token") is None
+    assert codec.decode("") is None
+
+
+def test_hs256_rejects_expired_and_other_algorithms():
+    """Expired tokens and tokens signed with another algorithm are invalid."""
+    codec = HS256TokenCodec(KEY)
+    assert codec.decode(codec.encode(_claims(exp_offset=-10))) is None
+    hs512 = JoseTokenCodec(KEY, "HS512").encode(_claims())
+    assert codec.decode(hs512) is None
@@ -0,0 +1,85 @@
+"""Typed entry value tests."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.db.typed_backfill import NEXT_CHUNK_SQL, backfill_typed_values
+from app.domain.enums import ScaleType
+from app.domain.models import MetricDefinition
+from app.domain.schemas import ChronoEntryCreate
+from app.domain.values import TypedValue, typed_value
+from app.services.analytics_service import AnalyticsService
+from app.services.entry_service import EntryService
+from tests.unit.helpers import USER_ID
+
+MOOD_ID = "bbbbbbbb-2222-2222-2222-222222222222"
+SLEPT_WELL_ID = "cccccccc-3333-3333-3333-333333333333"
+
+
+@pytest.mark.parametrize(
+    ("scale_type", "raw", "expected"),
+    [
+        (ScaleType.INT, " 7 ", TypedValue(value_num=7.0)),
+        (ScaleType.FLOAT, "-2.5e1", TypedValue(value_num=-25.0)),
+        (ScaleType.FLOAT, "nan", TypedValue()),
+        (ScaleType.FLOAT, "1e400", TypedValue()),
+        (ScaleType.BOOL, "True", TypedValue(value_bool=True)),
+        (ScaleType.BOOL, "no", TypedValue(value_bool=False)),
+        (ScaleType.BOOL, "maybe", TypedValue()),
+        (ScaleType.CATEGORICAL, " calm ", TypedValue(value_code="calm")),
+    ],
+)
+def test_typed_value(scale_type, raw, expected):
+    assert typed_value(scale_type, raw) == expected
+
+
+@pytest.mark.asyncio
+async def test_submitted_entries_are_aggregated_in_sql(entries_session):
+    """Writes fill the typed columns; the summary aggregates them per metric."""
+    entries_session.add_all(
+        [
+            MetricDefinition(id=MOOD_ID, name="mood", scale_type=ScaleType.INT.value),
+            MetricDefinition(id=SLEPT_WELL_ID, name="slept well", scale_type=ScaleType.BOOL.value),
+        ]
+    )
+    await entries_session.commit()
+
+    service = EntryService(entries_session)
+    await service.submit_batch(
+        USER_ID,
+        [ChronoEntryCreate(metric_id=MOOD_ID, value=v) for v in (4, 6, 8)]
+        + [ChronoEntryCreate(metric_id=SLEPT_WELL_ID, value=v) for v in (True, True, False, True)],
+    )
+    await entries_session.commit()
+
+    summary = await AnalyticsService(entries_session).get_summary(USER_ID, period_days=1)
+    mood = summary.metrics[MOOD_ID]
+    assert (mood["name"], mood["count"], mood["avg"], mood["min"], mood["max"]) == ("mood", 3, 6.0, 4.0, 8.0)
+    assert summary.metrics[SLEPT_WELL_ID]["true_ratio"] == pytest.approx(0.75)
+    # window start is snapped down to the minute
+    assert timedelta(days=1) <= summary.period_end - summary.period_start < timedelta(days=1, minutes=1)
+    assert summary.period_end <= datetime.utcnow()
+
+
+class _BackfillConn:
+    """Two-chunk table; later passes see rows inserted behind the cursor."""
+
+    def __init__(self, updates_per_pass):
+        self.updates = list(updates_per_pass)
+        self.chunk_calls = 0
+
+    def execute(self, statement, params):
+        if str(statement) == NEXT_CHUNK_SQL:
+            self.chunk_calls += 1
+            upper = {None: "b", "b": "d"}.get(params["last"])
+            return type("R", (), {"scalar": lambda _: upper})()
+        return type("R", (), {"rowcount": self.updates.pop(0)})()
+
+
+def test_backfill_repeats_passes_until_one_updates_nothing():
+    conn = _BackfillConn([3, 2, 1, 0, 0, 0])
+    assert backfill_typed_values(conn) == 6
+    assert conn.updates == []
+    # three passes of two chunks, each ending on an empty lookup
+    assert conn.chunk_calls == 9
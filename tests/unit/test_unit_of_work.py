@@ -0,0 +1,83 @@
+"""Deferred-flush unit of work tests."""
+
+import pytest
+from sqlalchemy import Integer, String, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.db.unit_of_work import UnitOfWork, apply_python_defaults
+from app.domain.models import ChronoEntry
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Row(_Base):
+    __tablename__ = "uow_rows"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    label: Mapped[str] = mapped_column(String, default="unset")
+
+
+async def _session_with_counter():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+    inserts: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT"):
+            inserts.append(statement)
+
+    return engine, AsyncSession(engine, autoflush=False), inserts
+
+
+def test_python_defaults_applied_before_flush():
+    """Ids and timestamps are available as soon as an object is registered."""
+    entry = apply_python_defaults(ChronoEntry(user_id="u", metric_id="m", value="3"))
+    assert entry.id is not None
+    assert entry.created_at is not None
+
+
+@pytest.mark.asyncio
+async def test_deferred_writes_are_batched_until_sync():
+    """Deferred mode issues nothing on add and one INSERT per table at sync."""
+    engine, session, inserts = await _session_with_counter()
+    try:
+        uow = UnitOfWork(session, deferred=True)
+        await uow.add(*[_Row(id=i) for i in range(1, 6)])
+        assert inserts == []
+        assert session.autoflush is True
+        await uow.sync()
+        assert len(inserts) == 1
+        assert (await session.scalar(select(func.count()).select_from(_Row))) == 5
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_immediate_mode_flushes_each_add():
+    """Immediate mode keeps the flush-per-write behaviour."""
+    engine, session, inserts = await _session_with_counter()
+    try:
+        uow = UnitOfWork(session, deferred=False)
+        await uow.add(_Row(id=1))
+        await uow.add(_Row(id=2))
+        assert len(inserts) == 2
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_is_shared_per_session():
+    """Repositories on one session share one unit of work."""
+    engine, session, _ = await _session_with_counter()
+    try:
+        assert UnitOfWork.of(session) is UnitOfWork.of(session)
+    finally:
+        await session.close()
+        await engine.dispose()
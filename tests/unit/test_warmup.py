@@ -0,0 +1,139 @@
+"""Start-up warm-up and readiness tests."""
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+from app.core.hashing import shutdown_password_hasher
+from app.main import app
+from app.warmup import open_connections, readiness, retry_until_ready, stop_warm_up, warm_up
+
+
+@pytest.fixture
+def fresh_readiness():
+    ready, steps, failed = readiness.ready, dict(readiness.steps), list(readiness.failed)
+    readiness.ready, readiness.steps, readiness.failed = False, {}, []
+    yield readiness
+    readiness.ready, readiness.steps, readiness.failed = ready, steps, failed
+
+
+class _FlakyEngine:
+    """Engine stand-in whose third connect fails after the others are open."""
+
+    pool = None
+
+    def __init__(self):
+        self.calls = 0
+        self.open = 0
+
+    def connect(self):
+        engine = self
+
+        class _Connection:
+            async def __aenter__(self):
+                engine.calls += 1
+                if engine.calls == 3:
+                    await asyncio.sleep(0.01)
+                    raise OSError("connection refused")
+                engine.open += 1
+                return self
+
+            async def __aexit__(self, *exc):
+                engine.open -= 1
+
+            async def execute(self, statement):
+                return None
+
+        return _Connection()
+
+
+@pytest.mark.asyncio
+async def test_open_connections_fills_pool(tmp_path):
+    """Warm connections stay in the pool for the first requests."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}", poolclass=AsyncAdaptedQueuePool, pool_size=3
+    )
+    try:
+        assert await open_connections(engine, 10) == 3
+        assert engine.pool.checkedin() == 3
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_open_connections_releases_all_when_one_fails():
+    """A failed connect aborts the barrier so no connection stays checked out."""
+    engine = _FlakyEngine()
+    with pytest.raises(ExceptionGroup):
+        await asyncio.wait_for(open_connections(engine, 4), timeout=5)
+    assert engine.open == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_step_keeps_ready_503(client: AsyncClient, tmp_path, fresh_readiness):
+    """A failed warm-up step leaves /ready at 503 and names the step."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}")
+    try:
+        await warm_up(app, db_engine=engine)
+    finally:
+        await stop_warm_up()
+        await engine.dispose()
+        shutdown_password_hasher()
+
+    response = await client.get("/ready")
+    assert response.status_code == 503
+    # No schema in the scratch database; purges run in the background and never count
+    failed = response.json()["failed"]
+    assert "compiled_statements" in failed
+    assert "idempotency_keys_purged" not in failed
+
+
+@pytest.mark.asyncio
+async def test_failed_steps_are_retried_until_ready(fresh_readiness):
+    """A step that fails at boot (e.g. DB briefly down) is retried and readiness follows."""
+    attempts = []
+
+    def flaky() -> int:
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("database unavailable")
+        return 1
+
+    steps = {"ok": lambda: 1, "flaky": flaky}
+    readiness.steps = {"ok": {"result": 1}, "flaky": {"error": "database unavailable"}}
+    await asyncio.wait_for(retry_until_ready(steps, initial_delay=0.001), timeout=5)
+
+    assert readiness.ready is True
+    assert readiness.failed == []
+    assert len(attempts) == 3
+    assert readiness.steps["flaky"]["result"] == 1
+
+
+@pytest.mark.asyncio
+async def test_ready_only_after_warm_up(
+    client: AsyncClient, tmp_path, fresh_readiness, monkeypatch
+):
+    """/ready is 503 until warm-up ran; with fail-open, failed steps are only reported."""
+    monkeypatch.setattr(settings, "WARMUP_FAIL_OPEN", True)
+    assert (await client.get("/ready")).status_code == 503
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}")
+    try:
+        await warm_up(app, db_engine=engine)
+    finally:
+        await stop_warm_up()
+        await engine.dispose()
+        shutdown_password_hasher()
+
+    response = await client.get("/ready")
+    assert response.status_code == 200
+    steps = response.json()["steps"]
+    assert "error" not in steps["db_connections"]
+    assert steps["openapi_paths"]["result"] > 0
+    assert steps["llm_clients"]["result"] == 4
+    # No schema in the scratch database: recorded, readiness unaffected (fail-open)
+    assert "error" in steps["compiled_statements"]